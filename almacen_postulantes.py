@@ -0,0 +1,140 @@
+import re
+from datetime import datetime
+
+from esquema import buscar_columna
+from instrumentacion import contar
+from manifiesto import calcular_hash
+
+# Postulantes indexados por un ID estable derivado del código universitario. Si una
+# persona reenvía el formulario, gana el envío con la "Hora de finalización" más
+# reciente (a igual hora, el que aparece después en el CSV). El ID es también el
+# nombre de sus archivos de salida, así que dos postulantes con el mismo nombre
+# ya no se pisan y un reenvío actualiza el mismo perfil en su lugar.
+
+COLUMNA_CODIGO = 'Código Universitario:\n'
+COLUMNA_FIN = 'Hora de finalización'
+COLUMNA_NOMBRES = 'Nombres:\n'
+COLUMNA_APELLIDOS = 'Apellidos:'
+COLUMNA_CORREO = 'Correo Electrónico:\n'
+# Formatos de fecha de la exportación del formulario (día primero)
+FORMATOS_FECHA = ['%d/%m/%Y %H:%M:%S', '%d/%m/%Y %H:%M', '%Y-%m-%d %H:%M:%S', '%Y-%m-%dT%H:%M:%S']
+PREFIJO_SIN_CODIGO = 'sin-codigo-'
+
+def normalizar_codigo(codigo):
+    """Deja solo letras y dígitos del código universitario, en mayúsculas ('' si no hay código)"""
+    if codigo is None or codigo != codigo:  # None o NaN
+        return ''
+    return re.sub(r'[^0-9A-Za-z]', '', str(codigo)).upper()
+
+def momento_envio(valor):
+    """Convierte la hora de finalización a datetime (None si falta o no se reconoce el formato)"""
+    if not valor or valor != valor:
+        return None
+    for formato in FORMATOS_FECHA:
+        try:
+            return datetime.strptime(str(valor).strip(), formato)
+        except ValueError:
+            continue
+    return None
+
+class AlmacenPostulantes:
+    """Último envío de cada postulante, indexado por su ID estable
+
+    Agregar un envío es una búsqueda en un dict: si el ID ya existe, se conserva
+    el envío más reciente. Con ``con_filas=False`` solo se recuerda qué envío
+    gana (su posición), sin guardar las filas, para recorrer el CSV en dos pasadas
+    con memoria acotada (ver iterar_vigentes).
+    """
+
+    def __init__(self, con_filas=True):
+        self.con_filas = con_filas
+        self.registros = {}  # ID → (momento, posición, nombre_persona, fila)
+        self.reenvios = 0
+        self._posicion = 0
+        self._columnas = None
+
+    def _resolver_columnas(self, columnas):
+        columnas = list(columnas)
+        self._columnas = {clave: buscar_columna(columnas, encabezado) for clave, encabezado in [
+            ('codigo', COLUMNA_CODIGO), ('fin', COLUMNA_FIN), ('nombres', COLUMNA_NOMBRES),
+            ('apellidos', COLUMNA_APELLIDOS), ('correo', COLUMNA_CORREO)]}
+
+    def _valor(self, fila, clave):
+        columna = self._columnas[clave]
+        return fila.get(columna) if columna else None
+
+    def id_de(self, fila):
+        """ID estable de un postulante: su código normalizado o, sin código, un hash de sus datos"""
+        if self._columnas is None:
+            self._resolver_columnas(fila.keys())
+        codigo = normalizar_codigo(self._valor(fila, 'codigo'))
+        if codigo:
+            return codigo
+        datos = [str(self._valor(fila, clave) or '').strip().casefold() for clave in ('nombres', 'apellidos', 'correo')]
+        return PREFIJO_SIN_CODIGO + calcular_hash(*datos)[:12]
+
+    def agregar(self, nombre_persona, fila):
+        """Agrega un envío y devuelve el ID del postulante; si es un reenvío gana el más reciente"""
+        id_postulante = self.id_de(fila)
+        posicion = self._posicion
+        self._posicion += 1
+        momento = momento_envio(self._valor(fila, 'fin')) or datetime.min
+
+        anterior = self.registros.get(id_postulante)
+        if anterior is not None:
+            self.reenvios += 1
+            contar('reenvios')
+            if (momento, posicion) < (anterior[0], anterior[1]):
+                return id_postulante
+        self.registros[id_postulante] = (momento, posicion, nombre_persona, fila if self.con_filas else None)
+        return id_postulante
+
+    def agregar_todos(self, postulantes):
+        """Agrega cada (nombre_persona, fila) de ``postulantes`` y devuelve el almacén"""
+        for nombre_persona, fila in postulantes:
+            self.agregar(nombre_persona, fila)
+        return self
+
+    def __len__(self):
+        return len(self.registros)
+
+    def __contains__(self, id_postulante):
+        return id_postulante in self.registros
+
+    def obtener(self, id_postulante):
+        """Devuelve (nombre_persona, fila) del último envío de un postulante"""
+        _, _, nombre_persona, fila = self.registros[id_postulante]
+        return nombre_persona, fila
+
+    def posiciones_vigentes(self):
+        """Posición de cada envío ganador (en el orden en que se agregaron) → ID"""
+        return {registro[1]: id_postulante for id_postulante, registro in self.registros.items()}
+
+    def postulantes(self):
+        """Produce (id, nombre_persona, fila) de cada postulante, ordenados por ID"""
+        for id_postulante in sorted(self.registros):
+            nombre_persona, fila = self.obtener(id_postulante)
+            yield id_postulante, nombre_persona, fila
+
+    def postulantes_en_orden(self):
+        """Produce (id, nombre_persona, fila) de cada postulante en el orden en que se agregaron sus envíos (el del CSV)"""
+        for _, id_postulante in sorted(self.posiciones_vigentes().items()):
+            nombre_persona, fila = self.obtener(id_postulante)
+            yield id_postulante, nombre_persona, fila
+
+def iterar_vigentes(abrir_postulantes):
+    """Recorre los postulantes en dos pasadas y produce (id, nombre_persona, fila) de cada último envío
+
+    ``abrir_postulantes(contar_filas=True)`` es una función que devuelve un
+    iterable nuevo de (nombre_persona, fila) en cada llamada. La primera pasada
+    solo decide qué envío gana para cada ID; la segunda produce esos envíos en el
+    orden del CSV y se abre con ``contar_filas=False``, para que las filas leídas
+    y filtradas se cuenten una sola vez. La memoria depende del número de
+    postulantes, no del tamaño de sus filas.
+    """
+    almacen = AlmacenPostulantes(con_filas=False).agregar_todos(abrir_postulantes())
+    vigentes = almacen.posiciones_vigentes()
+    for posicion, (nombre_persona, fila) in enumerate(abrir_postulantes(contar_filas=False)):
+        id_postulante = vigentes.get(posicion)
+        if id_postulante is not None:
+            yield id_postulante, nombre_persona, fila
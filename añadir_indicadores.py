@@ -1,147 +1,170 @@
-import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 
-def añadir_indicadores_disponibilidad():
-    """Añade círculos de colores según la disponibilidad de tiempo de cada candidato"""
-    
-    # Clasificación de candidatos según su respuesta sobre compromiso
-    candidatos_con_dudas = {
-        'Edwin_Arles': 'Creo que sí, pero tendría que organizarme bien',
-        'Dante': 'Creo que sí, pero tendría que organizarme bien', 
-        'José_Emiliano': 'Creo que sí, pero tendría que organizarme bien',
-        'Joaquin_Marcelo': 'Creo que sí, pero tendría que organizarme bien',
-        'Jarem_Alexssander': 'Creo que sí, pero tendría que organizarme bien',
-        'Luis_Aldair': 'Me preocupa un poco, pero estoy dispuesto/a a intentarlo'
-    }
-    
-    # Indicadores visuales
-    circulo_verde = "🟢"  # Sin problemas de tiempo
-    circulo_amarillo = "🟡"  # Con dudas sobre tiempo
-    
-    def procesar_archivo_md(ruta_archivo, nombre_archivo):
-        """Procesa un archivo Markdown añadiendo el indicador"""
-        try:
-            with open(ruta_archivo, 'r', encoding='utf-8') as f:
-                contenido = f.read()
-            
-            # Determinar el indicador
-            indicador = circulo_amarillo if nombre_archivo in candidatos_con_dudas else circulo_verde
-            
-            # Reemplazar el título principal
-            patron_titulo = r'^# 👤 Perfil de (.+)$'
-            nuevo_titulo = f'# {indicador} 👤 Perfil de \\1'
-            contenido_modificado = re.sub(patron_titulo, nuevo_titulo, contenido, flags=re.MULTILINE)
-            
-            # Escribir archivo modificado
-            with open(ruta_archivo, 'w', encoding='utf-8') as f:
-                f.write(contenido_modificado)
-            
-            return True
-        except Exception as e:
-            print(f"❌ Error procesando MD {nombre_archivo}: {e}")
-            return False
-    
-    def procesar_archivo_html(ruta_archivo, nombre_archivo):
-        """Procesa un archivo HTML añadiendo el indicador"""
-        try:
-            with open(ruta_archivo, 'r', encoding='utf-8') as f:
-                contenido = f.read()
-            
-            # Determinar el indicador
-            indicador = circulo_amarillo if nombre_archivo in candidatos_con_dudas else circulo_verde
-            
-            # Reemplazar el título principal en HTML
-            patron_titulo = r'<h1>👤 Perfil de (.+?)</h1>'
-            nuevo_titulo = f'<h1>{indicador} 👤 Perfil de \\1</h1>'
-            contenido_modificado = re.sub(patron_titulo, nuevo_titulo, contenido)
-            
-            # También actualizar el título de la página
-            patron_title = r'<title>Perfil - (.+?)</title>'
-            nuevo_title = f'<title>{indicador} Perfil - \\1</title>'
-            contenido_modificado = re.sub(patron_title, nuevo_title, contenido_modificado)
-            
-            # Escribir archivo modificado
-            with open(ruta_archivo, 'w', encoding='utf-8') as f:
-                f.write(contenido_modificado)
-            
-            return True
-        except Exception as e:
-            print(f"❌ Error procesando HTML {nombre_archivo}: {e}")
-            return False
-    
-    # Procesar archivos MD principales
-    carpeta_md = 'perfiles_md'
-    archivos_md_procesados = 0
-    
-    print("📝 Procesando archivos Markdown...")
-    for archivo in os.listdir(carpeta_md):
-        if archivo.endswith('.md'):
-            nombre_sin_ext = archivo.replace('.md', '')
-            ruta_archivo = os.path.join(carpeta_md, archivo)
-            
-            if procesar_archivo_md(ruta_archivo, nombre_sin_ext):
-                indicador = candidatos_con_dudas.get(nombre_sin_ext, 'sin_dudas')
-                estado = "🟡 CON DUDAS" if nombre_sin_ext in candidatos_con_dudas else "🟢 SIN PROBLEMAS"
-                print(f"  ✅ {archivo} - {estado}")
-                archivos_md_procesados += 1
-    
-    # Procesar archivos HTML principales
-    carpeta_html = 'perfiles_html'
-    archivos_html_procesados = 0
-    
-    print("\n🌐 Procesando archivos HTML...")
-    for archivo in os.listdir(carpeta_html):
-        if archivo.endswith('.html') and archivo != 'index.html':
-            nombre_sin_ext = archivo.replace('.html', '')
-            ruta_archivo = os.path.join(carpeta_html, archivo)
-            
-            if procesar_archivo_html(ruta_archivo, nombre_sin_ext):
-                estado = "🟡 CON DUDAS" if nombre_sin_ext in candidatos_con_dudas else "🟢 SIN PROBLEMAS"
-                print(f"  ✅ {archivo} - {estado}")
-                archivos_html_procesados += 1
-    
-    # Procesar archivos en carpetas por área
-    print("\n📁 Procesando archivos por área...")
-    
-    # MD por área
-    carpeta_area_md = 'perfiles_por_area_md'
-    for area in os.listdir(carpeta_area_md):
-        carpeta_area_completa = os.path.join(carpeta_area_md, area)
-        if os.path.isdir(carpeta_area_completa):
-            for archivo in os.listdir(carpeta_area_completa):
-                if archivo.endswith('.md'):
-                    nombre_sin_ext = archivo.replace('.md', '')
-                    ruta_archivo = os.path.join(carpeta_area_completa, archivo)
-                    
-                    if procesar_archivo_md(ruta_archivo, nombre_sin_ext):
-                        estado = "🟡 CON DUDAS" if nombre_sin_ext in candidatos_con_dudas else "🟢 SIN PROBLEMAS"
-                        print(f"  ✅ {area}/{archivo} - {estado}")
-                        archivos_md_procesados += 1
-    
-    # HTML por área
-    carpeta_area_html = 'perfiles_por_area_html'
-    for area in os.listdir(carpeta_area_html):
-        carpeta_area_completa = os.path.join(carpeta_area_html, area)
-        if os.path.isdir(carpeta_area_completa):
-            for archivo in os.listdir(carpeta_area_completa):
-                if archivo.endswith('.html') and archivo != 'index.html':
-                    nombre_sin_ext = archivo.replace('.html', '')
-                    ruta_archivo = os.path.join(carpeta_area_completa, archivo)
-                    
-                    if procesar_archivo_html(ruta_archivo, nombre_sin_ext):
-                        estado = "🟡 CON DUDAS" if nombre_sin_ext in candidatos_con_dudas else "🟢 SIN PROBLEMAS"
-                        print(f"  ✅ {area}/{archivo} - {estado}")
-                        archivos_html_procesados += 1
-    
-    print(f"\n🎉 ¡Proceso completado!")
-    print(f"📝 Archivos MD procesados: {archivos_md_procesados}")
-    print(f"🌐 Archivos HTML procesados: {archivos_html_procesados}")
-    print(f"\n📊 Leyenda de indicadores:")
-    print(f"🟢 = Sin problemas de tiempo (respuesta positiva)")
-    print(f"🟡 = Con dudas sobre tiempo disponible")
-    print(f"\n📋 Candidatos con dudas identificados:")
-    for nombre, respuesta in candidatos_con_dudas.items():
-        print(f"  🟡 {nombre.replace('_', ' ')}: '{respuesta}'")
+from esquema import compilar_esquema, normalizar_encabezado
+from escritor import HILOS_ESCRITURA, escribir_archivo, esperar_escrituras
+from instrumentacion import etapa, guardar_informe, progreso, registrar_error
+from rutas_postulantes import cargar_rutas, rutas_de
+
+# Indicadores visuales
+CIRCULO_VERDE = "🟢"  # Sin problemas de tiempo
+CIRCULO_AMARILLO = "🟡"  # Con dudas sobre tiempo
+CIRCULO_ROJO = "🔴"  # No podría asumir el compromiso
+CIRCULO_BLANCO = "⚪"  # Sin respuesta reconocida
+
+# Pregunta del formulario sobre el compromiso de puntos bimestral
+COLUMNA_COMPROMISO = 'Nuestro reglamento exige a los miembros un compromiso activo, medido por un sistema de puntos mínimo bimestral. ¿Crees que podrás gestionar este compromiso adicional a tu carga académica?\n\n'
+
+# Respuesta sobre el compromiso → indicador. Basta con el comienzo de la respuesta;
+# se compara sin distinguir espacios ni mayúsculas.
+NIVELES_DISPONIBILIDAD = {
+    'Sí, definitivamente': CIRCULO_VERDE,
+    'Creo que sí, pero tendría que organizarme bien': CIRCULO_AMARILLO,
+    'Me preocupa un poco, pero estoy dispuesto/a a intentarlo': CIRCULO_AMARILLO,
+    'No, probablemente no podría': CIRCULO_ROJO,
+}
+INDICADOR_SIN_RESPUESTA = CIRCULO_BLANCO
+
+LEYENDA = {
+    CIRCULO_VERDE: "Sin problemas de tiempo (respuesta positiva)",
+    CIRCULO_AMARILLO: "Con dudas sobre tiempo disponible",
+    CIRCULO_ROJO: "No podría asumir el compromiso por ahora",
+    CIRCULO_BLANCO: "Sin respuesta sobre el compromiso",
+}
+
+def indicador_de_respuesta(respuesta, niveles=NIVELES_DISPONIBILIDAD):
+    """Devuelve el indicador que corresponde a una respuesta sobre el compromiso"""
+    if not respuesta:
+        return INDICADOR_SIN_RESPUESTA
+
+    respuesta = normalizar_encabezado(respuesta).casefold()
+    for comienzo, indicador in niveles.items():
+        if respuesta.startswith(normalizar_encabezado(comienzo).casefold()):
+            return indicador
+    return INDICADOR_SIN_RESPUESTA
+
+def obtener_indicador(persona_data, esquema=None, niveles=NIVELES_DISPONIBILIDAD):
+    """Devuelve el círculo de disponibilidad de un candidato a partir de su fila del CSV"""
+    if esquema is None:
+        esquema = compilar_esquema(persona_data.keys())
+    columna = esquema.columna_de(COLUMNA_COMPROMISO)
+    return indicador_de_respuesta(persona_data.get(columna) if columna else None, niveles)
+
+# Un título puede traer ya un indicador (salidas antiguas): se reemplaza en vez de acumularse
+_PATRON_INDICADOR = '(?:(?:' + '|'.join(re.escape(indicador) for indicador in LEYENDA) + ') )?'
+
+def aplicar_indicador_md(contenido, indicador):
+    """Pone el indicador en el título principal de un perfil Markdown (idempotente)"""
+    patron_titulo = rf'^# {_PATRON_INDICADOR}👤 Perfil de (.+)$'
+    nuevo_titulo = f'# {indicador} 👤 Perfil de \\1'
+    return re.sub(patron_titulo, nuevo_titulo, contenido, flags=re.MULTILINE)
+
+def aplicar_indicador_html(contenido, indicador):
+    """Pone el indicador en el título principal y en el <title> de un perfil HTML (idempotente)"""
+    patron_titulo = rf'<h1>{_PATRON_INDICADOR}👤 Perfil de (.+?)</h1>'
+    nuevo_titulo = f'<h1>{indicador} 👤 Perfil de \\1</h1>'
+    contenido_modificado = re.sub(patron_titulo, nuevo_titulo, contenido)
+
+    # También actualizar el título de la página
+    patron_title = rf'<title>{_PATRON_INDICADOR}Perfil - (.+?)</title>'
+    nuevo_title = f'<title>{indicador} Perfil - \\1</title>'
+    return re.sub(patron_title, nuevo_title, contenido_modificado)
+
+def leer_indicador_md(contenido):
+    """Devuelve el indicador del título de un perfil Markdown ('' si no tiene)"""
+    coincidencia = re.search(rf'^# ({_PATRON_INDICADOR})👤 Perfil de ', contenido, flags=re.MULTILINE)
+    return coincidencia.group(1).strip() if coincidencia else ''
+
+def añadir_indicadores_disponibilidad(usar_cache=True):
+    """Muestra la disponibilidad de cada candidato y corrige perfiles generados sin indicador
+
+    organizador.py, convertir_html.py y pipeline.py ya escriben el indicador al
+    renderizar cada perfil, así que con salidas actuales no se modifica ningún
+    archivo. Solo se reescriben los perfiles antiguos cuyo indicador falte o no
+    coincida con el CSV; ejecutarlo varias veces da el mismo resultado. Devuelve
+    cuántos archivos se corrigieron (None si no se pudo leer el CSV).
+    """
+    from organizador import ARCHIVO_CSV, almacenar_postulantes, cargar_postulantes
+
+    with etapa('indicadores'):
+        df_limpio = cargar_postulantes(ARCHIVO_CSV, usar_cache)
+        if df_limpio is None:
+            return None
+
+        esquema = compilar_esquema(df_limpio.columns)
+        columna = esquema.columna_de(COLUMNA_COMPROMISO)
+        indicadores = {}
+        respuestas = {}
+        nombres = {}
+        for nombre_archivo, nombre_persona, row in almacenar_postulantes([df_limpio]).postulantes():
+            indicadores[nombre_archivo] = obtener_indicador(row, esquema)
+            respuestas[nombre_archivo] = row.get(columna) if columna else None
+            nombres[nombre_archivo] = nombre_persona
+
+        def procesar_archivo(tarea):
+            """Aplica el indicador a un archivo y lo reescribe solo si cambió"""
+            ruta_archivo, nombre_archivo, aplicar = tarea
+            try:
+                if nombre_archivo not in indicadores:
+                    return False
+
+                with open(ruta_archivo, 'r', encoding='utf-8') as f:
+                    contenido = f.read()
+
+                contenido_modificado = aplicar(contenido, indicadores[nombre_archivo])
+                if contenido_modificado == contenido:
+                    return False
+
+                escribir_archivo(ruta_archivo, contenido_modificado)
+                return True
+            except Exception as e:
+                registrar_error(f"{ruta_archivo}: {e}")
+                print(f"❌ Error procesando {ruta_archivo}: {e}")
+                return False
+
+        # Cada salida de cada postulante, según el manifiesto de rutas (sin recorrer carpetas).
+        # Si las carpetas por área enlazan a los perfiles canónicos, solo se corrigen estos
+        rutas = cargar_rutas()
+        modo_areas = rutas.get('modo_areas')
+        salidas = [('md', aplicar_indicador_md), ('html', aplicar_indicador_html)]
+        if modo_areas not in ('enlace_duro', 'enlace_simbolico'):
+            salidas += [('area_md', aplicar_indicador_md), ('area_html', aplicar_indicador_html)]
+        if not rutas['postulantes']:
+            print("⚠️ No hay manifiesto de rutas: genera antes los perfiles (organizador.py o pipeline.py).")
+        tareas = [(ruta_archivo, nombre_archivo, aplicar) for clave, aplicar in salidas
+                  for nombre_archivo, ruta_archivo in sorted(rutas_de(rutas, clave).items())]
+
+        # Las lecturas se solapan en hilos, como las escrituras (ver escritor.py)
+        print("🔎 Revisando indicadores de los perfiles generados...")
+        with ThreadPoolExecutor(max_workers=max(HILOS_ESCRITURA, 1)) as pool:
+            resultados = list(pool.map(procesar_archivo, tareas))
+        esperar_escrituras()
+
+        corregidos = 0
+        for (ruta_archivo, nombre_archivo, _), corregido in zip(tareas, resultados):
+            if not corregido:
+                continue
+            progreso(f"  ✅ Corregido: {ruta_archivo}")
+            corregidos += 1
+            # El archivo corregido es nuevo: el enlace duro de su carpeta de área se vuelve a crear
+            clave_area = 'area_md' if ruta_archivo.endswith('.md') else 'area_html'
+            ruta_area = rutas['postulantes'][nombre_archivo].get(clave_area)
+            if modo_areas == 'enlace_duro' and ruta_area:
+                from organizar_por_areas import colocar_archivo
+                colocar_archivo(ruta_archivo, ruta_area, modo_areas)
+
+        print(f"\n🎉 ¡Proceso completado!")
+        print(f"📝 Archivos corregidos: {corregidos} (el resto ya tenía su indicador)")
+        print(f"\n📊 Leyenda de indicadores:")
+        for indicador, descripcion in LEYENDA.items():
+            print(f"{indicador} = {descripcion}")
+        print(f"\n📋 Candidatos con dudas identificados:")
+        for nombre_archivo, indicador in sorted(indicadores.items(), key=lambda x: (nombres[x[0]], x[0])):
+            if indicador != CIRCULO_VERDE:
+                print(f"  {indicador} {nombres[nombre_archivo]}: '{respuestas[nombre_archivo]}'")
+
+        return corregidos
 
 if __name__ == "__main__":
-    añadir_indicadores_disponibilidad()
\ No newline at end of file
+    añadir_indicadores_disponibilidad()
+    guardar_informe()
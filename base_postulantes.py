@@ -0,0 +1,240 @@
+import json
+import os
+import pathlib
+import re
+import sqlite3
+import sys
+
+from añadir_indicadores import LEYENDA, obtener_indicador
+from esquema import compilar_esquema
+from indice_busqueda import crear_documento, secciones_de_registro, tokenizar
+from instrumentacion import etapa, guardar_informe, registrar_error
+from manifiesto import calcular_hash
+from organizador import almacenar_postulantes
+from organizar_por_areas import COLUMNA_AREA, limpiar_nombre_area
+
+# Base SQLite opcional para consultar a los postulantes sin recorrer los perfiles:
+# cada exportación se guarda como una cohorte (por defecto, el nombre del CSV) con
+# el último envío de cada postulante, su área principal, su indicador de
+# disponibilidad y sus respuestas. Las respuestas de texto libre tienen un índice
+# FTS5 que se mantiene con triggers. Volver a cargar una cohorte solo reescribe a
+# los postulantes cuyo hash cambió (upsert por cohorte e ID) y borra a los que ya
+# no están en la exportación.
+
+ARCHIVO_BASE = os.environ.get('PAM_BASE', 'postulantes.sqlite3')
+VERSION_BASE = 1  # Subir al cambiar las tablas o lo que se guarda de cada postulante
+LIMITE_RESULTADOS = 20
+
+_ESQUEMA_SQL = """
+CREATE TABLE IF NOT EXISTS postulantes (
+    id INTEGER PRIMARY KEY,
+    cohorte TEXT NOT NULL,
+    id_postulante TEXT NOT NULL,
+    nombre TEXT NOT NULL,
+    codigo TEXT NOT NULL,
+    area TEXT NOT NULL,
+    areas TEXT NOT NULL,
+    indicador TEXT NOT NULL,
+    respuestas TEXT NOT NULL,
+    texto TEXT NOT NULL,
+    hash TEXT NOT NULL,
+    UNIQUE (cohorte, id_postulante)
+);
+CREATE INDEX IF NOT EXISTS postulantes_por_area ON postulantes (area, indicador);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS busqueda USING fts5(
+    nombre, areas, texto,
+    content='postulantes', content_rowid='id', tokenize='unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER IF NOT EXISTS postulantes_insertados AFTER INSERT ON postulantes BEGIN
+    INSERT INTO busqueda (rowid, nombre, areas, texto) VALUES (new.id, new.nombre, new.areas, new.texto);
+END;
+CREATE TRIGGER IF NOT EXISTS postulantes_borrados AFTER DELETE ON postulantes BEGIN
+    INSERT INTO busqueda (busqueda, rowid, nombre, areas, texto) VALUES ('delete', old.id, old.nombre, old.areas, old.texto);
+END;
+CREATE TRIGGER IF NOT EXISTS postulantes_actualizados AFTER UPDATE ON postulantes BEGIN
+    INSERT INTO busqueda (busqueda, rowid, nombre, areas, texto) VALUES ('delete', old.id, old.nombre, old.areas, old.texto);
+    INSERT INTO busqueda (rowid, nombre, areas, texto) VALUES (new.id, new.nombre, new.areas, new.texto);
+END;
+"""
+
+_UPSERT_SQL = """
+INSERT INTO postulantes (cohorte, id_postulante, nombre, codigo, area, areas, indicador, respuestas, texto, hash)
+VALUES (:cohorte, :id_postulante, :nombre, :codigo, :area, :areas, :indicador, :respuestas, :texto, :hash)
+ON CONFLICT (cohorte, id_postulante) DO UPDATE SET
+    nombre = excluded.nombre, codigo = excluded.codigo, area = excluded.area, areas = excluded.areas,
+    indicador = excluded.indicador, respuestas = excluded.respuestas, texto = excluded.texto, hash = excluded.hash
+"""
+
+def abrir_base(archivo_base=ARCHIVO_BASE):
+    """Abre (o crea) la base de postulantes; la vacía si es de otra versión. Devuelve None si SQLite no tiene FTS5"""
+    conexion = sqlite3.connect(archivo_base)
+    conexion.row_factory = sqlite3.Row
+    try:
+        version = conexion.execute('PRAGMA user_version').fetchone()[0]
+        if version not in (0, VERSION_BASE):
+            print(f"⚠️ La base {archivo_base} es de otra versión ({version}); se vuelve a crear")
+            conexion.executescript('DROP TABLE IF EXISTS busqueda; DROP TABLE IF EXISTS postulantes;')
+        conexion.executescript(_ESQUEMA_SQL)
+        conexion.execute(f'PRAGMA user_version = {VERSION_BASE}')
+    except sqlite3.OperationalError as e:
+        conexion.close()
+        registrar_error(f"{archivo_base}: {e}")
+        print(f"❌ Error: no se pudo preparar la base {archivo_base} (¿SQLite sin FTS5?): {e}")
+        return None
+    return conexion
+
+def registro_de_postulante(cohorte, id_postulante, nombre_persona, row, esquema):
+    """Fila de la tabla postulantes para el último envío de un postulante"""
+    secciones = secciones_de_registro(row, esquema)
+    documento = crear_documento(id_postulante, nombre_persona, obtener_indicador(row, esquema), secciones)
+    registro = {
+        'cohorte': cohorte,
+        'id_postulante': id_postulante,
+        'nombre': nombre_persona,
+        'codigo': str(documento['codigo']),
+        'area': limpiar_nombre_area(row.get(esquema.columna_de(COLUMNA_AREA) or COLUMNA_AREA)),
+        'areas': ', '.join(str(area) for area in documento['areas']),
+        'indicador': documento['indicador'],
+        'respuestas': json.dumps(dict(secciones), ensure_ascii=False, default=str),
+        'texto': documento['texto'],
+    }
+    registro['hash'] = calcular_hash(VERSION_BASE, registro)
+    return registro
+
+def guardar_cohorte(conexion, cohorte, df_limpio):
+    """Guarda la tabla limpia de una exportación como ``cohorte`` con upsert por ID
+
+    Solo se escriben los postulantes nuevos o cuyo registro cambió, y se borran
+    los que ya no están en la exportación. Todo ocurre en una sola transacción.
+    Devuelve (nuevos, actualizados, eliminados).
+    """
+    esquema = compilar_esquema(df_limpio.columns)
+    anteriores = dict(conexion.execute('SELECT id_postulante, hash FROM postulantes WHERE cohorte = ?', (cohorte,)))
+
+    nuevos = actualizados = 0
+    vigentes = set()
+    with conexion:
+        for id_postulante, nombre_persona, row in almacenar_postulantes([df_limpio]).postulantes():
+            vigentes.add(id_postulante)
+            registro = registro_de_postulante(cohorte, id_postulante, nombre_persona, row, esquema)
+            if anteriores.get(id_postulante) == registro['hash']:
+                continue
+            conexion.execute(_UPSERT_SQL, registro)
+            if id_postulante in anteriores:
+                actualizados += 1
+            else:
+                nuevos += 1
+
+        eliminados = [id_postulante for id_postulante in anteriores if id_postulante not in vigentes]
+        conexion.executemany('DELETE FROM postulantes WHERE cohorte = ? AND id_postulante = ?',
+                             [(cohorte, id_postulante) for id_postulante in eliminados])
+    return nuevos, actualizados, len(eliminados)
+
+def cohorte_de(archivo_csv):
+    """Nombre de cohorte por defecto de una exportación: el nombre del archivo sin extensión"""
+    return os.path.splitext(os.path.basename(archivo_csv))[0]
+
+def guardar_en_base(cohortes_tablas, archivo_base=ARCHIVO_BASE):
+    """Guarda cada (cohorte, tabla limpia) en la base; devuelve cuántos postulantes tiene cada cohorte o None si falló"""
+    conexion = abrir_base(archivo_base)
+    if conexion is None:
+        return None
+    try:
+        totales = {}
+        for cohorte, df_limpio in cohortes_tablas:
+            nuevos, actualizados, eliminados = guardar_cohorte(conexion, cohorte, df_limpio)
+            totales[cohorte] = conexion.execute('SELECT COUNT(*) FROM postulantes WHERE cohorte = ?', (cohorte,)).fetchone()[0]
+            print(f"🗄️ {cohorte}: {totales[cohorte]} postulantes (nuevos: {nuevos} | actualizados: {actualizados} | "
+                  f"eliminados: {eliminados})")
+    except sqlite3.Error as e:
+        registrar_error(f"{archivo_base}: {e}")
+        print(f"❌ Error al guardar en la base {archivo_base}: {e}")
+        return None
+    finally:
+        conexion.close()
+    return totales
+
+def cargar_en_base(patrones, archivo_base=ARCHIVO_BASE, usar_cache=True):
+    """Lee una o varias exportaciones (archivos, globs o carpetas) y guarda cada una como su propia cohorte
+
+    El nombre de cada cohorte es el del archivo sin extensión (ver
+    lotes.nombres_de_rondas). Devuelve lo mismo que guardar_en_base.
+    """
+    from lotes import LECTORES, expandir_exportaciones, leer_rondas, nombres_de_rondas
+
+    archivos = expandir_exportaciones(patrones)
+    if not archivos:
+        print("❌ Error: no se indicó ninguna exportación.")
+        return None
+    cohortes = nombres_de_rondas(archivos)
+
+    with etapa('lectura'):
+        tablas = leer_rondas(archivos, cohortes, LECTORES, usar_cache)
+        if tablas is None:
+            print("❌ Error: no se actualizó la base porque falló la lectura de alguna exportación.")
+            return None
+
+    with etapa('base'):
+        return guardar_en_base(zip(cohortes, tablas), archivo_base)
+
+def consulta_fts(texto):
+    """Convierte lo que escribe el revisor en una consulta FTS5: todas las palabras, cada una como prefijo"""
+    return ' AND '.join(f'"{palabra}"*' for palabra in tokenizar(texto))
+
+def buscar(texto='', archivo_base=ARCHIVO_BASE, cohorte=None, area=None, indicador=None, limite=LIMITE_RESULTADOS):
+    """Busca postulantes por sus respuestas, del más al menos relevante (BM25)
+
+    Sin ``texto`` solo se filtra, en orden alfabético. ``cohorte``, ``area`` e
+    ``indicador`` (p. ej. '🟢') restringen los resultados. Cada resultado es un
+    dict con la cohorte, el ID, el nombre, el área, el indicador y un fragmento
+    de la respuesta que coincide.
+    """
+    if not os.path.exists(archivo_base):
+        print(f"❌ Error: no existe la base {archivo_base} (créala con 'python pam.py db').")
+        return None
+
+    filtros = []
+    parametros = []
+    for columna, valor in (('cohorte', cohorte), ('area', area), ('indicador', indicador)):
+        if valor:
+            filtros.append(f"p.{columna} = ?")
+            parametros.append(valor)
+
+    consulta = consulta_fts(texto)
+    if consulta:
+        # El nombre pesa más que las áreas, y estas más que el resto de respuestas
+        sql = ("SELECT p.cohorte, p.id_postulante, p.nombre, p.area, p.indicador, "
+               "snippet(busqueda, 2, '[', ']', '…', 12) AS fragmento "
+               "FROM busqueda JOIN postulantes p ON p.id = busqueda.rowid "
+               "WHERE busqueda MATCH ?" + ''.join(f" AND {filtro}" for filtro in filtros) +
+               " ORDER BY bm25(busqueda, 10.0, 5.0, 1.0) LIMIT ?")
+        parametros = [consulta] + parametros
+    else:
+        sql = ("SELECT p.cohorte, p.id_postulante, p.nombre, p.area, p.indicador, '' AS fragmento FROM postulantes p" +
+               (" WHERE " + ' AND '.join(filtros) if filtros else '') + " ORDER BY p.nombre, p.cohorte LIMIT ?")
+
+    # Solo lectura; la URI se arma con pathlib para que espacios, # o ? en la ruta no la rompan
+    conexion = sqlite3.connect(pathlib.Path(archivo_base).resolve().as_uri() + '?mode=ro', uri=True)
+    conexion.row_factory = sqlite3.Row
+    try:
+        return [dict(fila) for fila in conexion.execute(sql, parametros + [limite])]
+    finally:
+        conexion.close()
+
+def imprimir_resultados(resultados):
+    """Muestra los resultados de una búsqueda, uno por postulante"""
+    print(f"🔎 Resultados: {len(resultados)}")
+    for resultado in resultados:
+        print(f"  {resultado['indicador']} {resultado['nombre']} ({resultado['id_postulante']}) · "
+              f"{resultado['area']} · {resultado['cohorte']}")
+        if resultado['fragmento']:
+            fragmento = re.sub(r'\s+', ' ', resultado['fragmento'])
+            print(f"     {fragmento}")
+    for indicador, descripcion in LEYENDA.items():
+        if any(resultado['indicador'] == indicador for resultado in resultados):
+            print(f"  {indicador} {descripcion}")
+
+if __name__ == "__main__":
+    cargar_en_base(sys.argv[1:] or ['PAM 2025_2.csv'])
+    guardar_informe()
@@ -0,0 +1,173 @@
+import argparse
+import contextlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+try:
+    import resource
+except ImportError:  # Windows: sin memoria pico por proceso
+    resource = None
+
+# Mide cómo escala cada paso del flujo con CSV sintéticos de distinto tamaño.
+# Cada etapa corre en su propio proceso (como cuando se llaman los scripts por
+# separado), dentro de una carpeta temporal con el CSV generado.
+
+CARPETA_PROYECTO = os.path.dirname(os.path.abspath(__file__))
+TAMANOS = [1000, 10000, 100000]
+TOLERANCIA = 0.25  # Aumento de tiempo aceptado al comparar con una medición anterior
+
+def _etapa_generar_perfil_md():
+    from organizador import main
+    return main(incremental=False)
+
+def _etapa_md_a_html():
+    from convertir_html import md_a_html
+    return md_a_html(incremental=False)
+
+def _etapa_organizar_por_areas():
+    from organizar_por_areas import organizar_por_areas
+    return organizar_por_areas()
+
+def _etapa_añadir_indicadores():
+    from añadir_indicadores import añadir_indicadores_disponibilidad
+    return añadir_indicadores_disponibilidad()
+
+# Etapas en el orden del flujo: cada una usa las salidas de la anterior
+ETAPAS = {
+    'generar_perfil_md': _etapa_generar_perfil_md,
+    'md_a_html': _etapa_md_a_html,
+    'organizar_por_areas': _etapa_organizar_por_areas,
+    'añadir_indicadores_disponibilidad': _etapa_añadir_indicadores,
+}
+
+def memoria_pico():
+    """Memoria residente máxima del proceso actual en bytes (None si no se puede medir)"""
+    if resource is None:
+        return None
+    maximo = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return maximo if sys.platform == 'darwin' else maximo * 1024  # Linux lo da en KiB
+
+def bytes_escritos():
+    """Bytes que el proceso actual pasó a write() según /proc (None fuera de Linux)"""
+    try:
+        with open('/proc/self/io', 'r') as f:
+            for linea in f:
+                if linea.startswith('wchar:'):
+                    return int(linea.split()[1])
+    except OSError:
+        return None
+    return None
+
+def medir_etapa(nombre_etapa):
+    """Ejecuta una etapa en el proceso actual, sin su salida por pantalla, y devuelve sus mediciones"""
+    escritos_antes = bytes_escritos()
+    inicio = time.perf_counter()
+    with open(os.devnull, 'w', encoding='utf-8') as nulo, contextlib.redirect_stdout(nulo):
+        resultado = ETAPAS[nombre_etapa]()
+    segundos = time.perf_counter() - inicio
+    escritos = bytes_escritos()
+    return {
+        'etapa': nombre_etapa,
+        'segundos': round(segundos, 4),
+        'memoria_pico': memoria_pico(),
+        'bytes_escritos': escritos - escritos_antes if escritos is not None and escritos_antes is not None else None,
+        'correcta': resultado is not None,
+    }
+
+def ejecutar_en_subproceso(nombre_etapa, carpeta, trabajadores=None):
+    """Mide una etapa en un proceso nuevo con ``carpeta`` como directorio de trabajo
+
+    ``trabajadores`` se pasa solo al proceso de la etapa (PAM_TRABAJADORES), sin
+    cambiar el entorno de este proceso.
+    """
+    entorno = dict(os.environ)
+    if trabajadores is not None:
+        entorno['PAM_TRABAJADORES'] = str(trabajadores)
+    salida = subprocess.run(
+        [sys.executable, os.path.join(CARPETA_PROYECTO, 'benchmark.py'), '--etapa', nombre_etapa],
+        cwd=carpeta, capture_output=True, text=True, encoding='utf-8', env=entorno
+    )
+    if salida.returncode != 0:
+        raise RuntimeError(f"La etapa {nombre_etapa} falló:\n{salida.stderr}")
+    return json.loads(salida.stdout.strip().splitlines()[-1])
+
+def medir_tamano(filas, trabajadores=None):
+    """Genera un CSV sintético de ``filas`` postulantes y mide todas las etapas sobre él"""
+    from datos_sinteticos import escribir_csv_sintetico
+    from organizador import ARCHIVO_CSV
+
+    carpeta = tempfile.mkdtemp(prefix=f'pam_benchmark_{filas}_')
+    try:
+        escribir_csv_sintetico(filas, os.path.join(carpeta, ARCHIVO_CSV))
+
+        mediciones = []
+        for nombre_etapa in ETAPAS:
+            medicion = ejecutar_en_subproceso(nombre_etapa, carpeta, trabajadores)
+            medicion['filas'] = filas
+            mediciones.append(medicion)
+            memoria = medicion['memoria_pico']
+            escritos = medicion['bytes_escritos']
+            print(f"  ⏱️ {nombre_etapa:<36} {medicion['segundos']:>9.3f} s"
+                  f" | 🧠 {memoria / 2 ** 20 if memoria is not None else float('nan'):>8.1f} MiB"
+                  f" | 💾 {escritos / 2 ** 20 if escritos is not None else float('nan'):>8.1f} MiB escritos")
+        return mediciones
+    finally:
+        shutil.rmtree(carpeta, ignore_errors=True)
+
+def comparar(mediciones, anteriores, tolerancia=TOLERANCIA):
+    """Devuelve las etapas que tardan más que en la medición anterior, más allá de la tolerancia"""
+    referencia = {(medicion['filas'], medicion['etapa']): medicion for medicion in anteriores}
+    regresiones = []
+    for medicion in mediciones:
+        anterior = referencia.get((medicion['filas'], medicion['etapa']))
+        if anterior is not None and medicion['segundos'] > anterior['segundos'] * (1 + tolerancia):
+            regresiones.append((medicion, anterior))
+    return regresiones
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark del flujo de perfiles con CSV sintéticos')
+    parser.add_argument('--tamanos', type=int, nargs='+', default=TAMANOS, help='filas de cada CSV sintético')
+    parser.add_argument('-t', '--trabajadores', type=int, default=None, help='procesos para renderizar')
+    parser.add_argument('--salida', default='benchmark_resultados.json', help='archivo JSON con las mediciones')
+    parser.add_argument('--comparar', default=None, help='JSON de una medición anterior para detectar regresiones')
+    parser.add_argument('--tolerancia', type=float, default=TOLERANCIA, help='aumento de tiempo aceptado (0.25 = 25%%)')
+    parser.add_argument('--etapa', choices=list(ETAPAS), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    # Modo interno: medir una sola etapa en este proceso e imprimir el resultado
+    if args.etapa:
+        print(json.dumps(medir_etapa(args.etapa)))
+        return 0
+
+    mediciones = []
+    for filas in args.tamanos:
+        print(f"\n📊 {filas} postulantes")
+        mediciones.extend(medir_tamano(filas, args.trabajadores))
+
+    with open(args.salida, 'w', encoding='utf-8') as f:
+        json.dump(mediciones, f, ensure_ascii=False, indent=2)
+    print(f"\n📁 Mediciones guardadas en {args.salida}")
+
+    if any(not medicion['correcta'] for medicion in mediciones):
+        print("❌ Alguna etapa terminó con error")
+        return 1
+
+    if args.comparar:
+        with open(args.comparar, 'r', encoding='utf-8') as f:
+            regresiones = comparar(mediciones, json.load(f), args.tolerancia)
+        for medicion, anterior in regresiones:
+            print(f"🐢 Regresión en {medicion['etapa']} ({medicion['filas']} filas): "
+                  f"{anterior['segundos']:.3f} s → {medicion['segundos']:.3f} s")
+        if regresiones:
+            return 1
+        print("✅ Sin regresiones respecto a la medición anterior")
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,130 @@
+import glob
+import hashlib
+import json
+import os
+
+import pandas as pd
+
+from escritor import reemplazar_archivo
+from instrumentacion import registrar_escritura
+
+# El caché es columnar (Parquet) y necesita pyarrow, que está en requirements.txt y
+# environment.yml. Pickle de pandas queda solo como último recurso para entornos sin
+# pyarrow: funciona igual pero no es columnar, y se avisa cada vez que se escribe.
+try:
+    import pyarrow  # noqa: F401
+    FORMATO_CACHE = 'parquet'
+except ImportError:
+    FORMATO_CACHE = 'pickle'
+
+CARPETA_CACHE = '.cache_postulantes'
+NOMBRE_METADATOS = 'metadatos.json'
+
+def huella_archivo(ruta):
+    """Tamaño y fecha de modificación (en ns) de un archivo: la comprobación rápida del caché"""
+    info = os.stat(ruta)
+    return info.st_size, info.st_mtime_ns
+
+def hash_archivo(ruta, tamano_lectura=1024 * 1024):
+    """SHA-256 del contenido de un archivo, leído por partes"""
+    sha = hashlib.sha256()
+    with open(ruta, 'rb') as f:
+        for parte in iter(lambda: f.read(tamano_lectura), b''):
+            sha.update(parte)
+    return sha.hexdigest()
+
+def _ruta_bloque(carpeta, indice, formato):
+    return os.path.join(carpeta, f"bloque_{indice:05d}.{formato}")
+
+def _leer_metadatos(carpeta):
+    try:
+        with open(os.path.join(carpeta, NOMBRE_METADATOS), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+def _guardar_metadatos(carpeta, metadatos):
+    reemplazar_archivo(os.path.join(carpeta, NOMBRE_METADATOS), json.dumps(metadatos, ensure_ascii=False, indent=2))
+
+def cache_vigente(archivo_csv, version, carpeta=CARPETA_CACHE):
+    """Devuelve los metadatos del caché si corresponde a ``archivo_csv`` tal como está ahora (o None)
+
+    Si el tamaño y la fecha de modificación coinciden no se lee el CSV. Si solo
+    cambió la fecha (el archivo se tocó o se copió), se compara el hash del
+    contenido y, si coincide, el caché se da por bueno. Lanza FileNotFoundError
+    si el CSV no existe.
+    """
+    tamano, mtime_ns = huella_archivo(archivo_csv)
+    metadatos = _leer_metadatos(carpeta)
+    if metadatos is None or metadatos.get('version') != version or metadatos.get('formato') != FORMATO_CACHE:
+        return None
+    if metadatos.get('archivo') != os.path.abspath(archivo_csv) or metadatos.get('tamano') != tamano:
+        return None
+
+    if metadatos.get('mtime_ns') != mtime_ns:
+        if metadatos.get('sha256') != hash_archivo(archivo_csv):
+            return None
+        metadatos['mtime_ns'] = mtime_ns
+        _guardar_metadatos(carpeta, metadatos)
+
+    return metadatos
+
+def leer_bloques_cache(metadatos, carpeta=CARPETA_CACHE):
+    """Produce los bloques limpios guardados en el caché, en su orden original"""
+    for indice in range(metadatos['bloques']):
+        ruta = _ruta_bloque(carpeta, indice, metadatos['formato'])
+        if metadatos['formato'] == 'parquet':
+            yield pd.read_parquet(ruta)
+        else:
+            yield pd.read_pickle(ruta)
+
+def escribir_bloques_cache(archivo_csv, bloques, version, carpeta=CARPETA_CACHE, conteos=None):
+    """Deja pasar los bloques limpios de ``bloques`` mientras los guarda en el caché
+
+    Los metadatos se escriben al final, así que un recorrido interrumpido nunca
+    deja un caché que parezca válido. ``conteos`` ({contador: cantidad}, p. ej. las
+    filas leídas y filtradas del CSV) se guarda en ellos para repetirlo en el
+    informe cuando se use el caché; puede irse llenando mientras pasan los bloques.
+    """
+    os.makedirs(carpeta, exist_ok=True)
+    if FORMATO_CACHE == 'pickle':
+        print("⚠️ pyarrow no está instalado: el caché se guarda en pickle en lugar de Parquet (pip install pyarrow)")
+    huella_antes = huella_archivo(archivo_csv)
+    sha256 = hash_archivo(archivo_csv)
+
+    # Invalidar el caché anterior antes de empezar a sobrescribirlo
+    ruta_metadatos = os.path.join(carpeta, NOMBRE_METADATOS)
+    if os.path.exists(ruta_metadatos):
+        os.remove(ruta_metadatos)
+    for ruta in glob.glob(os.path.join(carpeta, 'bloque_*')):
+        os.remove(ruta)
+
+    total = 0
+    indice = 0
+    for bloque in bloques:
+        ruta = _ruta_bloque(carpeta, indice, FORMATO_CACHE)
+        if FORMATO_CACHE == 'parquet':
+            bloque.to_parquet(ruta)
+        else:
+            bloque.to_pickle(ruta)
+        registrar_escritura(ruta)
+        total += len(bloque)
+        indice += 1
+        yield bloque
+
+    # Si el CSV cambió mientras se leía, el caché no representa a ninguna versión
+    tamano, mtime_ns = huella_archivo(archivo_csv)
+    if (tamano, mtime_ns) != huella_antes:
+        return
+
+    _guardar_metadatos(carpeta, {
+        'archivo': os.path.abspath(archivo_csv),
+        'tamano': tamano,
+        'mtime_ns': mtime_ns,
+        'sha256': sha256,
+        'version': version,
+        'formato': FORMATO_CACHE,
+        'bloques': indice,
+        'registros': total,
+        'conteos': dict(conteos or {}),
+    })
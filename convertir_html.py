@@ -1,143 +1,95 @@
 import os
-import markdown
-from pathlib import Path
-
-def md_a_html():
-    """Convierte todos los archivos MD a HTML con estilo"""
-    
-    # CSS para hacer los perfiles más bonitos
-    css_style = """
-    <style>
-        body { 
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; 
-            max-width: 800px; 
-            margin: 0 auto; 
-            padding: 20px; 
-            line-height: 1.6;
-            background-color: #f8f9fa;
-        }
-        .container {
-            background: white;
-            padding: 30px;
-            border-radius: 10px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }
-        h1 { 
-            color: #2c3e50; 
-            border-bottom: 3px solid #3498db; 
-            padding-bottom: 10px;
-        }
-        h2 { 
-            color: #34495e; 
-            margin-top: 25px;
-            margin-bottom: 10px;
-            padding: 8px 15px;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            border-radius: 5px;
-        }
-        p { 
-            margin-bottom: 15px; 
-            text-align: justify;
-        }
-        hr { 
-            border: none; 
-            height: 2px; 
-            background: linear-gradient(to right, #3498db, #e74c3c);
-            margin: 20px 0;
-        }
-        .nav-buttons {
-            text-align: center;
-            margin: 20px 0;
-        }
-        .nav-button {
-            display: inline-block;
-            padding: 10px 20px;
-            margin: 5px;
-            background: #3498db;
-            color: white;
-            text-decoration: none;
-            border-radius: 5px;
-            transition: background 0.3s;
-        }
-        .nav-button:hover {
-            background: #2980b9;
-        }
-    </style>
+import re
+from html import escape
+
+from añadir_indicadores import leer_indicador_md, obtener_indicador
+from esquema import compilar_esquema
+from estilos import HOJA_ESTILOS, enlace_estilos, escribir_hoja_estilos
+from indice_busqueda import (VERSION_BUSQUEDA, crear_documento, escribir_indice_busqueda, html_buscador,
+                             indice_busqueda_existe, secciones_de_md)
+from escritor import escribir_archivo, esperar_escrituras
+from instrumentacion import etapa, guardar_informe, progreso, registrar_error
+from manifiesto import calcular_hash, cargar_manifiesto, eliminar_desaparecidos, guardar_manifiesto
+from paginacion import (PAGINA_RESUMEN, TAMANO_PAGINA, enlaces_paginas, escribir_paginas, nombre_pagina,
+                        navegacion_paginas, paginar)
+from paralelo import TAMANO_LOTE, TRABAJADORES, crear_pool, mapear_por_lotes
+from rutas_postulantes import cargar_rutas, guardar_rutas, registrar_salida, rutas_de
+
+# Subir esta versión cada vez que cambie la plantilla o el CSS de las páginas
+VERSION_PLANTILLA = '4'
+
+def convertir_markdown(contenido_md):
+    """Convierte el texto Markdown de un perfil a HTML"""
+    # Importación diferida: el pipeline genera HTML sin Markdown y no necesita la librería
+    import markdown
+    
+    md = markdown.Markdown(extensions=['extra'])
+    return md.convert(contenido_md)
+
+def generar_contenido_html(persona_data, nombre_persona, esquema=None, indicador=None):
+    """Genera el HTML del perfil directamente desde el registro limpio, sin pasar por Markdown
+    
+    Sigue la misma estructura que generar_perfil_md (título y, por cada pregunta,
+    encabezado, párrafo y separador) y produce el mismo HTML que
+    convertir_markdown(generar_perfil_md(...)) para respuestas de texto plano,
+    indicador de disponibilidad incluido.
     """
+    if esquema is None:
+        esquema = compilar_esquema(persona_data.keys())
+    if indicador is None:
+        indicador = obtener_indicador(persona_data, esquema)
     
-    carpeta_md = 'perfiles_md'
-    carpeta_html = 'perfiles_html'
+    partes = [f"<h1>{indicador} 👤 Perfil de {escape(nombre_persona, quote=False)}</h1>", "<hr />"]
     
-    # Crear carpeta HTML si no existe
-    if not os.path.exists(carpeta_html):
-        os.makedirs(carpeta_html)
-        print(f"📁 Carpeta '{carpeta_html}' creada")
+    # Agregar nombres y apellidos en una sola línea
+    nombres = persona_data.get('Nombres:\n', '')
+    apellidos = persona_data.get('Apellidos:', '')
+    if nombres and apellidos:
+        partes.append("<h2>👤 Nombre Completo</h2>")
+        partes.append(f"<p>{escape(nombres, quote=False)} {escape(apellidos, quote=False)}</p>")
+        partes.append("<hr />")
     
-    # Obtener lista de archivos MD
-    archivos_md = [f for f in os.listdir(carpeta_md) if f.endswith('.md')]
-    archivos_convertidos = 0
+    # Procesar las columnas del esquema (sin administrativas) en su orden
+    for columna, titulo_pregunta in esquema.renderizables:
+        valor = persona_data.get(columna)
+        if valor:
+            partes.append(f"<h2>{escape(titulo_pregunta, quote=False)}</h2>")
+            partes.append(f"<p>{escape(valor, quote=False)}</p>")
+            partes.append("<hr />")
     
-    # Generar índice HTML
-    html_index = f"""
-    <!DOCTYPE html>
-    <html lang="es">
-    <head>
-        <meta charset="UTF-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <title>Perfiles ACECOM PAM 2025</title>
-        {css_style}
-    </head>
-    <body>
-        <div class="container">
-            <h1>🎓 Perfiles de Postulantes ACECOM</h1>
-            <p><strong>Total de postulantes:</strong> {len(archivos_md)}</p>
-            <hr>
-            <h2>📋 Lista de Perfiles</h2>
-    """
+    return "\n".join(partes)
+
+def generar_botones_nav(archivos_html, idx_actual):
+    """Crea los botones de navegación (inicio, anterior, siguiente) de un perfil"""
+    botones_nav = '<div class="nav-buttons">'
+    botones_nav += '<a href="index.html" class="nav-button">🏠 Inicio</a>'
     
-    # Convertir cada archivo MD a HTML
-    for archivo_md in sorted(archivos_md):
-        nombre_sin_ext = archivo_md.replace('.md', '')
-        archivo_html = f"{nombre_sin_ext}.html"
-        
-        try:
-            # Leer archivo MD
-            with open(os.path.join(carpeta_md, archivo_md), 'r', encoding='utf-8') as f:
-                contenido_md = f.read()
-            
-            # Convertir MD a HTML
-            md = markdown.Markdown(extensions=['extra'])
-            contenido_html = md.convert(contenido_md)
-            
-            # Crear botones de navegación
-            botones_nav = '<div class="nav-buttons">'
-            botones_nav += '<a href="index.html" class="nav-button">🏠 Inicio</a>'
-            
-            # Botón anterior
-            idx_actual = archivos_md.index(archivo_md)
-            if idx_actual > 0:
-                archivo_anterior = archivos_md[idx_actual - 1].replace('.md', '.html')
-                botones_nav += f'<a href="{archivo_anterior}" class="nav-button">⬅️ Anterior</a>'
-            
-            # Botón siguiente
-            if idx_actual < len(archivos_md) - 1:
-                archivo_siguiente = archivos_md[idx_actual + 1].replace('.md', '.html')
-                botones_nav += f'<a href="{archivo_siguiente}" class="nav-button">➡️ Siguiente</a>'
-            
-            botones_nav += '</div>'
-            
-            # HTML completo
-            html_completo = f"""
+    # Botón anterior
+    if idx_actual > 0:
+        archivo_anterior = archivos_html[idx_actual - 1]
+        botones_nav += f'<a href="{archivo_anterior}" class="nav-button">⬅️ Anterior</a>'
+    
+    # Botón siguiente
+    if idx_actual < len(archivos_html) - 1:
+        archivo_siguiente = archivos_html[idx_actual + 1]
+        botones_nav += f'<a href="{archivo_siguiente}" class="nav-button">➡️ Siguiente</a>'
+    
+    botones_nav += '</div>'
+    return botones_nav
+
+def generar_pagina_perfil(nombre_persona, contenido_html, botones_nav, indicador=''):
+    """Envuelve el HTML de un perfil en la página completa con estilo"""
+    titulo = f"{indicador} Perfil" if indicador else "Perfil"
+    return f"""
             <!DOCTYPE html>
             <html lang="es">
             <head>
                 <meta charset="UTF-8">
                 <meta name="viewport" content="width=device-width, initial-scale=1.0">
-                <title>Perfil - {nombre_sin_ext.replace('_', ' ')}</title>
-                {css_style}
+                <title>{titulo} - {escape(nombre_persona, quote=False)}</title>
+                {enlace_estilos()}
             </head>
-            <body>
+            <body class="pagina-perfil">
                 <div class="container">
                     {botones_nav}
                     {contenido_html}
@@ -146,31 +98,269 @@ def md_a_html():
             </body>
             </html>
             """
+
+def _pagina_indice(titulo, cuerpo):
+    """Envuelve el contenido de una página del índice en la página completa con estilo"""
+    return f"""
+    <!DOCTYPE html>
+    <html lang="es">
+    <head>
+        <meta charset="UTF-8">
+        <meta name="viewport" content="width=device-width, initial-scale=1.0">
+        <title>{titulo}</title>
+        {enlace_estilos()}
+    </head>
+    <body class="pagina-perfil">
+        <div class="container">
+            {cuerpo}
+        </div>
+    </body>
+    </html>
+    """
+
+def _lista_perfiles(perfiles):
+    """Un enlace por cada perfil (id, nombre_persona) de la lista"""
+    return ''.join(
+        f'<p>👤 <a href="{id_postulante}.html" class="nav-button" style="display:inline; padding:5px 10px; margin:2px;">{escape(nombre_persona, quote=False)}</a></p>\n'
+        for id_postulante, nombre_persona in perfiles
+    )
+
+def generar_indice_html(perfiles, tamano_pagina=TAMANO_PAGINA):
+    """Genera el índice HTML de los perfiles como {archivo: html}
+    
+    ``perfiles`` es la lista ordenada de (id, nombre_persona). Hasta
+    ``tamano_pagina`` perfiles es una sola página (index.html) con un enlace por
+    perfil. Con más, index.html es un resumen con el buscador y los enlaces a
+    páginas de tamaño fijo, así cada página pesa lo mismo sin importar el total.
+    """
+    titulo = "Perfiles ACECOM PAM 2025"
+    encabezado = f"""<h1>🎓 Perfiles de Postulantes ACECOM</h1>
+            <p><strong>Total de postulantes:</strong> {len(perfiles)}</p>
+            {html_buscador()}
+            <hr>"""
+    
+    paginas = paginar(perfiles, tamano_pagina)
+    if len(paginas) == 1:
+        return {PAGINA_RESUMEN: _pagina_indice(titulo, f"{encabezado}\n<h2>📋 Lista de Perfiles</h2>\n{_lista_perfiles(perfiles)}")}
+    
+    resumen = f"{encabezado}\n<h2>📑 Páginas de Perfiles</h2>\n{enlaces_paginas(paginas, lambda perfil: escape(perfil[1], quote=False))}"
+    indice = {PAGINA_RESUMEN: _pagina_indice(titulo, resumen)}
+    for numero, pagina in enumerate(paginas, start=1):
+        navegacion = navegacion_paginas(numero, len(paginas))
+        cuerpo = f"<h1>📋 Lista de Perfiles</h1>\n{navegacion}\n{_lista_perfiles(pagina)}{navegacion}"
+        indice[nombre_pagina(numero)] = _pagina_indice(f"{titulo} - Página {numero}", cuerpo)
+    return indice
+
+def leer_nombre_md(contenido_md):
+    """Devuelve el nombre del postulante del título de un perfil Markdown ('' si no lo tiene)"""
+    coincidencia = re.search(r'^# .*?👤 Perfil de (.+)$', contenido_md, flags=re.MULTILINE)
+    return coincidencia.group(1).strip() if coincidencia else ''
+
+def documentos_de_md(carpeta_md, ids):
+    """Lee los perfiles Markdown y los resume para el índice de búsqueda"""
+    documentos = []
+    for id_postulante in ids:
+        with open(os.path.join(carpeta_md, f"{id_postulante}.md"), 'r', encoding='utf-8') as f:
+            contenido_md = f.read()
+        documentos.append(crear_documento(id_postulante, leer_nombre_md(contenido_md), leer_indicador_md(contenido_md),
+                                          secciones_de_md(contenido_md)))
+    return documentos
+
+def nombres_de_perfiles(carpeta_md, ids, nombres_conocidos):
+    """Nombre de cada postulante: el del manifiesto de perfiles_md o, si falta, el del título de su perfil"""
+    nombres = {}
+    for id_postulante in ids:
+        nombre_persona = nombres_conocidos.get(id_postulante)
+        if nombre_persona is None:
+            with open(os.path.join(carpeta_md, f"{id_postulante}.md"), 'r', encoding='utf-8') as f:
+                nombre_persona = leer_nombre_md(f.read()) or id_postulante
+        nombres[id_postulante] = nombre_persona
+    return nombres
+
+def hash_pagina(hash_md, archivos_html, idx_actual):
+    """Hash de una página de perfil: su Markdown, sus vecinos de navegación y la plantilla"""
+    anterior = archivos_html[idx_actual - 1] if idx_actual > 0 else None
+    siguiente = archivos_html[idx_actual + 1] if idx_actual < len(archivos_html) - 1 else None
+    return calcular_hash(VERSION_PLANTILLA, HOJA_ESTILOS, hash_md, anterior, siguiente)
+
+def _renderizar_pagina(pendiente):
+    """Convierte un perfil pendiente (nombre_sin_ext, contenido_md, botones_nav); usable en otro proceso
+    
+    Devuelve (html_completo, None) o (None, mensaje_de_error).
+    """
+    nombre_sin_ext, contenido_md, botones_nav = pendiente
+    try:
+        contenido_html = convertir_markdown(contenido_md)
+        # El nombre y el indicador ya vienen en el título del Markdown; se repiten en el <title>
+        indicador = leer_indicador_md(contenido_md)
+        nombre_persona = leer_nombre_md(contenido_md) or nombre_sin_ext
+        return generar_pagina_perfil(nombre_persona, contenido_html, botones_nav, indicador), None
+    except Exception as e:
+        return None, str(e)
+
+def md_a_html(incremental=True, trabajadores=TRABAJADORES, tamano_lote=TAMANO_LOTE, tamano_pagina=TAMANO_PAGINA):
+    """Convierte todos los archivos MD a HTML con estilo
+    
+    En modo incremental solo se convierten los perfiles cuyo Markdown o cuyos
+    vecinos de navegación cambiaron, y el índice solo se reescribe si cambió la lista;
+    con más de ``tamano_pagina`` perfiles el índice se divide en páginas.
+    Con ``trabajadores`` > 1 la conversión se reparte en un pool de procesos; el
+    resultado es idéntico al del modo secuencial. Devuelve cuántas páginas se
+    escribieron, o None si no existe la carpeta de perfiles MD.
+    """
+    with etapa('html'):
+        return _md_a_html(incremental, trabajadores, tamano_lote, tamano_pagina)
+
+def _md_a_html(incremental, trabajadores, tamano_lote, tamano_pagina):
+    """Cuerpo de md_a_html, ejecutado dentro de su etapa de medición"""
+    
+    carpeta_md = 'perfiles_md'
+    carpeta_html = 'perfiles_html'
+    
+    if not os.path.isdir(carpeta_md):
+        registrar_error(f"No se encontró la carpeta '{carpeta_md}'")
+        print(f"❌ Error: No se encontró la carpeta '{carpeta_md}'. Genera antes los perfiles MD.")
+        return None
+    
+    # Crear carpeta HTML si no existe
+    if not os.path.exists(carpeta_html):
+        os.makedirs(carpeta_html)
+        print(f"📁 Carpeta '{carpeta_html}' creada")
+    
+    # Hoja de estilos compartida por todas las páginas de la carpeta
+    escribir_hoja_estilos(carpeta_html)
+    
+    manifiesto_perfiles_md = cargar_manifiesto(carpeta_md)
+    manifiesto_md = manifiesto_perfiles_md['perfiles']
+    
+    # Perfiles MD registrados en el manifiesto de rutas (sin manifiesto: los de la carpeta),
+    # ordenados por nombre para que la navegación siga al índice
+    rutas = cargar_rutas()
+    ids = list(rutas_de(rutas, 'md')) or [f[:-len('.md')] for f in os.listdir(carpeta_md) if f.endswith('.md')]
+    nombres = nombres_de_perfiles(carpeta_md, ids, manifiesto_perfiles_md.get('nombres', {}))
+    archivos_md = [f"{id_postulante}.md" for id_postulante in sorted(ids, key=lambda x: (nombres[x], x))]
+    archivos_html = [archivo_md.replace('.md', '.html') for archivo_md in archivos_md]
+    archivos_convertidos = 0
+    archivos_sin_cambios = 0
+    fallidos = set()
+    pendientes = []
+    
+    manifiesto_anterior = cargar_manifiesto(carpeta_html) if incremental else {'perfiles': {}}
+    hashes_anteriores = manifiesto_anterior['perfiles']
+    hashes_actuales = {}
+    hashes_md = {}
+    pool = crear_pool(trabajadores)
+    
+    def escribir_pendientes():
+        convertidos = 0
+        paginas = mapear_por_lotes(_renderizar_pagina, pendientes, pool, tamano_lote)
+        for (nombre_sin_ext, _, _), (html_completo, error) in zip(pendientes, paginas):
+            archivo_html = f"{nombre_sin_ext}.html"
+            if error is not None:
+                # Conservar el hash anterior para reintentar en la próxima ejecución
+                fallidos.add(nombre_sin_ext)
+                hashes_actuales[nombre_sin_ext] = hashes_anteriores.get(nombre_sin_ext)
+                registrar_error(f"{archivo_html}: {error}")
+                print(f"❌ Error al convertir {nombre_sin_ext}.md: {error}")
+                continue
             
-            # Escribir archivo HTML
-            with open(os.path.join(carpeta_html, archivo_html), 'w', encoding='utf-8') as f:
-                f.write(html_completo)
-            
-            # Agregar al índice
-            nombre_display = nombre_sin_ext.replace('_', ' ')
-            html_index += f'<p>👤 <a href="{archivo_html}" class="nav-button" style="display:inline; padding:5px 10px; margin:2px;">{nombre_display}</a></p>\n'
+            # Escribir archivo HTML (los errores se informan al esperar las escrituras)
+            escribir_archivo(os.path.join(carpeta_html, archivo_html), html_completo)
+            convertidos += 1
+            progreso(f"✅ Convertido: {archivo_html}")
+        
+        pendientes.clear()
+        return convertidos
+    
+    # Convertir cada archivo MD a HTML
+    try:
+        for idx_actual, archivo_md in enumerate(archivos_md):
+            nombre_sin_ext = archivo_md.replace('.md', '')
             
-            archivos_convertidos += 1
-            print(f"✅ Convertido: {archivo_html}")
+            try:
+                hash_md = manifiesto_md.get(nombre_sin_ext)
+                contenido_md = None
+                if hash_md is None:
+                    # Sin manifiesto de perfiles_md: usar el contenido del archivo
+                    with open(os.path.join(carpeta_md, archivo_md), 'r', encoding='utf-8') as f:
+                        contenido_md = f.read()
+                    hash_md = calcular_hash(contenido_md)
+                hashes_md[nombre_sin_ext] = hash_md
+                
+                # Saltar si la página no cambió desde la última ejecución
+                hash_actual = hash_pagina(hash_md, archivos_html, idx_actual)
+                hashes_actuales[nombre_sin_ext] = hash_actual
+                if hashes_anteriores.get(nombre_sin_ext) == hash_actual:
+                    archivos_sin_cambios += 1
+                    continue
+                
+                # Leer archivo MD
+                if contenido_md is None:
+                    with open(os.path.join(carpeta_md, archivo_md), 'r', encoding='utf-8') as f:
+                        contenido_md = f.read()
+                
+                # Crear botones de navegación
+                botones_nav = generar_botones_nav(archivos_html, idx_actual)
+                pendientes.append((nombre_sin_ext, contenido_md, botones_nav))
+                
+            except Exception as e:
+                # Conservar el hash anterior para reintentar en la próxima ejecución
+                fallidos.add(nombre_sin_ext)
+                hashes_actuales[nombre_sin_ext] = hashes_anteriores.get(nombre_sin_ext)
+                registrar_error(f"{archivo_md}: {e}")
+                print(f"❌ Error al convertir {archivo_md}: {e}")
             
-        except Exception as e:
-            print(f"❌ Error al convertir {archivo_md}: {e}")
-    
-    # Finalizar índice
-    html_index += """
-            </div>
-        </body>
-        </html>
-    """
+            if len(pendientes) >= tamano_lote * max(trabajadores, 1):
+                archivos_convertidos += escribir_pendientes()
+        
+        archivos_convertidos += escribir_pendientes()
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    
+    # Las páginas que no se pudieron escribir conservan el hash anterior para reintentarlas
+    for ruta_archivo in esperar_escrituras():
+        nombre_sin_ext = os.path.splitext(os.path.basename(ruta_archivo))[0]
+        if nombre_sin_ext in hashes_actuales:
+            fallidos.add(nombre_sin_ext)
+            hashes_actuales[nombre_sin_ext] = hashes_anteriores.get(nombre_sin_ext)
+            archivos_convertidos -= 1
+    
+    # Agregar al índice los perfiles que quedaron con su página al día
+    convertidos = [(archivo_md.replace('.md', ''), nombres[archivo_md.replace('.md', '')]) for archivo_md in archivos_md
+                   if archivo_md.replace('.md', '') not in fallidos]
+    
+    # Eliminar páginas de postulantes que ya no tienen perfil MD
+    for nombre_sin_ext in eliminar_desaparecidos(carpeta_html, manifiesto_anterior, hashes_actuales, '.html'):
+        progreso(f"🗑️ Página eliminada: {nombre_sin_ext}.html")
+    
+    # Escribir índice solo si cambió la lista de perfiles
+    hash_indice = calcular_hash(VERSION_PLANTILLA, VERSION_BUSQUEDA, HOJA_ESTILOS, tamano_pagina, convertidos)
+    ruta_index = os.path.join(carpeta_html, PAGINA_RESUMEN)
+    if manifiesto_anterior.get('indice') != hash_indice or not os.path.exists(ruta_index):
+        escribir_paginas(carpeta_html, generar_indice_html(convertidos, tamano_pagina))
     
-    # Escribir índice
-    with open(os.path.join(carpeta_html, 'index.html'), 'w', encoding='utf-8') as f:
-        f.write(html_index)
+    # Índice de búsqueda: se reconstruye entero, pero solo si cambió algún perfil
+    hash_busqueda = calcular_hash(VERSION_BUSQUEDA, {nombre_sin_ext: hashes_md.get(nombre_sin_ext) for nombre_sin_ext, _ in convertidos})
+    if manifiesto_anterior.get('busqueda') != hash_busqueda or not indice_busqueda_existe(carpeta_html):
+        escribir_indice_busqueda(carpeta_html, documentos_de_md(carpeta_md, [nombre_sin_ext for nombre_sin_ext, _ in convertidos]))
+    
+    if esperar_escrituras():
+        hash_indice = hash_busqueda = None  # Reintentar el índice la próxima vez
+    
+    registrar_salida(rutas, 'html', {nombre_sin_ext: os.path.join(carpeta_html, f"{nombre_sin_ext}.html")
+                                     for nombre_sin_ext, hash_actual in hashes_actuales.items() if hash_actual is not None})
+    guardar_rutas(rutas)
+    
+    guardar_manifiesto(carpeta_html, {
+        'version_plantilla': VERSION_PLANTILLA,
+        'indice': hash_indice,
+        'busqueda': hash_busqueda,
+        'perfiles': hashes_actuales
+    })
+    
+    if archivos_sin_cambios:
+        print(f"⏭️ Páginas sin cambios: {archivos_sin_cambios}")
     
     print(f"\n🎉 ¡Conversión completada!")
     print(f"📁 Archivos HTML generados: {archivos_convertidos + 1}")
@@ -180,6 +370,9 @@ def md_a_html():
     # Mostrar cómo abrir
     ruta_index = os.path.abspath(os.path.join(carpeta_html, 'index.html'))
     print(f"📋 Comando para abrir: firefox {ruta_index}")
+    
+    return archivos_convertidos
 
 if __name__ == "__main__":
-    md_a_html()
\ No newline at end of file
+    md_a_html()
+    guardar_informe()
\ No newline at end of file
@@ -0,0 +1,143 @@
+import os
+import random
+import re
+import sys
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from esquema import buscar_columna
+
+# Genera exportaciones sintéticas del formulario con los mismos encabezados que el
+# CSV real y respuestas de largo parecido, para medir cómo escala el flujo.
+
+ARCHIVO_PLANTILLA = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'PAM 2025_2.csv')
+VARIANTES_POR_COLUMNA = 512  # Respuestas distintas que se generan por pregunta abierta
+
+NOMBRES = ['Lucía', 'Mateo', 'Valeria', 'Santiago', 'Camila', 'Sebastián', 'Daniela', 'Diego', 'Andrea',
+           'Joaquín', 'Fernanda', 'Gabriel', 'Ximena', 'Rodrigo', 'Alessandra', 'Luis', 'Mariana', 'José',
+           'Carla', 'Bruno', 'Ariana', 'Alonso', 'Renata', 'Adrián', 'Nicole', 'Emiliano', 'Paola', 'Kevin']
+APELLIDOS = ['Quispe', 'Flores', 'Sánchez', 'Rodríguez', 'García', 'Huamán', 'Rojas', 'Mamani', 'Torres',
+             'Vargas', 'Ramírez', 'Castillo', 'Mendoza', 'Chávez', 'Espinoza', 'Díaz', 'Gutiérrez', 'Ramos']
+
+# Columnas con un formato propio (encabezado → tipo de dato)
+COLUMNAS_ESPECIALES = {
+    'Id': 'id',
+    'Hora de inicio': 'inicio',
+    'Hora de finalización': 'fin',
+    'Nombres:\n': 'nombres',
+    'Apellidos:': 'apellidos',
+    'Código Universitario:\n': 'codigo',
+    'Correo Electrónico:\n': 'correo',
+    'Teléfono (WhatsApp):\n': 'telefono',
+}
+
+# Una columna con pocas respuestas distintas y cortas (en promedio) se trata como de opción múltiple
+MAXIMO_OPCIONES = 16
+LARGO_MAXIMO_OPCION = 60
+
+def leer_plantilla(archivo_plantilla=ARCHIVO_PLANTILLA):
+    """Lee el CSV real que sirve de modelo (encabezados, opciones y largos de respuesta)"""
+    return pd.read_csv(archivo_plantilla, sep=';', dtype=str)
+
+def _texto_aleatorio(aleatorio, vocabulario, largo):
+    """Arma un texto de aproximadamente ``largo`` caracteres con palabras del vocabulario"""
+    palabras = [aleatorio.choice(vocabulario)]
+    total = len(palabras[0])
+    while total < largo:
+        palabra = aleatorio.choice(vocabulario)
+        palabras.append(palabra)
+        total += len(palabra) + 1
+    texto = ' '.join(palabras)
+    return texto[0].upper() + texto[1:] + '.'
+
+def describir_columnas(plantilla):
+    """Clasifica cada columna de la plantilla: especial, de opciones (con sus valores) o abierta (con sus largos)"""
+    descripcion = {}
+    for encabezado, tipo in COLUMNAS_ESPECIALES.items():
+        columna = buscar_columna(plantilla.columns, encabezado)
+        if columna is not None:
+            descripcion[columna] = ('especial', tipo)
+
+    for columna in plantilla.columns:
+        if columna in descripcion:
+            continue
+        valores = plantilla[columna].dropna()
+        valores = valores[valores.str.strip() != '']
+        if valores.empty:
+            descripcion[columna] = ('vacia', None)
+        elif valores.nunique() <= MAXIMO_OPCIONES and valores.str.len().mean() <= LARGO_MAXIMO_OPCION:
+            descripcion[columna] = ('opciones', valores.tolist())
+        else:
+            descripcion[columna] = ('abierta', valores.str.len().tolist())
+    return descripcion
+
+def generar_postulantes(filas, plantilla=None, semilla=0):
+    """Genera un DataFrame de ``filas`` postulantes sintéticos con las columnas de la plantilla
+
+    Los nombres son únicos para que cada fila produzca su propio perfil. Con la
+    misma semilla el resultado es siempre el mismo.
+    """
+    if plantilla is None:
+        plantilla = leer_plantilla()
+    aleatorio = random.Random(semilla)
+
+    descripcion = describir_columnas(plantilla)
+
+    # Vocabulario tomado solo de las respuestas abiertas reales (sin números, correos
+    # ni datos personales de otras columnas), para que el texto se parezca al original
+    abiertas = [columna for columna, (clase, _) in descripcion.items() if clase == 'abierta']
+    texto_real = ' '.join(plantilla[abiertas].fillna('').to_numpy().ravel())
+    vocabulario = re.findall(r'[^\W\d_]{3,}', texto_real) or ['respuesta']
+
+    nombres = [f"{aleatorio.choice(NOMBRES)} {aleatorio.choice(NOMBRES)} {i + 1}" for i in range(filas)]
+    apellidos = [f"{aleatorio.choice(APELLIDOS)} {aleatorio.choice(APELLIDOS)}" for _ in range(filas)]
+
+    comienzo = datetime(2025, 9, 1, 8, 0)
+    inicios = [comienzo + timedelta(minutes=aleatorio.randrange(60 * 24 * 10)) for _ in range(filas)]
+    fines = [inicio + timedelta(minutes=aleatorio.randrange(3, 45)) for inicio in inicios]
+
+    datos = {}
+    for columna, (clase, detalle) in descripcion.items():
+        if clase == 'especial':
+            if detalle == 'id':
+                valores = [str(i + 1) for i in range(filas)]
+            elif detalle == 'inicio':
+                valores = [momento.strftime('%d/%m/%Y %H:%M') for momento in inicios]
+            elif detalle == 'fin':
+                valores = [momento.strftime('%d/%m/%Y %H:%M') for momento in fines]
+            elif detalle == 'nombres':
+                valores = nombres
+            elif detalle == 'apellidos':
+                valores = apellidos
+            elif detalle == 'codigo':
+                valores = [f"20{aleatorio.randrange(19, 26)}{i:05d}{aleatorio.choice('ABCDEFGHIJ')}" for i in range(filas)]
+            elif detalle == 'correo':
+                valores = [f"{nombre.split()[0].lower()}.{i + 1}@uni.pe" for i, nombre in enumerate(nombres)]
+            else:
+                valores = [f"9{aleatorio.randrange(10 ** 8):08d}" for _ in range(filas)]
+        elif clase == 'opciones':
+            valores = aleatorio.choices(detalle, k=filas)
+        elif clase == 'abierta':
+            variantes = [_texto_aleatorio(aleatorio, vocabulario, int(aleatorio.choice(detalle) * aleatorio.uniform(0.5, 1.5)))
+                         for _ in range(VARIANTES_POR_COLUMNA)]
+            valores = aleatorio.choices(variantes, k=filas)
+        else:
+            valores = [None] * filas
+        datos[columna] = valores
+
+    return pd.DataFrame(datos, columns=list(plantilla.columns))
+
+def escribir_csv_sintetico(filas, ruta_salida, plantilla=None, semilla=0):
+    """Escribe un CSV sintético con el mismo formato que la exportación real (``;`` y BOM)"""
+    df = generar_postulantes(filas, plantilla, semilla)
+    df.to_csv(ruta_salida, sep=';', index=False, encoding='utf-8-sig')
+    return df
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("Uso: python datos_sinteticos.py <filas> <archivo_salida.csv>")
+        sys.exit(1)
+    filas = int(sys.argv[1])
+    escribir_csv_sintetico(filas, sys.argv[2])
+    print(f"✅ CSV sintético generado: {sys.argv[2]} ({filas} postulantes)")
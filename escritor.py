@@ -0,0 +1,107 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from instrumentacion import al_cerrar_etapa, contar, etapa_actual, registrar_error, sumar
+
+# Escritura de todas las salidas de texto. Cada archivo se escribe con un nombre
+# temporal y se renombra encima del anterior, así nunca queda una página a medias.
+# Con PAM_HILOS_ESCRITURA > 1 (4 por defecto) las escrituras se encolan en un pool
+# de hilos acotado y el renderizado sigue mientras tanto: en un disco de red, donde
+# lo que manda es la latencia por archivo, varias escrituras en vuelo se solapan.
+# Al cerrar cada etapa se espera a que terminen sus escrituras, así la etapa
+# siguiente (p. ej. los enlaces por área) ya encuentra los archivos en el disco.
+
+HILOS_ESCRITURA = int(os.environ.get('PAM_HILOS_ESCRITURA', '4'))
+ESCRITURAS_EN_VUELO = 64  # Máximo de archivos encolados por hilo: acota la memoria
+
+_pool = None
+_cupos = None
+_pendientes = {}  # ruta → futuro de su última escritura encolada (protegido por _cerrojo)
+_fallidas = []  # Rutas que no se pudieron escribir desde la última espera
+_cerrojo = threading.Lock()
+
+def reemplazar_archivo(ruta_archivo, contenido):
+    """Escribe ``contenido`` en un temporal y lo renombra a ``ruta_archivo`` en este mismo hilo
+
+    Para archivos chicos que se leen enseguida (manifiestos, metadatos del caché,
+    informe): quien los lea ve la versión anterior o la nueva, nunca una a medias.
+    Si falla, borra el temporal y relanza el OSError.
+    """
+    temporal = f"{ruta_archivo}.{threading.get_ident()}.tmp"
+    try:
+        with open(temporal, 'w', encoding='utf-8') as f:
+            f.write(contenido)
+        os.replace(temporal, ruta_archivo)
+    except OSError:
+        if os.path.lexists(temporal):
+            os.remove(temporal)
+        raise
+
+def _escribir(ruta_archivo, contenido, registro):
+    """Escribe ``ruta_archivo`` de forma atómica; los errores se anotan en ``registro`` y en las rutas fallidas"""
+    inicio = time.perf_counter()
+    try:
+        reemplazar_archivo(ruta_archivo, contenido)
+    except OSError as e:
+        with _cerrojo:
+            _fallidas.append(ruta_archivo)
+        registrar_error(f"{ruta_archivo}: {e}", registro)
+        print(f"❌ Error al escribir {ruta_archivo}: {e}")
+    finally:
+        sumar(registro, 'segundos_escritura', time.perf_counter() - inicio)
+
+def _escribir_en_hilo(ruta_archivo, contenido, registro, anterior):
+    try:
+        # Dos escrituras de la misma ruta no pueden adelantarse: gana siempre la última.
+        # La anterior se encoló antes, así que ya está en otro hilo o terminó.
+        if anterior is not None:
+            anterior.result()
+        _escribir(ruta_archivo, contenido, registro)
+    finally:
+        _cupos.release()
+
+def escribir_archivo(ruta_archivo, contenido):
+    """Escribe un archivo de texto en UTF-8 de forma atómica y lo cuenta en la etapa actual
+
+    Con hilos de escritura el archivo se encola y la función vuelve enseguida; si
+    ya hay demasiados archivos en vuelo, espera a que se libere un lugar. Se
+    puede llamar desde varios hilos a la vez. Los errores se informan al esperar
+    (ver esperar_escrituras).
+    """
+    global _pool, _cupos
+    registro = etapa_actual()
+    contar('archivos_escritos')
+    contar('bytes_escritos', len(contenido.encode('utf-8')))
+    if HILOS_ESCRITURA <= 1:
+        _escribir(ruta_archivo, contenido, registro)
+        return
+
+    with _cerrojo:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(max_workers=HILOS_ESCRITURA, thread_name_prefix='escritor')
+            _cupos = threading.BoundedSemaphore(HILOS_ESCRITURA * ESCRITURAS_EN_VUELO)
+
+    # El cupo se toma fuera del cerrojo: los hilos de escritura lo necesitan para terminar
+    _cupos.acquire()
+    with _cerrojo:
+        anterior = _pendientes.get(ruta_archivo)
+        _pendientes[ruta_archivo] = _pool.submit(_escribir_en_hilo, ruta_archivo, contenido, registro, anterior)
+
+def esperar_escrituras():
+    """Espera a que terminen las escrituras encoladas y devuelve las rutas que fallaron desde la última espera"""
+    with _cerrojo:
+        futuros = list(_pendientes.values())
+    for futuro in futuros:
+        futuro.result()
+    with _cerrojo:
+        # Solo se olvidan las terminadas: otro hilo pudo encolar más mientras se esperaba
+        for ruta_archivo, futuro in list(_pendientes.items()):
+            if futuro.done():
+                del _pendientes[ruta_archivo]
+        fallidas = list(_fallidas)
+        _fallidas.clear()
+    return fallidas
+
+al_cerrar_etapa(esperar_escrituras)
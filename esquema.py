@@ -0,0 +1,100 @@
+import re
+import unicodedata
+from collections import namedtuple
+
+# Preguntas del formulario en el orden en que se muestran en el perfil.
+# Las claves son los encabezados tal como los exporta el formulario: pueden venir
+# con saltos de línea, espacios no separables o truncados.
+PREGUNTAS = [
+    ('Ronda', '🗓️ Ronda'),  # Solo en el modo por lotes (lotes.py)
+    ('Código Universitario:\n', '🎓 Código Universitario'),
+    ('Ciclo Relativo', '📚 Ciclo Relativo'),
+    ('Correo Electrónico:\n', '📧 Correo Electrónico'),
+    ('Teléfono (WhatsApp):\n', '📱 Teléfono (WhatsApp)'),
+    ('¿Qué piensas que hacemos en ACECOM?\n', '🤔 ¿Qué piensas que hacemos en ACECOM?'),
+    ('¿Como consideras que ACECOM puede mejorar para ser más atractivo para la población estudiantil de la facultad?', '💡 ¿Cómo consideras que ACECOM puede mejorar para ser más atractivo para la población estudiantil de la facultad?'),
+    ('Dentro del contexto de mejora ¿Siendo tu parte de ACECOM que acciones tomarías para mejorar esta situación? \n', '🚀 Dentro del contexto de mejora ¿Siendo tu parte de ACECOM qué acciones tomarías para mejorar esta situación?'),
+    ('¿Qué te motiva a unirte a ACECOM y no a otro grupo estudiantil? ¿Qué esperas aportar y qué esperas aprender aquí?', '💪 ¿Qué te motiva a unirte a ACECOM y no a otro grupo estudiantil? ¿Qué esperas aportar y qué esperas aprender aquí?'),
+    ('Cuéntanos sobre un proyecto PERSONAL (no un curso) que hayas iniciado por tu cuenta. Puede ser de programación, investigación, un blog, un negocio, etc. Describe qué te impulsó a empezarlo, qué desafí', '🛠️ Cuéntanos sobre un proyecto PERSONAL que hayas iniciado por tu cuenta'),
+    ('Fuera de las clases obligatorias de la universidad, ¿qué estás aprendiendo por tu cuenta actualmente? (Ej: un lenguaje de programación, un framework, sobre inteligencia artificial, etc.). ¿Qué recurso', '📖 ¿Qué estás aprendiendo por tu cuenta actualmente?'),
+    ('Menciona un blog, canal de YouTube, perfil de LinkedIn o libro técnico que hayas encontrado últimamente y que te haya parecido interesante. Explícanos por qué lo recomendarías.\n', '🌐 Menciona un recurso técnico que hayas encontrado últimamente y que te haya parecido interesante'),
+    ('¿A qué área de ACECOM te gustaría postular? Principal interes.\n', '🎯 ¿A qué área de ACECOM te gustaría postular? (Principal interés)'),
+    ('Segunda opción de área', '🎯 Segunda opción de área'),
+    ('Áreas de interés adicionales', '🎯 Áreas de interés adicionales'),
+    ('Nuestro reglamento exige a los miembros un compromiso activo, medido por un sistema de puntos mínimo bimestral. ¿Crees que podrás gestionar este compromiso adicional a tu carga académica?\n\n', '⚖️ ¿Crees que podrás gestionar el compromiso adicional a tu carga académica?'),
+]
+
+# Columnas administrativas y las que el perfil ya muestra aparte (nombre completo)
+COLUMNAS_OMITIDAS = ['Id', 'Hora de inicio', 'Hora de finalización', 'Nombre', 'Correo electrónico', 'Nombres:\n', 'Apellidos:']
+
+# Largo mínimo para aceptar que un encabezado es la versión truncada de otro
+LARGO_MINIMO_PREFIJO = 20
+
+ColumnaEsquema = namedtuple('ColumnaEsquema', ['posicion', 'nombre', 'titulo', 'omitir', 'orden'])
+
+def normalizar_encabezado(encabezado):
+    """Normaliza un encabezado para compararlo: espacios no separables, saltos de línea y espacios extra"""
+    encabezado = unicodedata.normalize('NFKC', str(encabezado))
+    return re.sub(r'\s+', ' ', encabezado).strip()
+
+def coinciden_encabezados(encabezado_a, encabezado_b):
+    """Compara dos encabezados ya normalizados tolerando que uno esté truncado"""
+    if encabezado_a == encabezado_b:
+        return True
+    corto, largo = sorted([encabezado_a, encabezado_b], key=len)
+    return len(corto) >= LARGO_MINIMO_PREFIJO and largo.startswith(corto)
+
+def buscar_columna(columnas, encabezado):
+    """Devuelve el nombre real de la columna del CSV que corresponde a ``encabezado`` (o None)"""
+    buscado = normalizar_encabezado(encabezado)
+    for columna in columnas:
+        if coinciden_encabezados(normalizar_encabezado(columna), buscado):
+            return columna
+    return None
+
+class EsquemaPreguntas:
+    """Esquema de preguntas compilado para un CSV concreto
+
+    Resuelve una sola vez cada columna (por posición) a su título legible, si se
+    omite del perfil y su orden. ``renderizables`` es la lista ya ordenada de
+    (nombre_columna, titulo) que el perfil debe mostrar.
+    """
+
+    def __init__(self, columnas):
+        preguntas = [(normalizar_encabezado(encabezado), titulo) for encabezado, titulo in PREGUNTAS]
+        omitidas = [normalizar_encabezado(encabezado) for encabezado in COLUMNAS_OMITIDAS]
+
+        self.columnas = []
+        for posicion, nombre in enumerate(columnas):
+            normalizado = normalizar_encabezado(nombre)
+            omitir = normalizado in omitidas
+
+            titulo, orden = nombre, len(preguntas) + posicion  # Columnas desconocidas al final
+            for orden_pregunta, (encabezado, titulo_pregunta) in enumerate(preguntas):
+                if coinciden_encabezados(normalizado, encabezado):
+                    titulo, orden = titulo_pregunta, orden_pregunta
+                    break
+
+            self.columnas.append(ColumnaEsquema(posicion, nombre, titulo, omitir, orden))
+
+        self.renderizables = [
+            (columna.nombre, columna.titulo)
+            for columna in sorted(self.columnas, key=lambda c: (c.orden, c.posicion))
+            if not columna.omitir
+        ]
+        self._resueltas = {}
+
+    def columna_de(self, encabezado):
+        """Nombre real de la columna que corresponde a ``encabezado`` (o None), resuelto una sola vez"""
+        if encabezado not in self._resueltas:
+            self._resueltas[encabezado] = buscar_columna([columna.nombre for columna in self.columnas], encabezado)
+        return self._resueltas[encabezado]
+
+_esquemas = {}
+
+def compilar_esquema(columnas):
+    """Devuelve el esquema compilado para estas columnas, reutilizándolo durante la ejecución"""
+    clave = tuple(columnas)
+    if clave not in _esquemas:
+        _esquemas[clave] = EsquemaPreguntas(clave)
+    return _esquemas[clave]
@@ -0,0 +1,267 @@
+import glob
+import hashlib
+import os
+
+from escritor import escribir_archivo
+
+# Estilos de todas las páginas generadas. Cada tipo de página marca su <body> con
+# una clase (pagina-perfil, pagina-area, pagina-general) para que las reglas de
+# una no afecten a las otras dentro de la misma hoja compartida.
+
+# Perfiles individuales y lista de perfiles (perfiles_html/)
+CSS_PERFILES = """
+body.pagina-perfil {
+    font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+    max-width: 800px;
+    margin: 0 auto;
+    padding: 20px;
+    line-height: 1.6;
+    background-color: #f8f9fa;
+}
+.pagina-perfil .container {
+    background: white;
+    padding: 30px;
+    border-radius: 10px;
+    box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+}
+.pagina-perfil h1 {
+    color: #2c3e50;
+    border-bottom: 3px solid #3498db;
+    padding-bottom: 10px;
+}
+.pagina-perfil h2 {
+    color: #34495e;
+    margin-top: 25px;
+    margin-bottom: 10px;
+    padding: 8px 15px;
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    color: white;
+    border-radius: 5px;
+}
+.pagina-perfil p {
+    margin-bottom: 15px;
+    text-align: justify;
+}
+.pagina-perfil hr {
+    border: none;
+    height: 2px;
+    background: linear-gradient(to right, #3498db, #e74c3c);
+    margin: 20px 0;
+}
+.pagina-perfil .nav-buttons {
+    text-align: center;
+    margin: 20px 0;
+}
+.pagina-perfil .nav-button {
+    display: inline-block;
+    padding: 10px 20px;
+    margin: 5px;
+    background: #3498db;
+    color: white;
+    text-decoration: none;
+    border-radius: 5px;
+    transition: background 0.3s;
+}
+.pagina-perfil .nav-button:hover {
+    background: #2980b9;
+}
+.pagina-perfil .buscador input {
+    width: 100%;
+    box-sizing: border-box;
+    padding: 10px 15px;
+    font-size: 1em;
+    border: 2px solid #3498db;
+    border-radius: 5px;
+}
+.pagina-perfil .buscador .resultado {
+    margin: 5px 0;
+    text-align: left;
+}
+.pagina-perfil .buscador .resultado .nav-button {
+    display: inline;
+    padding: 5px 10px;
+    margin: 2px;
+}
+"""
+
+# Índice de cada área (perfiles_por_area_html/<área>/index.html)
+CSS_INDICE_AREA = """
+body.pagina-area {
+    font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+    max-width: 900px;
+    margin: 0 auto;
+    padding: 20px;
+    line-height: 1.6;
+    background-color: #f8f9fa;
+}
+.pagina-area .container {
+    background: white;
+    padding: 30px;
+    border-radius: 10px;
+    box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+}
+.pagina-area h1 {
+    color: #2c3e50;
+    border-bottom: 3px solid #3498db;
+    padding-bottom: 10px;
+    text-align: center;
+}
+.pagina-area h2 {
+    color: #34495e;
+    margin-top: 25px;
+    margin-bottom: 15px;
+}
+.pagina-area .area-header {
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    color: white;
+    padding: 15px;
+    border-radius: 8px;
+    text-align: center;
+    margin-bottom: 20px;
+}
+.pagina-area .candidatos-grid {
+    display: grid;
+    grid-template-columns: repeat(auto-fill, minmax(250px, 1fr));
+    gap: 15px;
+    margin: 20px 0;
+}
+.pagina-area .candidato-card {
+    background: #f8f9fa;
+    padding: 15px;
+    border-radius: 8px;
+    border-left: 4px solid #3498db;
+    transition: transform 0.2s;
+}
+.pagina-area .candidato-card:hover {
+    transform: translateY(-2px);
+    box-shadow: 0 4px 8px rgba(0,0,0,0.1);
+}
+.pagina-area .nav-button {
+    display: inline-block;
+    padding: 10px 20px;
+    margin: 5px;
+    background: #3498db;
+    color: white;
+    text-decoration: none;
+    border-radius: 5px;
+    transition: background 0.3s;
+}
+.pagina-area .nav-button:hover {
+    background: #2980b9;
+}
+.pagina-area .nav-buttons {
+    text-align: center;
+    margin: 20px 0;
+}
+.pagina-area .stats {
+    background: #e8f4fd;
+    padding: 15px;
+    border-radius: 8px;
+    margin: 20px 0;
+    text-align: center;
+}
+"""
+
+# Índice general por áreas (perfiles_por_area_html/index_general.html)
+CSS_INDICE_GENERAL = """
+body.pagina-general {
+    font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+    max-width: 1000px;
+    margin: 0 auto;
+    padding: 20px;
+    line-height: 1.6;
+    background-color: #f8f9fa;
+}
+.pagina-general .container {
+    background: white;
+    padding: 30px;
+    border-radius: 10px;
+    box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+}
+.pagina-general h1 {
+    color: #2c3e50;
+    border-bottom: 3px solid #3498db;
+    padding-bottom: 10px;
+    text-align: center;
+}
+.pagina-general .areas-grid {
+    display: grid;
+    grid-template-columns: repeat(auto-fill, minmax(300px, 1fr));
+    gap: 20px;
+    margin: 30px 0;
+}
+.pagina-general .area-card {
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    color: white;
+    padding: 25px;
+    border-radius: 10px;
+    text-align: center;
+    transition: transform 0.3s;
+    box-shadow: 0 4px 8px rgba(0,0,0,0.1);
+}
+.pagina-general .area-card:hover {
+    transform: translateY(-5px);
+    box-shadow: 0 8px 16px rgba(0,0,0,0.2);
+}
+.pagina-general .area-title {
+    font-size: 1.3em;
+    font-weight: bold;
+    margin-bottom: 10px;
+}
+.pagina-general .area-count {
+    font-size: 2em;
+    font-weight: bold;
+    margin: 15px 0;
+}
+.pagina-general .nav-button {
+    display: inline-block;
+    padding: 10px 20px;
+    margin: 10px 5px;
+    background: rgba(255,255,255,0.2);
+    color: white;
+    text-decoration: none;
+    border-radius: 5px;
+    transition: background 0.3s;
+}
+.pagina-general .nav-button:hover {
+    background: rgba(255,255,255,0.3);
+}
+.pagina-general .stats-summary {
+    background: #e8f4fd;
+    padding: 20px;
+    border-radius: 8px;
+    margin: 20px 0;
+    text-align: center;
+}
+.pagina-general .total-stat {
+    font-size: 1.5em;
+    color: #2c3e50;
+    font-weight: bold;
+}
+"""
+
+CSS_COMPARTIDO = CSS_PERFILES + CSS_INDICE_AREA + CSS_INDICE_GENERAL
+
+# El nombre depende del contenido: si cambia el CSS cambia el nombre y los
+# navegadores y proxies pueden cachear cada versión sin caducidad
+HOJA_ESTILOS = f"estilos-{hashlib.sha256(CSS_COMPARTIDO.encode('utf-8')).hexdigest()[:12]}.css"
+
+def enlace_estilos(prefijo=''):
+    """Etiqueta <link> hacia la hoja de estilos compartida (``prefijo`` es la ruta relativa a su carpeta)"""
+    return f'<link rel="stylesheet" href="{prefijo}{HOJA_ESTILOS}">'
+
+def escribir_hoja_estilos(carpeta):
+    """Escribe la hoja de estilos compartida en ``carpeta`` y borra versiones anteriores
+    
+    Como el nombre incluye el hash del contenido, si el archivo ya existe no se
+    vuelve a escribir.
+    """
+    os.makedirs(carpeta, exist_ok=True)
+    for anterior in glob.glob(os.path.join(carpeta, 'estilos-*.css')):
+        if os.path.basename(anterior) != HOJA_ESTILOS:
+            os.remove(anterior)
+    
+    ruta = os.path.join(carpeta, HOJA_ESTILOS)
+    if not os.path.exists(ruta):
+        escribir_archivo(ruta, CSS_COMPARTIDO)
+    return ruta
@@ -0,0 +1,140 @@
+import os
+import re
+
+from añadir_indicadores import LEYENDA, obtener_indicador
+from esquema import compilar_esquema, normalizar_encabezado
+from instrumentacion import etapa, guardar_informe, registrar_error, registrar_escritura
+from organizador import ARCHIVO_CSV, TAMANO_BLOQUE, postulantes_vigentes
+from organizar_por_areas import COLUMNA_AREA, limpiar_nombre_area
+
+# Exporta la tabla limpia de postulantes a resultados_ordenados.xlsx (el Excel que
+# enlaza el índice general por áreas): una hoja por área y una hoja de resumen.
+# El libro se escribe en el modo de solo escritura de openpyxl, que vuelca cada fila
+# al disco al agregarla; junto con la lectura por bloques, la memoria no depende
+# del tamaño de la tabla (solo se recuerda qué envío gana para cada postulante).
+
+ARCHIVO_EXCEL = 'resultados_ordenados.xlsx'
+HOJA_RESUMEN = 'Resumen'
+COLUMNA_DISPONIBILIDAD = 'Disponibilidad'
+COLUMNA_ID = 'ID'
+LARGO_MAXIMO_HOJA = 31  # Límite de Excel para el nombre de una hoja
+
+_CARACTERES_INVALIDOS_HOJA = re.compile(r'[\[\]:*?/\\]')
+# Caracteres de control que Excel no admite dentro de una celda
+_CARACTERES_DE_CONTROL = re.compile(r'[\000-\010\013\014\016-\037]')
+
+def nombre_hoja(area, usados):
+    """Nombre de hoja válido y único para un área (máximo 31 caracteres, sin []:*?/\\)"""
+    base = _CARACTERES_INVALIDOS_HOJA.sub('_', area).strip("' ")[:LARGO_MAXIMO_HOJA] or 'Sin especificar'
+    nombre = base
+    numero = 2
+    while nombre.casefold() in usados:
+        sufijo = f" ({numero})"
+        nombre = base[:LARGO_MAXIMO_HOJA - len(sufijo)] + sufijo
+        numero += 1
+    usados.add(nombre.casefold())
+    return nombre
+
+def _valor_celda(valor):
+    """Texto de una respuesta apto para una celda (None queda como celda vacía)"""
+    if valor is None or valor != valor:  # NaN
+        return None
+    return _CARACTERES_DE_CONTROL.sub('', str(valor))
+
+def _celda_texto(hoja, valor):
+    """Celda de texto literal para un valor que viene del formulario (None queda como celda vacía)
+
+    openpyxl escribe como fórmula todo texto que empieza con '=': una respuesta
+    como '=HYPERLINK(...)' se ejecutaría al abrir el Excel. Forzar el tipo texto
+    la guarda tal cual la escribió el postulante.
+    """
+    from openpyxl.cell import WriteOnlyCell
+
+    texto = _valor_celda(valor)
+    if texto is None:
+        return None
+    celda = WriteOnlyCell(hoja, texto)
+    celda.data_type = 's'
+    return celda
+
+def escribir_excel(postulantes, archivo_salida=ARCHIVO_EXCEL):
+    """Escribe los postulantes en un libro con una hoja por área
+
+    ``postulantes`` es un iterable de (id, nombre_persona, fila) con el último
+    envío de cada postulante, en el orden del CSV (ver postulantes_vigentes y
+    AlmacenPostulantes.postulantes_en_orden), y se consume una sola vez, fila a
+    fila. Cada hoja de área tiene la fila de encabezados, la disponibilidad y el
+    ID de cada postulante y todas sus respuestas. La hoja de resumen va primero,
+    con los candidatos por área y por indicador. Devuelve un dict área →
+    cantidad de candidatos.
+    """
+    # Importación diferida: solo este paso necesita openpyxl
+    from openpyxl import Workbook
+
+    libro = Workbook(write_only=True)
+    resumen = libro.create_sheet(HOJA_RESUMEN)
+    usados = {HOJA_RESUMEN.casefold()}
+    hojas = {}
+    conteos = {}
+    esquema = columna_area = encabezados = None
+
+    for id_postulante, _, fila in postulantes:
+        if esquema is None:
+            esquema = compilar_esquema(fila.keys())
+            columna_area = esquema.columna_de(COLUMNA_AREA)
+            encabezados = [COLUMNA_DISPONIBILIDAD, COLUMNA_ID] + [normalizar_encabezado(columna) for columna in fila]
+
+        area = limpiar_nombre_area(fila.get(columna_area) if columna_area else None)
+        if area not in hojas:
+            hoja = libro.create_sheet(nombre_hoja(area, usados))
+            hoja.freeze_panes = 'A2'
+            hoja.append([_celda_texto(hoja, encabezado) for encabezado in encabezados])
+            hojas[area] = hoja
+            conteos[area] = dict.fromkeys(LEYENDA, 0)
+
+        indicador = obtener_indicador(fila, esquema)
+        conteos[area][indicador] += 1
+        hoja = hojas[area]
+        hoja.append([indicador, _celda_texto(hoja, id_postulante)] + [_celda_texto(hoja, valor) for valor in fila.values()])
+
+    resumen.append(['Área', 'Hoja', 'Candidatos'] + [f"{indicador} {descripcion}" for indicador, descripcion in LEYENDA.items()])
+    for area, por_indicador in sorted(conteos.items(), key=lambda x: sum(x[1].values()), reverse=True):
+        resumen.append([_celda_texto(resumen, area), hojas[area].title, sum(por_indicador.values())] + list(por_indicador.values()))
+    resumen.append(['Total', None, sum(sum(por_indicador.values()) for por_indicador in conteos.values())]
+                   + [sum(por_indicador[indicador] for por_indicador in conteos.values()) for indicador in LEYENDA])
+
+    # Se guarda con otro nombre y se reemplaza, para no dejar un Excel a medias
+    temporal = archivo_salida + '.tmp'
+    libro.save(temporal)
+    os.replace(temporal, archivo_salida)
+    registrar_escritura(archivo_salida)
+
+    return {area: sum(por_indicador.values()) for area, por_indicador in conteos.items()}
+
+def exportar_excel(archivo_csv=ARCHIVO_CSV, archivo_salida=ARCHIVO_EXCEL, usar_cache=True, tamano_bloque=TAMANO_BLOQUE):
+    """Exporta los postulantes del CSV a ``archivo_salida`` leyendo por bloques
+
+    Devuelve cuántos postulantes se exportaron, o None si no se pudo leer el CSV
+    o escribir el Excel.
+    """
+    with etapa('excel'):
+        try:
+            por_area = escribir_excel(postulantes_vigentes(archivo_csv, tamano_bloque, usar_cache), archivo_salida)
+        except FileNotFoundError:
+            registrar_error(f"No se encontró el archivo '{archivo_csv}'")
+            print(f"❌ Error: No se encontró el archivo '{archivo_csv}'.")
+            return None
+        except (ValueError, PermissionError) as e:
+            registrar_error(str(e))
+            print(f"❌ Error al exportar el Excel: {e}")
+            return None
+
+        total = sum(por_area.values())
+        print(f"📊 Excel generado: {archivo_salida} ({total} postulantes)")
+        for area, candidatos in sorted(por_area.items(), key=lambda x: x[1], reverse=True):
+            print(f"   • {area}: {candidatos} candidatos")
+        return total
+
+if __name__ == "__main__":
+    exportar_excel()
+    guardar_informe()
@@ -0,0 +1,276 @@
+import glob
+import json
+import os
+import re
+import unicodedata
+from collections import defaultdict
+
+from esquema import PREGUNTAS
+from escritor import escribir_archivo
+
+# Índice de búsqueda precalculado para perfiles_html/index.html: un índice invertido
+# (palabra → postulantes) sobre nombres, código, áreas y respuestas, repartido en
+# fragmentos según las primeras letras de cada palabra. El navegador carga solo los
+# fragmentos de las palabras que se buscan, sin abrir ninguna página de perfil.
+#
+# Los fragmentos son JSON envuelto en una llamada (busqueda/fragmento-<clave>.js) para
+# que se puedan cargar con <script> también al abrir el índice como file://, donde
+# el navegador no permite leer archivos .json con fetch().
+
+# Subir esta versión cada vez que cambie el formato del índice o el script del buscador
+VERSION_BUSQUEDA = '1'
+CARPETA_BUSQUEDA = 'busqueda'
+LARGO_FRAGMENTO = 2  # Letras iniciales que deciden en qué fragmento va cada palabra
+LARGO_MINIMO_PALABRA = 2
+
+# Palabras demasiado frecuentes para servir de filtro (ya sin tildes)
+PALABRAS_VACIAS = {
+    'al', 'como', 'con', 'de', 'del', 'el', 'en', 'es', 'la', 'las', 'le', 'lo', 'los', 'me', 'mi', 'mas',
+    'no', 'por', 'para', 'pero', 'que', 'se', 'si', 'su', 'sus', 'un', 'una', 'y', 'ya', 'yo', 'o', 'a',
+}
+
+_TITULOS = dict(PREGUNTAS)
+TITULO_CODIGO = _TITULOS['Código Universitario:\n']
+TITULOS_AREA = [_TITULOS['¿A qué área de ACECOM te gustaría postular? Principal interes.\n'],
+                _TITULOS['Segunda opción de área'], _TITULOS['Áreas de interés adicionales']]
+# Datos de contacto: se muestran en el perfil pero no se indexan
+TITULOS_SIN_INDICE = {_TITULOS['Correo Electrónico:\n'], _TITULOS['Teléfono (WhatsApp):\n']}
+TITULO_NOMBRE_COMPLETO = '👤 Nombre Completo'
+
+def normalizar_texto(texto):
+    """Pasa un texto a minúsculas y sin tildes (igual que el buscador en el navegador)"""
+    descompuesto = unicodedata.normalize('NFKD', str(texto))
+    return ''.join(c for c in descompuesto if not unicodedata.combining(c)).lower()
+
+def tokenizar(texto):
+    """Devuelve las palabras indexables de un texto, normalizadas y sin palabras vacías"""
+    return [palabra for palabra in re.findall(r'[a-z0-9]+', normalizar_texto(texto))
+            if len(palabra) >= LARGO_MINIMO_PALABRA and palabra not in PALABRAS_VACIAS]
+
+def secciones_de_registro(persona_data, esquema):
+    """Secciones (título, respuesta) del perfil de un registro, en el orden de generar_perfil_md"""
+    secciones = []
+    nombres = persona_data.get('Nombres:\n', '')
+    apellidos = persona_data.get('Apellidos:', '')
+    if nombres and apellidos:
+        secciones.append((TITULO_NOMBRE_COMPLETO, f"{nombres} {apellidos}"))
+    for columna, titulo_pregunta in esquema.renderizables:
+        valor = persona_data.get(columna)
+        if valor:
+            secciones.append((titulo_pregunta, valor))
+    return secciones
+
+def secciones_de_md(contenido_md):
+    """Secciones (título, respuesta) de un perfil Markdown generado por organizador.py"""
+    secciones = []
+    for bloque in contenido_md.split('\n\n---\n\n'):
+        bloque = bloque.strip()
+        if bloque.startswith('## ') and '\n\n' in bloque:
+            titulo, valor = bloque[3:].split('\n\n', 1)
+            secciones.append((titulo.strip(), valor.strip()))
+    return secciones
+
+def crear_documento(nombre_archivo, nombre_persona, indicador, secciones):
+    """Resume un perfil para el índice: datos a mostrar en los resultados y texto a indexar"""
+    por_titulo = dict(secciones)
+    return {
+        'archivo': nombre_archivo,
+        'nombre': nombre_persona,
+        'indicador': indicador or '',
+        'codigo': por_titulo.get(TITULO_CODIGO, ''),
+        'areas': [por_titulo[titulo] for titulo in TITULOS_AREA if por_titulo.get(titulo)],
+        'texto': ' '.join(valor for titulo, valor in secciones if titulo not in TITULOS_SIN_INDICE),
+    }
+
+def construir_indice(documentos):
+    """Construye el índice invertido repartido por fragmentos: {clave: {palabra: [posiciones]}}"""
+    fragmentos = defaultdict(dict)
+    for posicion, documento in enumerate(documentos):
+        palabras = set(tokenizar(documento['nombre']))
+        palabras.update(tokenizar(documento['texto']))
+        for palabra in palabras:
+            fragmentos[palabra[:LARGO_FRAGMENTO]].setdefault(palabra, []).append(posicion)
+    return {clave: dict(sorted(palabras.items())) for clave, palabras in sorted(fragmentos.items())}
+
+def nombre_fragmento(clave):
+    """Nombre del archivo de un fragmento (la clave en hexadecimal, como lo calcula el navegador)"""
+    return f"fragmento-{clave.encode('utf-8').hex()}.js"
+
+def _compacto(datos):
+    return json.dumps(datos, ensure_ascii=False, separators=(',', ':'))
+
+def archivos_indice_busqueda(documentos):
+    """Contenido de cada archivo del índice de búsqueda como {archivo: js}
+
+    ``documentos`` se crea con crear_documento, en el orden en que deben aparecer
+    los resultados a igual relevancia.
+    """
+    archivos = {}
+    for clave, palabras in construir_indice(documentos).items():
+        archivos[nombre_fragmento(clave)] = f"PAM_BUSQUEDA.fragmento({_compacto(clave)},{_compacto(palabras)});\n"
+
+    configuracion = {
+        'largo_fragmento': LARGO_FRAGMENTO,
+        'largo_minimo': LARGO_MINIMO_PALABRA,
+        'palabras_vacias': sorted(PALABRAS_VACIAS),
+        'documentos': [[documento['archivo'], documento['nombre'], documento['indicador'], documento['codigo'],
+                        ', '.join(documento['areas'])] for documento in documentos],
+    }
+    archivos['documentos.js'] = f"PAM_BUSQUEDA.iniciar({_compacto(configuracion)});\n"
+    archivos['buscador.js'] = SCRIPT_BUSCADOR
+    return archivos
+
+def escribir_indice_busqueda(carpeta_html, documentos):
+    """Escribe el índice de búsqueda en ``carpeta_html``/busqueda y borra los fragmentos que sobran
+
+    Devuelve cuántos fragmentos se escribieron (ver archivos_indice_busqueda).
+    """
+    carpeta = os.path.join(carpeta_html, CARPETA_BUSQUEDA)
+    os.makedirs(carpeta, exist_ok=True)
+
+    archivos = archivos_indice_busqueda(documentos)
+    for archivo, contenido in archivos.items():
+        if archivo.startswith('fragmento-'):
+            escribir_archivo(os.path.join(carpeta, archivo), contenido)
+
+    for anterior in glob.glob(os.path.join(carpeta, 'fragmento-*.js')):
+        if os.path.basename(anterior) not in archivos:
+            os.remove(anterior)
+
+    escribir_archivo(os.path.join(carpeta, 'documentos.js'), archivos['documentos.js'])
+    escribir_archivo(os.path.join(carpeta, 'buscador.js'), archivos['buscador.js'])
+    return len(archivos) - 2
+
+def indice_busqueda_existe(carpeta_html):
+    """Indica si ya hay un índice de búsqueda escrito en la carpeta"""
+    return os.path.exists(os.path.join(carpeta_html, CARPETA_BUSQUEDA, 'documentos.js'))
+
+def html_buscador(prefijo=''):
+    """Caja de búsqueda y scripts para una página índice (``prefijo`` es la ruta hasta perfiles_html/)"""
+    return f"""
+            <div class="buscador">
+                <input type="search" id="buscador-consulta" placeholder="🔎 Buscar por nombre, código, área o respuesta..." autocomplete="off" data-prefijo="{prefijo}">
+                <p id="buscador-estado"></p>
+                <div id="buscador-resultados"></div>
+            </div>
+            <script src="{prefijo}{CARPETA_BUSQUEDA}/buscador.js"></script>
+            <script src="{prefijo}{CARPETA_BUSQUEDA}/documentos.js"></script>
+    """
+
+# Buscador en el navegador: normaliza la consulta como tokenizar(), carga los
+# fragmentos que necesita y cruza las listas de postulantes de cada palabra.
+# Cada palabra de la consulta se trata como prefijo ("progr" encuentra "programacion").
+SCRIPT_BUSCADOR = """var PAM_BUSQUEDA = (function () {
+    var config = null, fragmentos = {}, cargando = {}, prefijo = '', entrada, estado, resultados;
+    var MAXIMO_RESULTADOS = 50;
+
+    function normalizar(texto) {
+        return texto.normalize('NFKD').replace(/[\\u0300-\\u036f]/g, '').toLowerCase();
+    }
+
+    function tokenizar(texto) {
+        return (normalizar(texto).match(/[a-z0-9]+/g) || []).filter(function (palabra) {
+            return palabra.length >= config.largo_minimo && config.palabras_vacias.indexOf(palabra) < 0;
+        });
+    }
+
+    function hex(texto) {
+        return Array.prototype.map.call(new TextEncoder().encode(texto), function (byte) {
+            return ('0' + byte.toString(16)).slice(-2);
+        }).join('');
+    }
+
+    function cargarFragmento(clave) {
+        if (cargando[clave]) { return; }
+        cargando[clave] = true;
+        var script = document.createElement('script');
+        script.src = prefijo + 'busqueda/fragmento-' + hex(clave) + '.js';
+        script.onerror = function () { fragmentos[clave] = {}; buscar(); };  // Sin palabras con ese inicio
+        document.head.appendChild(script);
+    }
+
+    function coincidencias(palabra) {
+        var fragmento = fragmentos[palabra.slice(0, config.largo_fragmento)];
+        var encontrados = {};
+        Object.keys(fragmento).forEach(function (clave) {
+            if (clave.lastIndexOf(palabra, 0) === 0) {
+                fragmento[clave].forEach(function (posicion) {
+                    encontrados[posicion] = Math.max(encontrados[posicion] || 0, clave === palabra ? 2 : 1);
+                });
+            }
+        });
+        return encontrados;
+    }
+
+    function mostrar(puntajes) {
+        resultados.textContent = '';
+        var posiciones = Object.keys(puntajes).map(Number).sort(function (a, b) {
+            return puntajes[b] - puntajes[a] || a - b;
+        });
+        estado.textContent = posiciones.length + ' resultado(s)' +
+            (posiciones.length > MAXIMO_RESULTADOS ? ', se muestran los primeros ' + MAXIMO_RESULTADOS : '');
+        posiciones.slice(0, MAXIMO_RESULTADOS).forEach(function (posicion) {
+            var documento = config.documentos[posicion];
+            var parrafo = document.createElement('p');
+            parrafo.className = 'resultado';
+            var enlace = document.createElement('a');
+            enlace.href = prefijo + documento[0] + '.html';
+            enlace.className = 'nav-button';
+            enlace.textContent = (documento[2] ? documento[2] + ' ' : '') + documento[1];
+            parrafo.appendChild(enlace);
+            var detalle = [documento[3], documento[4]].filter(Boolean).join(' · ');
+            if (detalle) { parrafo.appendChild(document.createTextNode(' ' + detalle)); }
+            resultados.appendChild(parrafo);
+        });
+    }
+
+    function buscar() {
+        if (!config) { return; }
+        var palabras = tokenizar(entrada.value);
+        if (!palabras.length) {
+            resultados.textContent = '';
+            estado.textContent = '';
+            return;
+        }
+        var faltantes = palabras.filter(function (palabra) {
+            return !(palabra.slice(0, config.largo_fragmento) in fragmentos);
+        });
+        if (faltantes.length) {
+            estado.textContent = 'Buscando...';
+            faltantes.forEach(function (palabra) { cargarFragmento(palabra.slice(0, config.largo_fragmento)); });
+            return;
+        }
+        // Solo quedan los postulantes que contienen todas las palabras
+        var puntajes = null;
+        palabras.forEach(function (palabra) {
+            var encontrados = coincidencias(palabra), siguientes = {};
+            var nombre = function (posicion) { return normalizar(config.documentos[posicion][1] + ' ' + config.documentos[posicion][3]); };
+            Object.keys(encontrados).forEach(function (posicion) {
+                if (puntajes === null || posicion in puntajes) {
+                    // Las palabras que aparecen en el nombre o el código pesan más
+                    var extra = nombre(posicion).indexOf(palabra) >= 0 ? 10 : 0;
+                    siguientes[posicion] = (puntajes === null ? 0 : puntajes[posicion]) + encontrados[posicion] + extra;
+                }
+            });
+            puntajes = siguientes;
+        });
+        mostrar(puntajes);
+    }
+
+    return {
+        iniciar: function (datos) {
+            config = datos;
+            entrada = document.getElementById('buscador-consulta');
+            estado = document.getElementById('buscador-estado');
+            resultados = document.getElementById('buscador-resultados');
+            prefijo = entrada.getAttribute('data-prefijo') || '';
+            entrada.addEventListener('input', buscar);
+            buscar();
+        },
+        fragmento: function (clave, palabras) {
+            fragmentos[clave] = palabras;
+            buscar();
+        }
+    };
+})();
+"""
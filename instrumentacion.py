@@ -0,0 +1,146 @@
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+# Medición por etapas de cada ejecución: tiempo, CPU, filas, archivos, bytes y errores.
+# Al final se guarda un informe JSON (el último en informe_ejecucion.json y una línea
+# por ejecución en historial_ejecuciones.jsonl, para graficar la evolución).
+
+# En modo silencioso no se imprime una línea por archivo, solo los resúmenes y errores
+SILENCIOSO = os.environ.get('PAM_SILENCIOSO', '') not in ('', '0')
+ARCHIVO_INFORME = 'informe_ejecucion.json'
+ARCHIVO_HISTORIAL = 'historial_ejecuciones.jsonl'
+MAXIMO_MENSAJES_ERROR = 20  # Mensajes de error guardados por etapa (el contador sigue sumando)
+
+CONTADORES = ['filas_leidas', 'filas_filtradas', 'reenvios', 'archivos_escritos', 'bytes_escritos', 'archivos_enlazados', 'errores',
+              'segundos_escritura']
+
+_etapas = []  # Etapas de esta ejecución, en el orden en que empezaron
+_en_curso = []  # Pila de etapas abiertas; los contadores van a la más interna
+_inicio = datetime.now()
+_al_cerrar_etapa = []  # Funciones que se llaman al cerrar cada etapa (p. ej. esperar escrituras pendientes)
+_cerrojo = threading.Lock()  # Los contadores también se actualizan desde hilos de escritura
+
+def activar_silencio(silencioso=True):
+    """Activa o desactiva el modo silencioso para el resto de la ejecución"""
+    global SILENCIOSO
+    SILENCIOSO = silencioso
+
+def progreso(mensaje):
+    """Imprime una línea de progreso por archivo, salvo en modo silencioso"""
+    if not SILENCIOSO:
+        print(mensaje)
+
+def _tiempo_cpu():
+    """CPU usada por este proceso y por los procesos hijos ya terminados (p. ej. el pool)"""
+    tiempos = os.times()
+    return tiempos.user + tiempos.system + tiempos.children_user + tiempos.children_system
+
+def _nueva_etapa(nombre):
+    registro = {'etapa': nombre, 'segundos': 0.0, 'cpu_segundos': 0.0}
+    registro.update({contador: 0 for contador in CONTADORES})
+    registro['mensajes_error'] = []
+    _etapas.append(registro)
+    return registro
+
+@contextmanager
+def etapa(nombre):
+    """Mide una etapa: todo lo que se cuente dentro del bloque se suma a ella"""
+    registro = _nueva_etapa(nombre)
+    _en_curso.append(registro)
+    inicio = time.perf_counter()
+    cpu_inicio = _tiempo_cpu()
+    try:
+        yield registro
+    except Exception as e:
+        _anotar_error(registro, f"{type(e).__name__}: {e}")
+        raise
+    finally:
+        # Lo que la etapa dejó pendiente (escrituras en segundo plano) se cuenta en su tiempo
+        for funcion in _al_cerrar_etapa:
+            funcion()
+        registro['segundos'] = round(time.perf_counter() - inicio, 4)
+        registro['segundos_escritura'] = round(registro['segundos_escritura'], 4)
+        registro['cpu_segundos'] = round(_tiempo_cpu() - cpu_inicio, 4)
+        _en_curso.pop()
+
+def al_cerrar_etapa(funcion):
+    """Registra una función que se llama al cerrar cada etapa y antes de guardar el informe"""
+    _al_cerrar_etapa.append(funcion)
+
+def etapa_actual():
+    """Etapa abierta más interna; fuera de cualquier etapa se usa una etapa 'general'"""
+    if _en_curso:
+        return _en_curso[-1]
+    for registro in _etapas:
+        if registro['etapa'] == 'general':
+            return registro
+    return _nueva_etapa('general')
+
+def contar(contador, cantidad=1):
+    """Suma ``cantidad`` a un contador de la etapa actual"""
+    sumar(etapa_actual(), contador, cantidad)
+
+def sumar(registro, contador, cantidad):
+    """Suma ``cantidad`` a un contador de una etapa concreta (desde cualquier hilo)"""
+    with _cerrojo:
+        registro[contador] += cantidad
+
+def _anotar_error(registro, mensaje):
+    with _cerrojo:
+        registro['errores'] += 1
+        if len(registro['mensajes_error']) < MAXIMO_MENSAJES_ERROR:
+            registro['mensajes_error'].append(mensaje)
+
+def registrar_error(mensaje, registro=None):
+    """Cuenta un error de la etapa actual o de ``registro`` (por ejemplo, un perfil que no se pudo escribir)"""
+    _anotar_error(registro or etapa_actual(), mensaje)
+
+def registrar_escritura(ruta_archivo):
+    """Cuenta un archivo escrito por otra vía (binarios, JSON) con su tamaño en disco"""
+    contar('archivos_escritos')
+    contar('bytes_escritos', os.path.getsize(ruta_archivo))
+
+def informe():
+    """Devuelve el informe de la ejecución hasta ahora como un dict serializable"""
+    totales = {contador: sum(registro[contador] for registro in _etapas) for contador in CONTADORES}
+    totales['segundos'] = round(sum(registro['segundos'] for registro in _etapas if registro['etapa'] != 'general'), 4)
+    totales['segundos_escritura'] = round(totales['segundos_escritura'], 4)
+    # Rendimiento de escritura: MB escritos por segundo de escritura (sumando los hilos)
+    totales['mb_por_segundo_escritura'] = (round(totales['bytes_escritos'] / totales['segundos_escritura'] / 1e6, 2)
+                                           if totales['segundos_escritura'] else None)
+    return {
+        'inicio': _inicio.isoformat(timespec='seconds'),
+        'fin': datetime.now().isoformat(timespec='seconds'),
+        'comando': ' '.join(os.path.basename(parte) if i == 0 else parte for i, parte in enumerate(sys.argv)),
+        'etapas': _etapas,
+        'totales': totales,
+    }
+
+def reiniciar_informe():
+    """Descarta las etapas medidas hasta ahora (p. ej. entre dos reconstrucciones del modo vigilancia)"""
+    global _inicio
+    _etapas.clear()
+    _inicio = datetime.now()
+
+def guardar_informe(ruta_informe=ARCHIVO_INFORME, ruta_historial=ARCHIVO_HISTORIAL):
+    """Guarda el informe JSON de la ejecución y lo añade como una línea al historial
+
+    El informe reemplaza al anterior de una sola vez; el historial solo crece
+    (se agrega una línea al final).
+    """
+    # Importación diferida: escritor depende de este módulo
+    from escritor import reemplazar_archivo
+
+    for funcion in _al_cerrar_etapa:
+        funcion()
+    datos = informe()
+    reemplazar_archivo(ruta_informe, json.dumps(datos, ensure_ascii=False, indent=2))
+    if ruta_historial:
+        with open(ruta_historial, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(datos, ensure_ascii=False) + '\n')
+    return datos
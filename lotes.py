@@ -0,0 +1,167 @@
+import glob
+import os
+import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+from cache_postulantes import CARPETA_CACHE
+from esquema import buscar_columna
+from instrumentacion import etapa, guardar_informe, registrar_error
+from organizador import almacenar_postulantes, cargar_postulantes, iterar_postulantes
+from organizar_por_areas import MODO_DISTRIBUCION
+from paginacion import TAMANO_PAGINA
+from paralelo import TRABAJADORES
+from pipeline import generar_salidas
+
+# Modo por lotes: varias exportaciones del formulario (rondas de admisión, formularios
+# distintos del año) se leen a la vez y se unen en una sola cohorte, con una columna
+# "Ronda" que indica de qué exportación viene cada envío. Las salidas (perfiles,
+# índices, búsqueda, áreas y Excel) se generan una sola vez sobre la tabla unida.
+# Cada postulante sigue teniendo un solo perfil: si aparece en varias rondas gana
+# su envío más reciente (ver almacen_postulantes.py) y se informa, por ronda, a
+# cuántos postulantes les quedó el perfil de otra ronda.
+
+COLUMNA_RONDA = 'Ronda'
+LECTORES = int(os.environ.get('PAM_LECTORES', '4'))  # Exportaciones leídas a la vez
+CARPETA_CACHE_RONDAS = os.path.join(CARPETA_CACHE, 'rondas')
+
+def expandir_exportaciones(patrones):
+    """CSV a procesar: cada patrón es un archivo, un glob o una carpeta (todos sus .csv); sin repetidos"""
+    archivos = []
+    vistos = set()
+    for patron in patrones:
+        if os.path.isdir(patron):
+            coincidencias = sorted(glob.glob(os.path.join(patron, '*.csv')))
+        else:
+            # Un patrón sin coincidencias se deja tal cual para que la lectura informe el error
+            coincidencias = sorted(glob.glob(patron)) or [patron]
+        for archivo in coincidencias:
+            if os.path.abspath(archivo) not in vistos:
+                vistos.add(os.path.abspath(archivo))
+                archivos.append(archivo)
+    return archivos
+
+def nombres_de_rondas(archivos):
+    """Nombre de la ronda de cada exportación: el nombre del archivo sin extensión, numerado si se repite"""
+    nombres = []
+    for archivo in archivos:
+        base = os.path.splitext(os.path.basename(archivo))[0]
+        nombre = base
+        numero = 2
+        while nombre in nombres:
+            nombre = f"{base} ({numero})"
+            numero += 1
+        nombres.append(nombre)
+    return nombres
+
+def alinear_columnas(tablas):
+    """Usa en cada tabla el nombre de columna de las anteriores cuando es la misma pregunta
+
+    Las exportaciones de distintos formularios pueden traer el mismo encabezado
+    truncado o con otros saltos de línea; sin alinearlos, la unión tendría dos
+    columnas para una misma pregunta.
+    """
+    conocidas = []
+    alineadas = []
+    for tabla in tablas:
+        renombres = {}
+        for columna in tabla.columns:
+            equivalente = buscar_columna(conocidas, columna)
+            if equivalente is not None and equivalente != columna and equivalente not in tabla.columns:
+                renombres[columna] = equivalente
+            elif equivalente is None:
+                conocidas.append(columna)
+        alineadas.append(tabla.rename(columns=renombres))
+    return alineadas
+
+def combinar_rondas(tablas_por_ronda):
+    """Une las tablas limpias de cada ronda (pares (ronda, tabla)) en una sola con la columna Ronda al inicio"""
+    tablas = []
+    for ronda, tabla in tablas_por_ronda:
+        tabla = tabla.copy()
+        tabla.insert(0, COLUMNA_RONDA, ronda)
+        tablas.append(tabla)
+    combinada = pd.concat(alinear_columnas(tablas), ignore_index=True, sort=False)
+    # Las preguntas que una ronda no tenía quedan vacías (None), como las respuestas en blanco
+    return combinada.astype(object).where(combinada.notna(), None)
+
+def resumen_rondas(almacen, df_limpio):
+    """Cuántos perfiles salen de cada ronda y a cuántos de sus postulantes les quedó el envío de otra
+
+    ``almacen`` son los registros de la tabla unida ``df_limpio``. Los envíos de
+    las otras rondas no aparecen en ninguna salida. Devuelve un dict ronda →
+    (perfiles, reemplazados).
+    """
+    ronda_vigente = {id_postulante: fila[COLUMNA_RONDA] for id_postulante, _, fila in almacen.postulantes()}
+    postulantes_por_ronda = defaultdict(set)
+    for _, fila in iterar_postulantes([df_limpio], contar_filas=False):
+        postulantes_por_ronda[fila[COLUMNA_RONDA]].add(almacen.id_de(fila))
+
+    resumen = {}
+    for ronda, ids in postulantes_por_ronda.items():
+        perfiles = sum(1 for id_postulante in ids if ronda_vigente[id_postulante] == ronda)
+        resumen[ronda] = (perfiles, len(ids) - perfiles)
+    return resumen
+
+def leer_rondas(archivos, rondas, lectores=LECTORES, usar_cache=True):
+    """Lee las exportaciones a la vez (cada una con su propio caché); devuelve sus tablas limpias o None si alguna falló"""
+    def leer(par):
+        ronda, archivo = par
+        return cargar_postulantes(archivo, usar_cache, os.path.join(CARPETA_CACHE_RONDAS, ronda))
+
+    # Hilos y no procesos: pandas libera el GIL al leer y las tablas no se copian entre procesos
+    with ThreadPoolExecutor(max_workers=max(lectores, 1)) as pool:
+        tablas = list(pool.map(leer, zip(rondas, archivos)))
+
+    fallidas = [archivo for archivo, tabla in zip(archivos, tablas) if tabla is None]
+    if fallidas:
+        registrar_error(f"No se pudieron leer: {', '.join(fallidas)}")
+        return None
+    return tablas
+
+def ejecutar_lote(patrones, lectores=LECTORES, incremental=True, trabajadores=TRABAJADORES, con_md=True,
+                  modo_areas=MODO_DISTRIBUCION, usar_cache=True, tamano_pagina=TAMANO_PAGINA, con_excel=True):
+    """Lee varias exportaciones a la vez y genera una sola cohorte con todas sus salidas
+
+    ``patrones`` son archivos, globs o carpetas (ver expandir_exportaciones). El
+    resto de opciones son las de ejecutar_pipeline. Devuelve los perfiles
+    construidos, o None si no se pudo leer alguna exportación.
+    """
+    archivos = expandir_exportaciones(patrones)
+    if not archivos:
+        print("❌ Error: no se indicó ninguna exportación.")
+        return None
+    rondas = nombres_de_rondas(archivos)
+
+    with etapa('lectura'):
+        print(f"📥 Leyendo {len(archivos)} exportaciones ({max(lectores, 1)} a la vez)...")
+        tablas = leer_rondas(archivos, rondas, lectores, usar_cache)
+        if tablas is None:
+            print("❌ Error: no se generó la cohorte porque falló la lectura de alguna exportación.")
+            return None
+        for ronda, tabla in zip(rondas, tablas):
+            print(f"   • {ronda}: {len(tabla)} registros válidos")
+        df_limpio = combinar_rondas(zip(rondas, tablas))
+
+    with etapa('registros'):
+        almacen = almacenar_postulantes([df_limpio])
+        resumen = resumen_rondas(almacen, df_limpio)
+
+    # Quien postuló en varias rondas queda con un solo perfil: se avisa cuántos envíos no salen
+    reemplazados = sum(reemplazados_ronda for _, reemplazados_ronda in resumen.values())
+    print(f"📋 Perfiles por ronda ({len(almacen)} postulantes):")
+    for ronda in rondas:
+        perfiles, reemplazados_ronda = resumen.get(ronda, (0, 0))
+        detalle = f" ({reemplazados_ronda} con el perfil de otra ronda)" if reemplazados_ronda else ""
+        print(f"   • {ronda}: {perfiles} perfiles{detalle}")
+    if reemplazados:
+        print(f"⚠️ {reemplazados} postulaciones de quienes se repiten entre rondas no aparecen en las salidas "
+              f"(gana el envío más reciente)")
+
+    return generar_salidas(df_limpio, incremental, trabajadores, con_md, modo_areas, tamano_pagina, con_excel, almacen)
+
+if __name__ == "__main__":
+    ejecutar_lote(sys.argv[1:])
+    guardar_informe()
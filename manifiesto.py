@@ -0,0 +1,50 @@
+import hashlib
+import json
+import os
+
+from escritor import reemplazar_archivo
+from instrumentacion import registrar_escritura
+
+NOMBRE_MANIFIESTO = '.manifiesto.json'
+
+def calcular_hash(*partes):
+    """Calcula un hash SHA-256 estable de cualquier combinación de valores"""
+    serializado = json.dumps(partes, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(serializado.encode('utf-8')).hexdigest()
+
+def hash_fila(row, version_plantilla):
+    """Hash de la fila limpia de un postulante (dict o Series) junto con la versión de la plantilla"""
+    datos = row.to_dict() if hasattr(row, 'to_dict') else dict(row)
+    return calcular_hash(version_plantilla, datos)
+
+def cargar_manifiesto(carpeta):
+    """Lee el manifiesto de una carpeta de salida (vacío si no existe o está dañado)"""
+    ruta = os.path.join(carpeta, NOMBRE_MANIFIESTO)
+    try:
+        with open(ruta, 'r', encoding='utf-8') as f:
+            manifiesto = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {'perfiles': {}}
+
+    manifiesto.setdefault('perfiles', {})
+    return manifiesto
+
+def guardar_manifiesto(carpeta, manifiesto):
+    """Escribe el manifiesto junto a las salidas de la carpeta, reemplazando el anterior de una sola vez"""
+    ruta = os.path.join(carpeta, NOMBRE_MANIFIESTO)
+    reemplazar_archivo(ruta, json.dumps(manifiesto, ensure_ascii=False, indent=2, sort_keys=True))
+    registrar_escritura(ruta)
+
+def eliminar_desaparecidos(carpeta, manifiesto_anterior, vigentes, extension):
+    """Borra las salidas de postulantes que ya no aparecen y devuelve sus nombres"""
+    eliminados = []
+    for nombre_archivo in manifiesto_anterior.get('perfiles', {}):
+        if nombre_archivo in vigentes:
+            continue
+
+        ruta = os.path.join(carpeta, f"{nombre_archivo}{extension}")
+        if os.path.exists(ruta):
+            os.remove(ruta)
+        eliminados.append(nombre_archivo)
+
+    return eliminados
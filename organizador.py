@@ -1,139 +1,346 @@
 import pandas as pd
 import os
-import re
-
-def limpiar_texto(texto):
-    """Limpia y formatea el texto básico"""
-    if pd.isna(texto) or texto == '':
-        return texto
-    
-    # Convertir a string y limpiar espacios extra
-    texto = str(texto).strip()
-    # Limpiar espacios múltiples
-    texto = re.sub(r'\s+', ' ', texto)
-    return texto
-
-def limpiar_nombre_archivo(nombre):
-    """Limpia el nombre para usarlo como nombre de archivo"""
-    nombre = str(nombre).strip()
-    # Remover caracteres no válidos para nombres de archivo
-    nombre = re.sub(r'[<>:"/\\|?*]', '', nombre)
-    # Reemplazar espacios con guiones bajos
-    nombre = re.sub(r'\s+', '_', nombre)
-    return nombre
-
-def generar_perfil_md(persona_data, nombre_persona):
-    """Genera el contenido Markdown para el perfil de una persona"""
-    
-    # Mapeo de columnas a preguntas legibles
-    preguntas_map = {
-        'Código Universitario:\n': '🎓 Código Universitario',
-        'Ciclo Relativo': '📚 Ciclo Relativo',
-        'Correo Electrónico:\n': '📧 Correo Electrónico',
-        'Teléfono (WhatsApp):\n': '📱 Teléfono (WhatsApp)',
-        '¿Qué piensas que hacemos en ACECOM?\n': '🤔 ¿Qué piensas que hacemos en ACECOM?',
-        '¿Como consideras que ACECOM puede mejorar para ser más atractivo para la población estudiantil de la facultad?': '💡 ¿Cómo consideras que ACECOM puede mejorar para ser más atractivo para la población estudiantil de la facultad?',
-        'Dentro del contexto de mejora ¿Siendo tu parte de ACECOM que acciones tomarías para mejorar esta situación? \n': '🚀 Dentro del contexto de mejora ¿Siendo tu parte de ACECOM qué acciones tomarías para mejorar esta situación?',
-        '¿Qué te motiva a unirte a ACECOM y no a otro grupo estudiantil? ¿Qué esperas aportar y qué esperas aprender aquí?': '💪 ¿Qué te motiva a unirte a ACECOM y no a otro grupo estudiantil? ¿Qué esperas aportar y qué esperas aprender aquí?',
-        'Cuéntanos sobre un proyecto PERSONAL (no un curso) que hayas iniciado por tu cuenta. Puede ser de programación, investigación, un blog, un negocio, etc. Describe qué te impulsó a empezarlo, qué desafí': '🛠️ Cuéntanos sobre un proyecto PERSONAL que hayas iniciado por tu cuenta',
-        'Fuera de las clases obligatorias de la universidad, ¿qué estás aprendiendo por tu cuenta actualmente? (Ej: un lenguaje de programación, un framework, sobre inteligencia artificial, etc.). ¿Qué recurso': '📖 ¿Qué estás aprendiendo por tu cuenta actualmente?',
-        'Menciona un blog, canal de YouTube, perfil de LinkedIn o libro técnico que hayas encontrado últimamente y que te haya parecido interesante. Explícanos por qué lo recomendarías.\n': '🌐 Menciona un recurso técnico que hayas encontrado últimamente y que te haya parecido interesante',
-        '¿A qué área de ACECOM te gustaría postular? Principal interes.\n': '🎯 ¿A qué área de ACECOM te gustaría postular? (Principal interés)',
-        'Segunda opción de área': '🎯 Segunda opción de área',
-        'Áreas de interés adicionales': '🎯 Áreas de interés adicionales',
-        'Nuestro reglamento exige a los miembros un compromiso activo, medido por un sistema de puntos mínimo bimestral. ¿Crees que podrás gestionar este compromiso adicional a tu carga académica?\n\n': '⚖️ ¿Crees que podrás gestionar el compromiso adicional a tu carga académica?'
-    }
-    
-    # Inicio del contenido Markdown
-    contenido = f"# 👤 Perfil de {nombre_persona}\n\n"
+
+from almacen_postulantes import AlmacenPostulantes, iterar_vigentes
+from añadir_indicadores import obtener_indicador
+from cache_postulantes import CARPETA_CACHE, cache_vigente, escribir_bloques_cache, leer_bloques_cache
+from esquema import compilar_esquema
+from escritor import escribir_archivo, esperar_escrituras
+from instrumentacion import contar, etapa, guardar_informe, progreso, registrar_error
+from manifiesto import calcular_hash, cargar_manifiesto, eliminar_desaparecidos, guardar_manifiesto, hash_fila
+from paralelo import TAMANO_LOTE, TRABAJADORES, crear_pool, mapear_por_lotes
+from rutas_postulantes import cargar_rutas, guardar_rutas, registrar_salida
+
+# Subir esta versión cada vez que cambie el formato de generar_perfil_md
+VERSION_PLANTILLA = '3'
+
+def normalizar_respuestas(df):
+    """Quita los espacios de los extremos y deja uno solo entre palabras, en todas las columnas a la vez
+    
+    Usa operaciones de texto de pandas columna por columna en lugar de un bucle
+    por celda. Las celdas vacías o con solo espacios quedan como None.
+    """
+    normalizado = df.apply(lambda columna: columna.str.strip().str.replace(r'\s+', ' ', regex=True))
+    return normalizado.where(normalizado.notna() & (normalizado != ''), None)
+
+def generar_perfil_md(persona_data, nombre_persona, esquema=None, indicador=None):
+    """Genera el contenido Markdown para el perfil de una persona
+    
+    ``persona_data`` debe venir ya normalizado (ver normalizar_respuestas): los
+    valores llegan limpios y las respuestas vacías son None. ``esquema`` es el
+    esquema de preguntas compilado para el CSV; si no se pasa se compila (y se
+    reutiliza) a partir de las columnas de ``persona_data``. Si no se pasa
+    ``indicador`` se calcula a partir de la respuesta sobre el compromiso.
+    """
+    if esquema is None:
+        esquema = compilar_esquema(persona_data.keys())
+    if indicador is None:
+        indicador = obtener_indicador(persona_data, esquema)
+    
+    # Inicio del contenido Markdown (con el indicador de disponibilidad)
+    contenido = f"# {indicador} 👤 Perfil de {nombre_persona}\n\n"
     contenido += f"---\n\n"
     
     # Agregar nombres y apellidos en una sola línea
     nombres = persona_data.get('Nombres:\n', '')
     apellidos = persona_data.get('Apellidos:', '')
-    if pd.notna(nombres) and pd.notna(apellidos):
-        nombre_completo = f"{limpiar_texto(str(nombres))} {limpiar_texto(str(apellidos))}"
+    if nombres and apellidos:
+        nombre_completo = f"{nombres} {apellidos}"
         contenido += f"## 👤 Nombre Completo\n\n"
         contenido += f"{nombre_completo}\n\n"
         contenido += f"---\n\n"
     
-    # Procesar cada columna de datos
-    for columna, valor in persona_data.items():
-        if columna in ['Id', 'Hora de inicio', 'Hora de finalización', 'Nombre', 'Correo electrónico', 'Nombres:\n', 'Apellidos:']:
-            continue  # Saltar columnas administrativas y las ya procesadas
-            
-        # Obtener el título de la pregunta
-        titulo_pregunta = preguntas_map.get(columna, columna)
+    # Procesar las columnas del esquema (sin administrativas) en su orden
+    for columna, titulo_pregunta in esquema.renderizables:
+        valor = persona_data.get(columna)
         
-        # Limpiar la respuesta
-        if pd.notna(valor) and str(valor).strip() != '':
-            respuesta_limpia = limpiar_texto(str(valor))
+        # Agregar solo las respuestas no vacías
+        if valor:
             contenido += f"## {titulo_pregunta}\n\n"
-            contenido += f"{respuesta_limpia}\n\n"
+            contenido += f"{valor}\n\n"
             contenido += f"---\n\n"
     
     return contenido
 
 # Configuración principal
-archivo_csv = 'PAM 2025_2.csv'
-carpeta_perfiles = 'perfiles_md'
-
-# Crear carpeta para los perfiles si no existe
-if not os.path.exists(carpeta_perfiles):
-    os.makedirs(carpeta_perfiles)
-    print(f"📁 Carpeta '{carpeta_perfiles}' creada")
-
-# Leer el archivo CSV
-try:
-    df = pd.read_csv(archivo_csv, sep=';')
-    print(f"✅ Archivo CSV leído correctamente. Total de registros: {len(df)}")
-except FileNotFoundError:
-    print(f"❌ Error: No se encontró el archivo '{archivo_csv}'.")
-    exit()
-
-# Verificar que la columna de nombres exista
-columna_nombres = 'Nombres:\n'
-if columna_nombres not in df.columns:
-    print(f"❌ Error: La columna '{columna_nombres}' no fue encontrada.")
-    print("Columnas disponibles:", df.columns.tolist())
-    exit()
-
-# Limpiar datos y eliminar registros vacíos o de prueba
-df_limpio = df.dropna(subset=[columna_nombres])
-df_limpio = df_limpio[df_limpio[columna_nombres].str.strip() != '']
-df_limpio = df_limpio[df_limpio[columna_nombres] != 'asdas']  # Eliminar datos de prueba
-
-print(f"📋 Procesando {len(df_limpio)} perfiles válidos...")
-
-# Generar un archivo MD para cada persona
-perfiles_generados = 0
-for index, row in df_limpio.iterrows():
-    nombre_persona = str(row[columna_nombres]).strip()
-    
-    # Saltar si el nombre es muy corto o parece ser de prueba
-    if len(nombre_persona) < 2 or nombre_persona.lower() in ['i', 'j', 'asdas']:
-        continue
-    
-    # Generar contenido del perfil
-    contenido_md = generar_perfil_md(row, nombre_persona)
-    
-    # Crear nombre de archivo
-    nombre_archivo = f"{limpiar_nombre_archivo(nombre_persona)}.md"
-    ruta_archivo = os.path.join(carpeta_perfiles, nombre_archivo)
-    
-    # Escribir archivo
+ARCHIVO_CSV = 'PAM 2025_2.csv'
+CARPETA_PERFILES = 'perfiles_md'
+COLUMNA_NOMBRES = 'Nombres:\n'
+NOMBRES_PRUEBA = ['i', 'j', 'asdas']
+TAMANO_BLOQUE = 1000  # Filas leídas por bloque en el modo streaming
+# Subir esta versión cada vez que cambie limpiar_registros o lo que se guarda en el caché
+VERSION_LIMPIEZA = '2'
+
+def limpiar_registros(df):
+    """Normaliza el texto y elimina registros vacíos o de prueba de un DataFrame (o de un bloque)"""
+    df_limpio = normalizar_respuestas(df)
+    df_limpio = df_limpio.dropna(subset=[COLUMNA_NOMBRES])
+    df_limpio = df_limpio[df_limpio[COLUMNA_NOMBRES] != 'asdas']  # Eliminar datos de prueba
+    return df_limpio
+
+def _contar_limpieza(conteos, df, df_limpio, contar_filas=True):
+    """Suma las filas leídas y filtradas de un bloque a ``conteos`` (para el caché) y, si corresponde, al informe"""
+    filas = {'filas_leidas': len(df), 'filas_filtradas': len(df) - len(df_limpio)}
+    for contador, cantidad in filas.items():
+        conteos[contador] = conteos.get(contador, 0) + cantidad
+        if contar_filas:
+            contar(contador, cantidad)
+
+def _contar_desde_cache(metadatos, contar_filas=True):
+    """Suma al informe las filas que se leyeron y filtraron del CSV cuando se creó el caché"""
+    if contar_filas:
+        for contador, cantidad in metadatos['conteos'].items():
+            contar(contador, cantidad)
+
+def verificar_columnas(columnas):
+    """Comprueba que la columna de nombres exista en el CSV"""
+    if COLUMNA_NOMBRES not in columnas:
+        print(f"❌ Error: La columna '{COLUMNA_NOMBRES}' no fue encontrada.")
+        print("Columnas disponibles:", list(columnas))
+        return False
+    return True
+
+def cargar_postulantes(archivo_csv=ARCHIVO_CSV, usar_cache=True, carpeta_cache=CARPETA_CACHE):
+    """Lee el CSV (todas las columnas como texto) y devuelve solo los registros válidos
+    
+    Si el caché de ``carpeta_cache`` (.cache_postulantes/) corresponde al CSV actual
+    se carga de ahí sin volver a leer ni limpiar el CSV; si no, se lee el CSV y se
+    actualiza el caché. En ambos casos el informe cuenta las filas del CSV.
+    """
+    
+    # Cargar desde el caché si el CSV no cambió
+    try:
+        metadatos = cache_vigente(archivo_csv, VERSION_LIMPIEZA, carpeta_cache) if usar_cache else None
+    except FileNotFoundError:
+        registrar_error(f"No se encontró el archivo '{archivo_csv}'")
+        print(f"❌ Error: No se encontró el archivo '{archivo_csv}'.")
+        return None
+    if metadatos is not None:
+        df_limpio = pd.concat(list(leer_bloques_cache(metadatos, carpeta_cache)))
+        _contar_desde_cache(metadatos)
+        print(f"⚡ Postulantes cargados desde caché: {len(df_limpio)} registros válidos")
+        return df_limpio
+    
+    # Leer el archivo CSV
     try:
-        with open(ruta_archivo, 'w', encoding='utf-8') as f:
-            f.write(contenido_md)
+        df = pd.read_csv(archivo_csv, sep=';', dtype=str)
+        print(f"✅ Archivo CSV leído correctamente. Total de registros: {len(df)}")
+    except FileNotFoundError:
+        registrar_error(f"No se encontró el archivo '{archivo_csv}'")
+        print(f"❌ Error: No se encontró el archivo '{archivo_csv}'.")
+        return None
+    
+    # Verificar que la columna de nombres exista
+    if not verificar_columnas(df.columns):
+        return None
+    
+    df_limpio = limpiar_registros(df)
+    conteos = {}
+    _contar_limpieza(conteos, df, df_limpio)
+    if usar_cache:
+        for _ in escribir_bloques_cache(archivo_csv, [df_limpio], VERSION_LIMPIEZA, carpeta_cache, conteos):
+            pass
+    return df_limpio
+
+def leer_postulantes_por_bloques(archivo_csv=ARCHIVO_CSV, tamano_bloque=TAMANO_BLOQUE, usar_cache=True, contar_filas=True):
+    """Lee el CSV en bloques de tamaño fijo y produce cada bloque ya limpio
+    
+    La memoria usada depende de ``tamano_bloque`` y no del total de filas del CSV.
+    Los bloques se leen del caché si corresponde al CSV actual; si no, se leen del
+    CSV y se guardan en el caché a medida que pasan. Con ``contar_filas=False`` las
+    filas no se suman al informe (una segunda pasada sobre el mismo CSV). Lanza
+    FileNotFoundError si el archivo no existe y ValueError si falta la columna de
+    nombres.
+    """
+    metadatos = cache_vigente(archivo_csv, VERSION_LIMPIEZA) if usar_cache else None
+    if metadatos is not None:
+        _contar_desde_cache(metadatos, contar_filas)
+        yield from leer_bloques_cache(metadatos)
+        return
+    
+    conteos = {}
+    bloques = _leer_csv_por_bloques(archivo_csv, tamano_bloque, conteos, contar_filas)
+    if usar_cache:
+        bloques = escribir_bloques_cache(archivo_csv, bloques, VERSION_LIMPIEZA, conteos=conteos)
+    yield from bloques
+
+def _leer_csv_por_bloques(archivo_csv, tamano_bloque, conteos, contar_filas=True):
+    """Lee y limpia el CSV bloque a bloque, sin pasar por el caché; suma sus filas a ``conteos``"""
+    # dtype=str evita que cada bloque infiera tipos distintos (p. ej. 6 frente a '6' o 6.0)
+    with pd.read_csv(archivo_csv, sep=';', dtype=str, chunksize=tamano_bloque) as lector:
+        for bloque in lector:
+            if not verificar_columnas(bloque.columns):
+                raise ValueError(f"Falta la columna '{COLUMNA_NOMBRES}' en '{archivo_csv}'")
+            bloque_limpio = limpiar_registros(bloque)
+            _contar_limpieza(conteos, bloque, bloque_limpio, contar_filas)
+            yield bloque_limpio
+
+def iterar_postulantes(bloques, contar_filas=True):
+    """Recorre DataFrames limpios y produce (nombre_persona, fila) para cada postulante válido
+    
+    Cada fila es un dict columna → valor construido a partir de tuplas simples,
+    sin crear una Series por fila como ``iterrows``. Con ``contar_filas=False``
+    los nombres descartados no se suman al informe.
+    """
+    for bloque in bloques:
+        columnas = list(bloque.columns)
+        for valores in bloque.itertuples(index=False, name=None):
+            fila = dict(zip(columnas, valores))
+            nombre_persona = fila[COLUMNA_NOMBRES]
+            
+            # Saltar si el nombre es muy corto o parece ser de prueba
+            if es_nombre_valido(nombre_persona):
+                yield nombre_persona, fila
+            elif contar_filas:
+                contar('filas_filtradas')
+
+def postulantes_vigentes(archivo_csv=ARCHIVO_CSV, tamano_bloque=TAMANO_BLOQUE, usar_cache=True):
+    """Produce (id, nombre_persona, fila) del último envío de cada postulante, leyendo el CSV en bloques
+
+    Recorre el CSV dos veces (ver iterar_vigentes), pero cuenta sus filas una sola vez.
+    """
+    def abrir_postulantes(contar_filas=True):
+        return iterar_postulantes(leer_postulantes_por_bloques(archivo_csv, tamano_bloque, usar_cache, contar_filas),
+                                  contar_filas)
+    return iterar_vigentes(abrir_postulantes)
+
+def almacenar_postulantes(bloques):
+    """Guarda en un AlmacenPostulantes el último envío de cada postulante válido de ``bloques``"""
+    return AlmacenPostulantes().agregar_todos(iterar_postulantes(bloques))
+
+def es_nombre_valido(nombre_persona):
+    """Descarta nombres muy cortos o que parecen ser de prueba"""
+    return len(nombre_persona) >= 2 and nombre_persona.lower() not in NOMBRES_PRUEBA
+
+def _renderizar_perfil(pendiente):
+    """Renderiza un perfil pendiente (nombre_base, nombre_persona, fila, esquema); usable en otro proceso"""
+    nombre_base, nombre_persona, row, esquema = pendiente
+    return generar_perfil_md(row, nombre_persona, esquema)
+
+def generar_perfiles(postulantes, carpeta_perfiles=CARPETA_PERFILES, incremental=True,
+                     trabajadores=TRABAJADORES, tamano_lote=TAMANO_LOTE):
+    """Genera un archivo MD para cada persona y devuelve cuántos se escribieron
+    
+    ``postulantes`` es un iterable de (id, nombre_persona, fila) con un envío por
+    postulante, normalmente producido por ``postulantes_vigentes``, y se consume de forma
+    perezosa. Cada perfil se guarda como ``<id>.md``.
+    
+    En modo incremental solo se regeneran los postulantes cuya fila cambió desde la
+    última ejecución (según el manifiesto de la carpeta) y se eliminan los perfiles
+    de quienes ya no aparecen en el CSV.
+    
+    Con ``trabajadores`` > 1 los perfiles se renderizan en un pool de procesos, en
+    lotes de ``tamano_lote``; los archivos se escriben en el mismo orden y con el
+    mismo contenido que en modo secuencial.
+    """
+    
+    # Crear carpeta para los perfiles si no existe
+    if not os.path.exists(carpeta_perfiles):
+        os.makedirs(carpeta_perfiles)
+        print(f"📁 Carpeta '{carpeta_perfiles}' creada")
+    
+    manifiesto_anterior = cargar_manifiesto(carpeta_perfiles) if incremental else {'perfiles': {}}
+    hashes_anteriores = manifiesto_anterior['perfiles']
+    hashes_actuales = {}
+    nombres = {}
+    
+    perfiles_generados = 0
+    perfiles_sin_cambios = 0
+    esquema = None
+    pendientes = []
+    pool = crear_pool(trabajadores)
+    
+    def escribir_pendientes():
+        generados = 0
+        contenidos = mapear_por_lotes(_renderizar_perfil, pendientes, pool, tamano_lote)
+        for (nombre_base, nombre_persona, row, _), contenido_md in zip(pendientes, contenidos):
+            nombre_archivo = f"{nombre_base}.md"
+            ruta_archivo = os.path.join(carpeta_perfiles, nombre_archivo)
+            
+            # Escribir archivo (los errores se informan al esperar las escrituras)
+            escribir_archivo(ruta_archivo, contenido_md)
+            generados += 1
+            progreso(f"✅ Perfil generado: {nombre_archivo}")
         
-        perfiles_generados += 1
-        print(f"✅ Perfil generado: {nombre_archivo}")
+        pendientes.clear()
+        return generados
+    
+    try:
+        for nombre_base, nombre_persona, row in postulantes:
+            # Compilar el esquema de preguntas una sola vez, con las columnas de la primera fila
+            if esquema is None:
+                esquema = compilar_esquema(row.keys())
+            nombres[nombre_base] = nombre_persona
+            
+            # Saltar si la fila (o su indicador) no cambió desde la última ejecución
+            hash_actual = calcular_hash(hash_fila(row, VERSION_PLANTILLA), obtener_indicador(row, esquema))
+            hashes_actuales[nombre_base] = hash_actual
+            if hashes_anteriores.get(nombre_base) == hash_actual:
+                perfiles_sin_cambios += 1
+                continue
+            
+            # Acumular perfiles pendientes y renderizarlos por tandas para que la memoria siga acotada
+            pendientes.append((nombre_base, nombre_persona, row, esquema))
+            if len(pendientes) >= tamano_lote * max(trabajadores, 1):
+                perfiles_generados += escribir_pendientes()
         
-    except Exception as e:
-        print(f"❌ Error al generar perfil para {nombre_persona}: {e}")
-
-print(f"\n🎉 ¡Proceso completado!")
-print(f"📁 Perfiles generados: {perfiles_generados}")
-print(f"📂 Ubicación: ./{carpeta_perfiles}/")
-print(f"📝 Formato: Markdown (.md) con limpieza básica de texto")
-print(f"🔍 Cada archivo contiene el perfil completo de un postulante")
\ No newline at end of file
+        perfiles_generados += escribir_pendientes()
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    
+    # Los perfiles que no se pudieron escribir conservan el hash anterior para reintentarlos
+    for ruta_archivo in esperar_escrituras():
+        nombre_base = os.path.splitext(os.path.basename(ruta_archivo))[0]
+        if nombre_base in hashes_actuales:
+            hashes_actuales[nombre_base] = hashes_anteriores.get(nombre_base)
+            perfiles_generados -= 1
+    
+    # Eliminar perfiles de postulantes que desaparecieron del CSV
+    for nombre_base in eliminar_desaparecidos(carpeta_perfiles, manifiesto_anterior, hashes_actuales, '.md'):
+        progreso(f"🗑️ Perfil eliminado: {nombre_base}.md")
+    
+    # Ruta de cada perfil escrito (o sin cambios) para las etapas siguientes
+    rutas = cargar_rutas()
+    registrar_salida(rutas, 'md', {nombre_base: os.path.join(carpeta_perfiles, f"{nombre_base}.md")
+                                   for nombre_base, hash_actual in hashes_actuales.items() if hash_actual is not None})
+    guardar_rutas(rutas)
+    
+    # Los nombres permiten a convertir_html.py mostrar a cada postulante sin abrir su perfil
+    guardar_manifiesto(carpeta_perfiles, {'version_plantilla': VERSION_PLANTILLA, 'perfiles': hashes_actuales,
+                                          'nombres': nombres})
+    
+    if perfiles_sin_cambios:
+        print(f"⏭️ Perfiles sin cambios: {perfiles_sin_cambios}")
+    
+    return perfiles_generados
+
+def main(archivo_csv=ARCHIVO_CSV, incremental=True, trabajadores=TRABAJADORES, usar_cache=True):
+    """Genera los perfiles MD y devuelve cuántos se escribieron (None si no se pudo leer el CSV)"""
+    # Leer el CSV en bloques para que la memoria no crezca con el número de filas; una
+    # primera pasada decide cuál es el último envío de cada postulante
+    with etapa('perfiles_md'):
+        try:
+            print(f"📋 Procesando perfiles válidos en bloques de {TAMANO_BLOQUE} filas...")
+            perfiles_generados = generar_perfiles(postulantes_vigentes(archivo_csv, TAMANO_BLOQUE, usar_cache),
+                                                  CARPETA_PERFILES, incremental, trabajadores)
+        except FileNotFoundError:
+            registrar_error(f"No se encontró el archivo '{archivo_csv}'")
+            print(f"❌ Error: No se encontró el archivo '{archivo_csv}'.")
+            return None
+        except ValueError as e:
+            registrar_error(str(e))
+            print(f"❌ Error: {e}")
+            return None
+    
+    print(f"\n🎉 ¡Proceso completado!")
+    print(f"📁 Perfiles generados: {perfiles_generados}")
+    print(f"📂 Ubicación: ./{CARPETA_PERFILES}/")
+    print(f"📝 Formato: Markdown (.md) con limpieza básica de texto")
+    print(f"🔍 Cada archivo contiene el perfil completo de un postulante")
+    
+    return perfiles_generados
+
+if __name__ == "__main__":
+    main()
+    guardar_informe()
@@ -2,324 +2,320 @@ import pandas as pd
 import os
 import shutil
 from collections import defaultdict
+from html import escape
 
-def organizar_por_areas():
-    """Organiza los perfiles HTML y MD por área principal de interés"""
-    
-    # Leer el CSV para obtener las áreas de interés
-    archivo_csv = 'PAM 2025_2.csv'
-    try:
-        df = pd.read_csv(archivo_csv, sep=';')
-        print(f"✅ Archivo CSV leído correctamente. Total de registros: {len(df)}")
-    except FileNotFoundError:
-        print(f"❌ Error: No se encontró el archivo '{archivo_csv}'.")
-        return
+from estilos import enlace_estilos, escribir_hoja_estilos
+from escritor import escribir_archivo
+from instrumentacion import contar, etapa, guardar_informe, progreso, registrar_error
+from paginacion import (PAGINA_RESUMEN, TAMANO_PAGINA, enlaces_paginas, es_pagina_indice, escribir_paginas,
+                        nombre_pagina, navegacion_paginas, paginar)
+from esquema import buscar_columna
+from manifiesto import cargar_manifiesto
+from organizador import ARCHIVO_CSV, almacenar_postulantes, cargar_postulantes
+from rutas_postulantes import cargar_rutas, guardar_rutas, registrar_salida, rutas_de
 
-    # Limpiar datos
-    columna_nombres = 'Nombres:\n'
-    columna_area = '¿A qué área de ACECOM te gustaría postular? Principal interes.\n'
-    
-    df_limpio = df.dropna(subset=[columna_nombres, columna_area])
-    df_limpio = df_limpio[df_limpio[columna_nombres].str.strip() != '']
-    df_limpio = df_limpio[df_limpio[columna_nombres] != 'asdas']
+COLUMNA_AREA = '¿A qué área de ACECOM te gustaría postular? Principal interes.\n'
+ARCHIVO_INDICE_GENERAL = 'index_general.html'
+PREFIJO_PERFILES_AREA = '../../perfiles_html/'  # De perfiles_por_area_html/<área>/ a perfiles_html/
+
+def limpiar_nombre_area(area):
+    """Nombre de área apto para carpetas ('Sin especificar' si viene vacía)"""
+    area = str(area).strip() if area is not None and pd.notna(area) else ''
+    if not area:
+        return 'Sin especificar'
+    return area.replace('/', '_').replace('\\', '_').replace('*', '_').replace('?', '_').replace('[', '_').replace(']', '_')
+
+def agrupar_por_areas(almacen):
+    """Agrupa a los candidatos del almacén (un registro por postulante) según su área principal de interés
     
+    El ``nombre_archivo`` de cada candidato es su ID estable, el mismo nombre que
+    tienen sus perfiles en perfiles_md/ y perfiles_html/.
+    """
     # Agrupar por área de interés
     areas_candidatos = defaultdict(list)
+    columna_area = None
     
-    for index, row in df_limpio.iterrows():
-        nombre = str(row[columna_nombres]).strip()
-        area = str(row[columna_area]).strip() if pd.notna(row[columna_area]) else 'Sin especificar'
+    for id_postulante, nombre, row in almacen.postulantes():
+        if columna_area is None:
+            columna_area = buscar_columna(row.keys(), COLUMNA_AREA) or COLUMNA_AREA
+        area = row.get(columna_area)
+        if not area:
+            continue
         
         # Limpiar y normalizar nombres de área
-        area_limpia = area.replace('/', '_').replace('\\', '_').replace('*', '_').replace('?', '_').replace('[', '_').replace(']', '_')
-        
-        if len(nombre) >= 2 and nombre.lower() not in ['i', 'j', 'asdas']:
-            nombre_archivo = nombre.replace(' ', '_').replace('/', '_').replace('\\', '_').replace('*', '_').replace('?', '_').replace('[', '_').replace(']', '_')
-            areas_candidatos[area_limpia].append({
-                'nombre': nombre,
-                'nombre_archivo': nombre_archivo,
-                'area_original': area
-            })
+        areas_candidatos[limpiar_nombre_area(area)].append({
+            'nombre': nombre,
+            'nombre_archivo': id_postulante,
+            'area_original': area
+        })
     
     print(f"📋 Áreas encontradas: {len(areas_candidatos)}")
     for area, candidatos in areas_candidatos.items():
         print(f"   • {area}: {len(candidatos)} candidatos")
     
-    # Crear estructura de carpetas por área
-    carpeta_base_html = 'perfiles_por_area_html'
-    carpeta_base_md = 'perfiles_por_area_md'
+    return areas_candidatos
+
+# Cómo se construyen las carpetas por área a partir de los perfiles canónicos:
+#   'enlace_duro'      -> enlaces duros (no se duplican datos; si el sistema no los admite se copia)
+#   'enlace_simbolico' -> enlaces simbólicos relativos
+#   'virtual'          -> solo índices por área que apuntan a perfiles_html/
+#   'copia'            -> copias completas, como antes
+MODOS_DISTRIBUCION = ['enlace_duro', 'enlace_simbolico', 'virtual', 'copia']
+MODO_DISTRIBUCION = os.environ.get('PAM_MODO_AREAS', 'enlace_duro')
+
+def colocar_archivo(origen, destino, modo):
+    """Coloca el perfil canónico ``origen`` en ``destino`` según el modo; devuelve False si ya estaba al día
     
-    # Limpiar carpetas existentes si existen
-    for carpeta in [carpeta_base_html, carpeta_base_md]:
-        if os.path.exists(carpeta):
-            shutil.rmtree(carpeta)
-        os.makedirs(carpeta)
+    El archivo se crea con un nombre temporal y se mueve encima del anterior, así
+    la carpeta de área nunca queda con el perfil a medias.
+    """
+    if modo == 'enlace_simbolico':
+        relativo = os.path.relpath(origen, os.path.dirname(destino))
+        if os.path.islink(destino) and os.readlink(destino) == relativo:
+            return False
+        os.stat(origen)  # Lanza FileNotFoundError si el perfil canónico no existe
+    elif modo == 'enlace_duro':
+        if os.path.exists(destino) and not os.path.islink(destino) and os.path.samefile(origen, destino):
+            return False
     
-    # Copiar archivos por área
-    total_copiados_html = 0
-    total_copiados_md = 0
+    temporal = destino + '.tmp'
+    if os.path.lexists(temporal):
+        os.remove(temporal)
+    
+    if modo == 'enlace_simbolico':
+        os.symlink(relativo, temporal)
+    elif modo == 'enlace_duro':
+        try:
+            os.link(origen, temporal)
+        except FileNotFoundError:
+            raise
+        except OSError:
+            # Otro sistema de archivos o sin soporte de enlaces duros
+            shutil.copy2(origen, temporal)
+    else:
+        shutil.copy2(origen, temporal)
+    
+    os.replace(temporal, destino)
+    return True
+
+def sincronizar_carpetas_area(areas_candidatos, carpeta_base, carpeta_origen, extension, modo, rutas=None, hashes=None):
+    """Actualiza en su lugar una carpeta por área y devuelve cuántos perfiles quedaron colocados
+    
+    Coloca los perfiles vigentes de cada área, borra los que ya no le corresponden
+    y elimina las carpetas de áreas sin candidatos. En modo 'virtual' las carpetas
+    de área no contienen perfiles.
+    
+    ``rutas`` es el manifiesto de rutas (ver rutas_postulantes.py), que se actualiza
+    en su lugar: de ahí salen la ruta de cada perfil canónico y lo que se colocó en
+    la ejecución anterior. Un perfil cuyo hash en ``hashes`` no cambió desde que se
+    colocó con el mismo modo se da por colocado sin tocar el disco.
+    """
+    if rutas is None:
+        rutas = {'postulantes': {}}
+    hashes = hashes or {}
+    formato = extension[1:]
+    clave_area = f"area_{formato}"
+    postulantes = rutas['postulantes']
+    mismo_modo = rutas.get('modo_areas') == modo
+    anteriores = rutas_de(rutas, clave_area)
+    # Sin registro de lo colocado antes (manifiesto nuevo), se revisa cada carpeta de área
+    barrer = rutas.get('modo_areas') is None
+    colocadas = {}
+    
+    os.makedirs(carpeta_base, exist_ok=True)
+    colocados = 0
     
     for area, candidatos in areas_candidatos.items():
-        # Crear subcarpetas para cada área
-        carpeta_area_html = os.path.join(carpeta_base_html, area)
-        carpeta_area_md = os.path.join(carpeta_base_md, area)
+        carpeta_area = os.path.join(carpeta_base, area)
+        # Si la carpeta del área no existía hay que colocar todo aunque el manifiesto diga lo contrario
+        carpeta_nueva = not os.path.isdir(carpeta_area)
+        os.makedirs(carpeta_area, exist_ok=True)
         
-        os.makedirs(carpeta_area_html, exist_ok=True)
-        os.makedirs(carpeta_area_md, exist_ok=True)
+        vigentes = set()
+        if modo != 'virtual':
+            for candidato in candidatos:
+                id_postulante = candidato['nombre_archivo']
+                archivo = f"{id_postulante}{extension}"
+                destino = os.path.join(carpeta_area, archivo)
+                salidas = postulantes.get(id_postulante, {})
+                hash_actual = hashes.get(id_postulante)
+                al_dia = (mismo_modo and not carpeta_nueva and hash_actual is not None
+                          and salidas.get(clave_area) == destino and salidas.get(f"hash_{clave_area}") == hash_actual)
+                if not al_dia:
+                    origen = salidas.get(formato) or os.path.join(carpeta_origen, archivo)
+                    try:
+                        if colocar_archivo(origen, destino, modo):
+                            contar('archivos_enlazados')
+                    except FileNotFoundError:
+                        print(f"  ❌ {formato.upper()} no encontrado: {id_postulante}")
+                        continue
+                    except OSError as e:
+                        registrar_error(f"{destino}: {e}")
+                        print(f"  ❌ No se pudo colocar {archivo} en {area}: {e}")
+                        continue
+                vigentes.add(archivo)
+                colocadas[id_postulante] = destino
+                colocados += 1
         
-        print(f"\n📁 Procesando área: {area}")
-        
-        for candidato in candidatos:
-            nombre_archivo = candidato['nombre_archivo']
-            
-            # Copiar archivo HTML
-            archivo_html_origen = os.path.join('perfiles_html', f"{nombre_archivo}.html")
-            archivo_html_destino = os.path.join(carpeta_area_html, f"{nombre_archivo}.html")
-            
-            if os.path.exists(archivo_html_origen):
-                shutil.copy2(archivo_html_origen, archivo_html_destino)
-                total_copiados_html += 1
-                print(f"  ✅ HTML: {candidato['nombre']}")
-            else:
-                print(f"  ❌ HTML no encontrado: {nombre_archivo}")
-            
-            # Copiar archivo MD
-            archivo_md_origen = os.path.join('perfiles_md', f"{nombre_archivo}.md")
-            archivo_md_destino = os.path.join(carpeta_area_md, f"{nombre_archivo}.md")
-            
-            if os.path.exists(archivo_md_origen):
-                shutil.copy2(archivo_md_origen, archivo_md_destino)
-                total_copiados_md += 1
-            else:
-                print(f"  ❌ MD no encontrado: {nombre_archivo}")
+        if barrer:
+            for archivo in os.listdir(carpeta_area):
+                if (archivo.endswith(extension) and archivo != PAGINA_RESUMEN and not es_pagina_indice(archivo)
+                        and archivo not in vigentes):
+                    os.remove(os.path.join(carpeta_area, archivo))
+    
+    # Borrar lo colocado antes que ya no corresponde (otra área, postulante eliminado o modo virtual)
+    for id_postulante, ruta in anteriores.items():
+        if colocadas.get(id_postulante) != ruta and os.path.lexists(ruta):
+            os.remove(ruta)
+    registrar_salida(rutas, clave_area, colocadas)
+    registrar_salida(rutas, f"hash_{clave_area}", {id_postulante: hashes.get(id_postulante) for id_postulante in colocadas})
     
-    # Crear índices HTML por área
-    crear_indices_por_area(areas_candidatos, carpeta_base_html)
+    for entrada in os.listdir(carpeta_base):
+        ruta = os.path.join(carpeta_base, entrada)
+        if entrada not in areas_candidatos and os.path.isdir(ruta) and not os.path.islink(ruta):
+            shutil.rmtree(ruta)
     
-    # Crear índice general
+    return colocados
+
+def distribuir_por_areas(areas_candidatos, carpeta_base_html, carpeta_base_md=None,
+                         carpeta_html='perfiles_html', carpeta_md='perfiles_md', modo=MODO_DISTRIBUCION,
+                         tamano_pagina=TAMANO_PAGINA):
+    """Construye las carpetas por área (sin copiar salvo en modo 'copia') y sus índices
+    
+    Devuelve (perfiles HTML colocados, perfiles MD colocados). Cada carpeta HTML
+    recibe la hoja de estilos compartida, porque los perfiles enlazados en ella la
+    buscan con una ruta relativa a su propia carpeta. Los índices de área se
+    dividen en páginas de ``tamano_pagina`` candidatos.
+    """
+    if modo not in MODOS_DISTRIBUCION:
+        raise ValueError(f"Modo de distribución desconocido: {modo} (opciones: {', '.join(MODOS_DISTRIBUCION)})")
+    
+    # Rutas de los perfiles canónicos y de lo colocado antes, y los hashes actuales de cada perfil
+    rutas = cargar_rutas()
+    total_html = sincronizar_carpetas_area(areas_candidatos, carpeta_base_html, carpeta_html, '.html', modo,
+                                           rutas, cargar_manifiesto(carpeta_html)['perfiles'])
+    escribir_hoja_estilos(carpeta_base_html)
+    for area in areas_candidatos:
+        escribir_hoja_estilos(os.path.join(carpeta_base_html, area))
+    
+    total_md = 0
+    if carpeta_base_md is not None:
+        total_md = sincronizar_carpetas_area(areas_candidatos, carpeta_base_md, carpeta_md, '.md', modo,
+                                             rutas, cargar_manifiesto(carpeta_md)['perfiles'])
+    rutas['modo_areas'] = modo
+    guardar_rutas(rutas)
+    
+    # En modo virtual los índices de área enlazan directamente a los perfiles canónicos
+    crear_indices_por_area(areas_candidatos, carpeta_base_html, carpeta_html if modo == 'virtual' else None, tamano_pagina)
     crear_indice_general(areas_candidatos, carpeta_base_html)
     
-    print(f"\n🎉 ¡Organización completada!")
-    print(f"📁 Archivos HTML organizados: {total_copiados_html}")
-    print(f"📁 Archivos MD organizados: {total_copiados_md}")
-    print(f"📂 Ubicación HTML: ./{carpeta_base_html}/")
-    print(f"📂 Ubicación MD: ./{carpeta_base_md}/")
-    print(f"🌐 Abre 'index_general.html' para ver la organización por áreas")
+    return total_html, total_md
 
-def crear_indices_por_area(areas_candidatos, carpeta_base_html):
-    """Crea un índice HTML para cada área"""
-    
-    css_style = """
-    <style>
-        body { 
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; 
-            max-width: 900px; 
-            margin: 0 auto; 
-            padding: 20px; 
-            line-height: 1.6;
-            background-color: #f8f9fa;
-        }
-        .container {
-            background: white;
-            padding: 30px;
-            border-radius: 10px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }
-        h1 { 
-            color: #2c3e50; 
-            border-bottom: 3px solid #3498db; 
-            padding-bottom: 10px;
-            text-align: center;
-        }
-        h2 { 
-            color: #34495e; 
-            margin-top: 25px;
-            margin-bottom: 15px;
-        }
-        .area-header {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 15px;
-            border-radius: 8px;
-            text-align: center;
-            margin-bottom: 20px;
-        }
-        .candidatos-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fill, minmax(250px, 1fr));
-            gap: 15px;
-            margin: 20px 0;
-        }
-        .candidato-card {
-            background: #f8f9fa;
-            padding: 15px;
-            border-radius: 8px;
-            border-left: 4px solid #3498db;
-            transition: transform 0.2s;
-        }
-        .candidato-card:hover {
-            transform: translateY(-2px);
-            box-shadow: 0 4px 8px rgba(0,0,0,0.1);
-        }
-        .nav-button {
-            display: inline-block;
-            padding: 10px 20px;
-            margin: 5px;
-            background: #3498db;
-            color: white;
-            text-decoration: none;
-            border-radius: 5px;
-            transition: background 0.3s;
-        }
-        .nav-button:hover {
-            background: #2980b9;
-        }
-        .stats {
-            background: #e8f4fd;
-            padding: 15px;
-            border-radius: 8px;
-            margin: 20px 0;
-            text-align: center;
-        }
-    </style>
+def organizar_por_areas(modo=MODO_DISTRIBUCION, usar_cache=True, tamano_pagina=TAMANO_PAGINA):
+    """Organiza los perfiles HTML y MD por área principal de interés
+    
+    Devuelve (perfiles HTML organizados, perfiles MD organizados), o None si no se
+    pudo leer el CSV.
     """
+    with etapa('areas'):
+        # Leer los registros limpios (del caché si el CSV no cambió) para obtener las áreas de interés
+        df = cargar_postulantes(ARCHIVO_CSV, usar_cache)
+        if df is None:
+            return None
+
+        areas_candidatos = agrupar_por_areas(almacenar_postulantes([df]))
     
-    for area, candidatos in areas_candidatos.items():
-        carpeta_area = os.path.join(carpeta_base_html, area)
-        
-        html_area = f"""
+        # Actualizar en su lugar la estructura de carpetas por área y sus índices
+        carpeta_base_html = 'perfiles_por_area_html'
+        carpeta_base_md = 'perfiles_por_area_md'
+    
+        print(f"\n📁 Distribuyendo perfiles por área (modo: {modo})")
+        total_copiados_html, total_copiados_md = distribuir_por_areas(areas_candidatos, carpeta_base_html, carpeta_base_md,
+                                                                      modo=modo, tamano_pagina=tamano_pagina)
+    
+        print(f"\n🎉 ¡Organización completada!")
+        print(f"📁 Archivos HTML organizados: {total_copiados_html}")
+        print(f"📁 Archivos MD organizados: {total_copiados_md}")
+        print(f"📂 Ubicación HTML: ./{carpeta_base_html}/")
+        print(f"📂 Ubicación MD: ./{carpeta_base_md}/")
+        print(f"🌐 Abre '{ARCHIVO_INDICE_GENERAL}' para ver la organización por áreas")
+    
+        return total_copiados_html, total_copiados_md
+
+def _pagina_area(area, subtitulo, cuerpo):
+    """Envuelve el contenido de una página del índice de un área en la página completa con estilo"""
+    return f"""
         <!DOCTYPE html>
         <html lang="es">
         <head>
             <meta charset="UTF-8">
             <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <title>Área: {area} - ACECOM PAM 2025</title>
-            {css_style}
+            <title>Área: {escape(area, quote=False)}{subtitulo} - ACECOM PAM 2025</title>
+            {enlace_estilos()}
         </head>
-        <body>
+        <body class="pagina-area">
             <div class="container">
-                <h1>🎯 Área: {area}</h1>
-                
-                <div class="area-header">
-                    <h2>📋 Candidatos Postulantes</h2>
-                </div>
-                
-                <div class="stats">
-                    <strong>📊 Total de candidatos en esta área: {len(candidatos)}</strong>
+                <h1>🎯 Área: {escape(area, quote=False)}</h1>
+                {cuerpo}
+                <div style="text-align: center; margin-top: 30px;">
+                    <a href="../{ARCHIVO_INDICE_GENERAL}" class="nav-button">🏠 Volver al Índice General</a>
                 </div>
-                
-                <div class="candidatos-grid">
+            </div>
+        </body>
+        </html>
         """
-        
-        for candidato in sorted(candidatos, key=lambda x: x['nombre']):
-            nombre_display = candidato['nombre']
-            nombre_archivo = candidato['nombre_archivo']
-            
-            html_area += f"""
+
+def _tarjetas_candidatos(candidatos, prefijo):
+    """Una tarjeta con enlace al perfil por cada candidato"""
+    return ''.join(f"""
                     <div class="candidato-card">
-                        <h3>👤 {nombre_display}</h3>
-                        <a href="{nombre_archivo}.html" class="nav-button">Ver Perfil</a>
+                        <h3>👤 {escape(candidato['nombre'], quote=False)}</h3>
+                        <a href="{prefijo}{candidato['nombre_archivo']}.html" class="nav-button">Ver Perfil</a>
                     </div>
-            """
-        
-        html_area += f"""
+            """ for candidato in candidatos)
+
+def generar_indice_area(area, candidatos, prefijo='', tamano_pagina=TAMANO_PAGINA):
+    """Genera el índice de un área como {archivo: html}, paginado si supera ``tamano_pagina`` candidatos"""
+    candidatos = sorted(candidatos, key=lambda x: x['nombre'])
+    encabezado = f"""
+                <div class="area-header">
+                    <h2>📋 Candidatos Postulantes</h2>
                 </div>
                 
-                <div style="text-align: center; margin-top: 30px;">
-                    <a href="../index_general.html" class="nav-button">🏠 Volver al Índice General</a>
+                <div class="stats">
+                    <strong>📊 Total de candidatos en esta área: {len(candidatos)}</strong>
                 </div>
-            </div>
-        </body>
-        </html>
         """
+    
+    paginas = paginar(candidatos, tamano_pagina)
+    if len(paginas) == 1:
+        cuerpo = f'{encabezado}<div class="candidatos-grid">{_tarjetas_candidatos(candidatos, prefijo)}</div>'
+        return {PAGINA_RESUMEN: _pagina_area(area, '', cuerpo)}
+    
+    # Resumen liviano con un enlace por página (primer y último candidato de cada una)
+    indice = {PAGINA_RESUMEN: _pagina_area(area, '', encabezado + enlaces_paginas(paginas, lambda candidato: escape(candidato['nombre'], quote=False)))}
+    for numero, pagina in enumerate(paginas, start=1):
+        navegacion = navegacion_paginas(numero, len(paginas))
+        cuerpo = f'{navegacion}<div class="candidatos-grid">{_tarjetas_candidatos(pagina, prefijo)}</div>{navegacion}'
+        indice[nombre_pagina(numero)] = _pagina_area(area, f' - Página {numero}', cuerpo)
+    return indice
+
+def crear_indices_por_area(areas_candidatos, carpeta_base_html, carpeta_perfiles=None, tamano_pagina=TAMANO_PAGINA):
+    """Crea el índice HTML de cada área (enlazando a ``carpeta_perfiles`` si se indica)"""
+    
+    for area, candidatos in areas_candidatos.items():
+        carpeta_area = os.path.join(carpeta_base_html, area)
+        prefijo = ''
+        if carpeta_perfiles is not None:
+            prefijo = os.path.relpath(carpeta_perfiles, carpeta_area).replace(os.sep, '/') + '/'
         
-        # Escribir índice del área
-        with open(os.path.join(carpeta_area, 'index.html'), 'w', encoding='utf-8') as f:
-            f.write(html_area)
+        # Escribir índice del área (y sus páginas si hay muchos candidatos)
+        escribir_paginas(carpeta_area, generar_indice_area(area, candidatos, prefijo, tamano_pagina))
         
-        print(f"  📄 Índice creado para área: {area}")
+        progreso(f"  📄 Índice creado para área: {area}")
 
-def crear_indice_general(areas_candidatos, carpeta_base_html):
-    """Crea el índice general con todas las áreas"""
-    
-    css_style = """
-    <style>
-        body { 
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; 
-            max-width: 1000px; 
-            margin: 0 auto; 
-            padding: 20px; 
-            line-height: 1.6;
-            background-color: #f8f9fa;
-        }
-        .container {
-            background: white;
-            padding: 30px;
-            border-radius: 10px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }
-        h1 { 
-            color: #2c3e50; 
-            border-bottom: 3px solid #3498db; 
-            padding-bottom: 10px;
-            text-align: center;
-        }
-        .areas-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fill, minmax(300px, 1fr));
-            gap: 20px;
-            margin: 30px 0;
-        }
-        .area-card {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 25px;
-            border-radius: 10px;
-            text-align: center;
-            transition: transform 0.3s;
-            box-shadow: 0 4px 8px rgba(0,0,0,0.1);
-        }
-        .area-card:hover {
-            transform: translateY(-5px);
-            box-shadow: 0 8px 16px rgba(0,0,0,0.2);
-        }
-        .area-title {
-            font-size: 1.3em;
-            font-weight: bold;
-            margin-bottom: 10px;
-        }
-        .area-count {
-            font-size: 2em;
-            font-weight: bold;
-            margin: 15px 0;
-        }
-        .nav-button {
-            display: inline-block;
-            padding: 10px 20px;
-            margin: 10px 5px;
-            background: rgba(255,255,255,0.2);
-            color: white;
-            text-decoration: none;
-            border-radius: 5px;
-            transition: background 0.3s;
-        }
-        .nav-button:hover {
-            background: rgba(255,255,255,0.3);
-        }
-        .stats-summary {
-            background: #e8f4fd;
-            padding: 20px;
-            border-radius: 8px;
-            margin: 20px 0;
-            text-align: center;
-        }
-        .total-stat {
-            font-size: 1.5em;
-            color: #2c3e50;
-            font-weight: bold;
-        }
-    </style>
-    """
+def generar_indice_general(areas_candidatos):
+    """Genera el HTML del índice general con todas las áreas"""
     
     total_candidatos = sum(len(candidatos) for candidatos in areas_candidatos.values())
     
@@ -330,9 +326,9 @@ def crear_indice_general(areas_candidatos, carpeta_base_html):
         <meta charset="UTF-8">
         <meta name="viewport" content="width=device-width, initial-scale=1.0">
         <title>Perfiles por Área - ACECOM PAM 2025</title>
-        {css_style}
+        {enlace_estilos()}
     </head>
-    <body>
+    <body class="pagina-general">
         <div class="container">
             <h1>🎓 Perfiles ACECOM PAM 2025 - Organizados por Área</h1>
             
@@ -351,10 +347,10 @@ def crear_indice_general(areas_candidatos, carpeta_base_html):
     for area, candidatos in areas_ordenadas:
         html_general += f"""
             <div class="area-card">
-                <div class="area-title">🎯 {area}</div>
+                <div class="area-title">🎯 {escape(area, quote=False)}</div>
                 <div class="area-count">{len(candidatos)}</div>
                 <div>candidatos</div>
-                <a href="{area}/index.html" class="nav-button">Ver Candidatos</a>
+                <a href="{escape(area)}/index.html" class="nav-button">Ver Candidatos</a>
             </div>
         """
     
@@ -371,11 +367,14 @@ def crear_indice_general(areas_candidatos, carpeta_base_html):
     </html>
     """
     
-    # Escribir índice general
-    with open(os.path.join(carpeta_base_html, 'index_general.html'), 'w', encoding='utf-8') as f:
-        f.write(html_general)
+    return html_general
+
+def crear_indice_general(areas_candidatos, carpeta_base_html):
+    """Crea el índice general con todas las áreas"""
+    escribir_archivo(os.path.join(carpeta_base_html, ARCHIVO_INDICE_GENERAL), generar_indice_general(areas_candidatos))
     
     print(f"📄 Índice general creado")
 
 if __name__ == "__main__":
-    organizar_por_areas()
\ No newline at end of file
+    organizar_por_areas()
+    guardar_informe()
\ No newline at end of file
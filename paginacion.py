@@ -0,0 +1,67 @@
+import os
+import re
+
+from escritor import escribir_archivo
+
+# Índices paginados: con más postulantes que TAMANO_PAGINA, index.html pasa a ser un
+# resumen liviano que enlaza a páginas de tamaño fijo (pagina-001.html, pagina-002.html...),
+# cada una con enlaces a la anterior y a la siguiente. Con pocos postulantes el índice
+# sigue siendo una sola página.
+
+TAMANO_PAGINA = int(os.environ.get('PAM_TAMANO_PAGINA', '200'))
+PAGINA_RESUMEN = 'index.html'
+_PATRON_PAGINA = re.compile(r'pagina-\d+\.html')
+
+def paginar(elementos, tamano_pagina=TAMANO_PAGINA):
+    """Reparte los elementos en páginas de ``tamano_pagina`` (siempre al menos una; 0 = sin paginar)"""
+    elementos = list(elementos)
+    if not tamano_pagina or tamano_pagina <= 0:
+        return [elementos]
+    return [elementos[i:i + tamano_pagina] for i in range(0, len(elementos), tamano_pagina)] or [[]]
+
+def nombre_pagina(numero):
+    """Archivo de la página ``numero`` (desde 1) de un índice paginado"""
+    return f"pagina-{numero:03d}.html"
+
+def es_pagina_indice(archivo):
+    """Indica si un archivo es una página de un índice paginado (no un perfil)"""
+    return _PATRON_PAGINA.fullmatch(archivo) is not None
+
+def existe_pagina(archivo, elementos, tamano_pagina=TAMANO_PAGINA):
+    """Indica si ``archivo`` es el resumen o una de las páginas que tiene el índice de ``elementos``"""
+    if archivo == PAGINA_RESUMEN:
+        return True
+    if not es_pagina_indice(archivo):
+        return False
+    # Un índice de una sola página no tiene pagina-001.html: todo está en el resumen
+    total_paginas = len(paginar(elementos, tamano_pagina))
+    numero = int(archivo[len('pagina-'):-len('.html')])
+    return total_paginas > 1 and 1 <= numero <= total_paginas and archivo == nombre_pagina(numero)
+
+def navegacion_paginas(numero, total_paginas):
+    """Botones de resumen, página anterior y siguiente de una página del índice"""
+    partes = ['<div class="nav-buttons">', f'<a href="{PAGINA_RESUMEN}" class="nav-button">🏠 Resumen</a>']
+    if numero > 1:
+        partes.append(f'<a href="{nombre_pagina(numero - 1)}" class="nav-button">⬅️ Anterior</a>')
+    if numero < total_paginas:
+        partes.append(f'<a href="{nombre_pagina(numero + 1)}" class="nav-button">➡️ Siguiente</a>')
+    partes.append(f'<p>Página {numero} de {total_paginas}</p>')
+    partes.append('</div>')
+    return ''.join(partes)
+
+def enlaces_paginas(paginas, etiqueta):
+    """Lista de enlaces a cada página para el resumen, con el primer y el último elemento de cada una"""
+    partes = []
+    for numero, pagina in enumerate(paginas, start=1):
+        rango = f"{etiqueta(pagina[0])} – {etiqueta(pagina[-1])}" if pagina else ''
+        partes.append(f'<p><a href="{nombre_pagina(numero)}" class="nav-button">📄 Página {numero}</a> {rango}</p>\n')
+    return ''.join(partes)
+
+def escribir_paginas(carpeta, paginas):
+    """Escribe las páginas de un índice ({archivo: html}) y borra las páginas que sobran de antes"""
+    for archivo, contenido in paginas.items():
+        escribir_archivo(os.path.join(carpeta, archivo), contenido)
+
+    for archivo in os.listdir(carpeta):
+        if es_pagina_indice(archivo) and archivo not in paginas:
+            os.remove(os.path.join(carpeta, archivo))
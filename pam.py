@@ -0,0 +1,247 @@
+import argparse
+import sys
+
+# Punto de entrada único del flujo de perfiles: python pam.py <subcomando> [opciones]
+# Cada subcomando importa solo los módulos que usa (pandas, markdown...), para que
+# las llamadas frecuentes desde hooks y cron arranquen rápido.
+
+def _argumentos_render(args):
+    """Opciones de renderizado comunes a build, html y all"""
+    argumentos = {'incremental': not args.completo}
+    if args.trabajadores is not None:
+        argumentos['trabajadores'] = args.trabajadores
+    return argumentos
+
+def _argumentos_paginas(args):
+    """Tamaño de página de los índices, solo si se indicó en la línea de comandos"""
+    return {} if args.tamano_pagina is None else {'tamano_pagina': args.tamano_pagina}
+
+def _modo_valido(modo):
+    """Comprueba el modo de las carpetas por área (requiere haber importado organizar_por_areas)"""
+    from organizar_por_areas import MODOS_DISTRIBUCION
+    if modo not in MODOS_DISTRIBUCION:
+        print(f"❌ Error: modo de áreas desconocido '{modo}' (opciones: {', '.join(MODOS_DISTRIBUCION)})")
+        return False
+    return True
+
+def comando_build(args):
+    """Genera los perfiles Markdown a partir del CSV"""
+    from organizador import main
+    return main(usar_cache=not args.sin_cache, **_argumentos_render(args))
+
+def comando_html(args):
+    """Convierte los perfiles Markdown a páginas HTML"""
+    from convertir_html import md_a_html
+    return md_a_html(**_argumentos_render(args), **_argumentos_paginas(args))
+
+def comando_areas(args):
+    """Organiza los perfiles ya generados por área de interés"""
+    from organizar_por_areas import MODO_DISTRIBUCION, organizar_por_areas
+    modo = args.modo_areas or MODO_DISTRIBUCION
+    if not _modo_valido(modo):
+        return None
+    return organizar_por_areas(modo, usar_cache=not args.sin_cache, **_argumentos_paginas(args))
+
+def comando_indicators(args):
+    """Muestra la disponibilidad de cada candidato y corrige perfiles antiguos"""
+    from añadir_indicadores import añadir_indicadores_disponibilidad
+    return añadir_indicadores_disponibilidad(usar_cache=not args.sin_cache)
+
+def comando_excel(args):
+    """Exporta los postulantes a resultados_ordenados.xlsx, una hoja por área"""
+    from exportar_excel import exportar_excel
+    return exportar_excel(usar_cache=not args.sin_cache)
+
+def comando_all(args):
+    """Genera todas las salidas en una única pasada (pipeline.py)"""
+    from pipeline import ejecutar_pipeline
+    from organizar_por_areas import MODO_DISTRIBUCION
+    modo = args.modo_areas or MODO_DISTRIBUCION
+    if not _modo_valido(modo):
+        return None
+    return ejecutar_pipeline(con_md=not args.sin_md, con_excel=not args.sin_excel, modo_areas=modo, usar_cache=not args.sin_cache,
+                             con_base=args.con_base or args.base is not None, archivo_base=args.base,
+                             **_argumentos_render(args), **_argumentos_paginas(args))
+
+def comando_batch(args):
+    """Une varias exportaciones (rondas) en una sola cohorte y genera todas sus salidas"""
+    from lotes import LECTORES, ejecutar_lote
+    from organizar_por_areas import MODO_DISTRIBUCION
+    modo = args.modo_areas or MODO_DISTRIBUCION
+    if not _modo_valido(modo):
+        return None
+    return ejecutar_lote(args.exportaciones, lectores=args.lectores or LECTORES, con_md=not args.sin_md,
+                         con_excel=not args.sin_excel, modo_areas=modo, usar_cache=not args.sin_cache,
+                         **_argumentos_render(args), **_argumentos_paginas(args))
+
+def comando_watch(args):
+    """Vigila el CSV (o una carpeta de exportaciones) y reconstruye solo lo que cambió"""
+    from organizar_por_areas import MODO_DISTRIBUCION
+    from vigilar import vigilar
+    modo = args.modo_areas or MODO_DISTRIBUCION
+    if not _modo_valido(modo):
+        return None
+    argumentos = _argumentos_paginas(args)
+    if args.trabajadores is not None:
+        argumentos['trabajadores'] = args.trabajadores
+    if args.intervalo is not None:
+        argumentos['intervalo'] = args.intervalo
+    return vigilar(args.ruta, con_md=not args.sin_md, con_excel=args.excel, modo_areas=modo, **argumentos)
+
+def comando_serve(args):
+    """Sirve los perfiles, índices y áreas renderizándolos al pedirlos, sin escribir archivos"""
+    from servidor import servir
+    argumentos = _argumentos_paginas(args)
+    if args.puerto is not None:
+        argumentos['puerto'] = args.puerto
+    return servir(args.ruta, host=args.host, usar_cache=not args.sin_cache, **argumentos)
+
+def comando_bundle(args):
+    """Genera todas las salidas en un solo archivo: zip, tar, tar.gz o una página HTML única"""
+    from paquetes import FORMATOS_PAQUETE, empaquetar
+    if args.formato not in FORMATOS_PAQUETE:
+        print(f"❌ Error: formato de paquete desconocido '{args.formato}' (opciones: {', '.join(FORMATOS_PAQUETE)})")
+        return None
+    argumentos = _argumentos_paginas(args)
+    if args.trabajadores is not None:
+        argumentos['trabajadores'] = args.trabajadores
+    return empaquetar(args.ruta, formato=args.formato, ruta_salida=args.salida, con_md=not args.sin_md,
+                      usar_cache=not args.sin_cache, **argumentos)
+
+def comando_db(args):
+    """Guarda cada exportación como una cohorte en la base SQLite (upsert por ID)"""
+    from base_postulantes import ARCHIVO_BASE, cargar_en_base
+    return cargar_en_base(args.exportaciones, args.base or ARCHIVO_BASE, usar_cache=not args.sin_cache)
+
+def comando_search(args):
+    """Busca postulantes en la base SQLite por sus respuestas, con filtros"""
+    from base_postulantes import ARCHIVO_BASE, LIMITE_RESULTADOS, buscar, imprimir_resultados
+    resultados = buscar(' '.join(args.texto), args.base or ARCHIVO_BASE, cohorte=args.cohorte, area=args.area,
+                        indicador=args.indicador, limite=args.limite or LIMITE_RESULTADOS)
+    if resultados is not None:
+        imprimir_resultados(resultados)
+    return resultados
+
+def crear_parser():
+    """Construye el parser de argumentos con un subcomando por paso del flujo"""
+    render = argparse.ArgumentParser(add_help=False)
+    render.add_argument('--completo', action='store_true',
+                        help='regenerar todo, ignorando los manifiestos de la ejecución anterior')
+    render.add_argument('-t', '--trabajadores', type=int, default=None,
+                        help='procesos para renderizar (por defecto PAM_TRABAJADORES o 1)')
+
+    paginas = argparse.ArgumentParser(add_help=False)
+    paginas.add_argument('--tamano-pagina', type=int, default=None,
+                         help='postulantes por página en los índices (por defecto PAM_TAMANO_PAGINA o 200; 0 = sin paginar)')
+
+    cache = argparse.ArgumentParser(add_help=False)
+    cache.add_argument('--sin-cache', action='store_true',
+                       help='leer el CSV aunque el caché de postulantes esté al día')
+
+    areas = argparse.ArgumentParser(add_help=False)
+    areas.add_argument('--modo-areas', default=None,
+                       help='enlace_duro, enlace_simbolico, virtual o copia (por defecto PAM_MODO_AREAS o enlace_duro)')
+
+    parser = argparse.ArgumentParser(prog='pam', description='Perfiles de postulantes ACECOM PAM 2025')
+    parser.add_argument('-q', '--silencioso', action='store_true',
+                        help='no imprimir una línea por archivo, solo resúmenes y errores (también PAM_SILENCIOSO=1)')
+    parser.add_argument('--informe', default=None,
+                        help='archivo JSON con las métricas de la ejecución (por defecto informe_ejecucion.json)')
+    subcomandos = parser.add_subparsers(dest='subcomando', metavar='subcomando', required=True)
+
+    subcomando = subcomandos.add_parser('build', parents=[render, cache], help='generar los perfiles Markdown')
+    subcomando.set_defaults(funcion=comando_build)
+
+    subcomando = subcomandos.add_parser('html', parents=[render, paginas], help='convertir los perfiles Markdown a HTML')
+    subcomando.set_defaults(funcion=comando_html)
+
+    subcomando = subcomandos.add_parser('areas', parents=[cache, areas, paginas], help='organizar los perfiles por área')
+    subcomando.set_defaults(funcion=comando_areas)
+
+    subcomando = subcomandos.add_parser('indicators', parents=[cache], help='revisar los indicadores de disponibilidad')
+    subcomando.set_defaults(funcion=comando_indicators)
+
+    subcomando = subcomandos.add_parser('excel', parents=[cache], help='exportar el Excel con una hoja por área')
+    subcomando.set_defaults(funcion=comando_excel)
+
+    subcomando = subcomandos.add_parser('batch', parents=[render, cache, areas, paginas],
+                                        help='unir varias exportaciones (rondas) en una sola cohorte',
+                                        description='Une varias exportaciones en una sola cohorte. La ronda de cada '
+                                                    'postulante aparece como la respuesta "Ronda" de su perfil, pero '
+                                                    'no hay índices por ronda: quien postuló en varias rondas queda '
+                                                    'con un solo perfil, el de su envío más reciente. Al leer se '
+                                                    'informa, por ronda, a cuántos postulantes les quedó el perfil '
+                                                    'de otra ronda.')
+    subcomando.add_argument('exportaciones', nargs='+', help='CSV, globs o carpetas con exportaciones')
+    subcomando.add_argument('--lectores', type=int, default=None,
+                            help='exportaciones leídas a la vez (por defecto PAM_LECTORES o 4)')
+    subcomando.add_argument('--sin-md', action='store_true', help='no generar los perfiles Markdown')
+    subcomando.add_argument('--sin-excel', action='store_true', help='no exportar resultados_ordenados.xlsx')
+    subcomando.set_defaults(funcion=comando_batch)
+
+    subcomando = subcomandos.add_parser('watch', parents=[areas, paginas],
+                                        help='reconstruir automáticamente cuando cambie la exportación')
+    subcomando.add_argument('ruta', nargs='?', default='PAM 2025_2.csv', help='CSV o carpeta de exportaciones a vigilar')
+    subcomando.add_argument('--intervalo', type=float, default=None,
+                            help='segundos entre revisiones (por defecto PAM_INTERVALO_SONDEO o 2)')
+    subcomando.add_argument('-t', '--trabajadores', type=int, default=None, help='procesos para renderizar')
+    subcomando.add_argument('--sin-md', action='store_true', help='no generar los perfiles Markdown')
+    subcomando.add_argument('--excel', action='store_true', help='regenerar también resultados_ordenados.xlsx')
+    subcomando.set_defaults(funcion=comando_watch)
+
+    subcomando = subcomandos.add_parser('serve', parents=[cache, paginas],
+                                        help='servidor local de revisión que renderiza las páginas al pedirlas')
+    subcomando.add_argument('ruta', nargs='?', default='PAM 2025_2.csv', help='CSV a servir')
+    subcomando.add_argument('--host', default='127.0.0.1', help='dirección en la que escuchar')
+    subcomando.add_argument('--puerto', type=int, default=None, help='puerto (por defecto PAM_PUERTO o 8000)')
+    subcomando.set_defaults(funcion=comando_serve)
+
+    subcomando = subcomandos.add_parser('bundle', parents=[cache, paginas],
+                                        help='generar todas las salidas en un solo archivo (zip, tar o HTML)')
+    subcomando.add_argument('ruta', nargs='?', default='PAM 2025_2.csv', help='CSV a empaquetar')
+    subcomando.add_argument('-f', '--formato', default='zip', help='zip, tar, tar.gz o html (por defecto zip)')
+    subcomando.add_argument('-o', '--salida', default=None, help='archivo a generar (por defecto perfiles_pam.<formato>)')
+    subcomando.add_argument('-t', '--trabajadores', type=int, default=None, help='procesos para renderizar')
+    subcomando.add_argument('--sin-md', action='store_true', help='no incluir los perfiles Markdown')
+    subcomando.set_defaults(funcion=comando_bundle)
+
+    base = argparse.ArgumentParser(add_help=False)
+    base.add_argument('--base', default=None, help='archivo SQLite (por defecto PAM_BASE o postulantes.sqlite3)')
+
+    subcomando = subcomandos.add_parser('db', parents=[cache, base],
+                                        help='guardar las exportaciones en la base SQLite con búsqueda de texto')
+    subcomando.add_argument('exportaciones', nargs='*', default=['PAM 2025_2.csv'],
+                            help='CSV, globs o carpetas; cada exportación es una cohorte')
+    subcomando.set_defaults(funcion=comando_db)
+
+    subcomando = subcomandos.add_parser('search', parents=[base], help='buscar postulantes en la base SQLite')
+    subcomando.add_argument('texto', nargs='*', help='palabras a buscar en las respuestas (vacío = solo filtrar)')
+    subcomando.add_argument('--cohorte', default=None, help='solo esta cohorte (nombre del CSV sin extensión)')
+    subcomando.add_argument('--area', default=None, help='solo esta área principal')
+    subcomando.add_argument('--indicador', default=None, help='solo este indicador de disponibilidad (p. ej. 🟢)')
+    subcomando.add_argument('-n', '--limite', type=int, default=None, help='máximo de resultados (por defecto 20)')
+    subcomando.set_defaults(funcion=comando_search)
+
+    subcomando = subcomandos.add_parser('all', parents=[render, cache, areas, paginas, base], help='generar todo en una sola pasada')
+    subcomando.add_argument('--sin-md', action='store_true', help='no generar los perfiles Markdown')
+    subcomando.add_argument('--sin-excel', action='store_true', help='no exportar resultados_ordenados.xlsx')
+    subcomando.add_argument('--con-base', action='store_true',
+                            help='guardar también la cohorte en la base SQLite (implícito con --base)')
+    subcomando.set_defaults(funcion=comando_all)
+
+    return parser
+
+def main(argv=None):
+    """Ejecuta el subcomando pedido; devuelve 0 si terminó bien y 1 si falló"""
+    args = crear_parser().parse_args(argv)
+    from instrumentacion import ARCHIVO_INFORME, activar_silencio, guardar_informe
+    if args.silencioso:
+        activar_silencio()
+    try:
+        resultado = args.funcion(args)
+    finally:
+        guardar_informe(args.informe or ARCHIVO_INFORME)
+    return 1 if resultado is None else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
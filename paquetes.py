@@ -0,0 +1,287 @@
+import gzip
+import io
+import os
+import sys
+import tarfile
+import zipfile
+from html import escape
+
+from añadir_indicadores import obtener_indicador
+from convertir_html import generar_botones_nav, generar_contenido_html, generar_indice_html, generar_pagina_perfil
+from esquema import compilar_esquema
+from estilos import CSS_COMPARTIDO, HOJA_ESTILOS
+from indice_busqueda import CARPETA_BUSQUEDA, archivos_indice_busqueda, normalizar_texto
+from instrumentacion import etapa, guardar_informe, progreso, registrar_error, registrar_escritura
+from organizador import ARCHIVO_CSV, CARPETA_PERFILES, almacenar_postulantes, cargar_postulantes, generar_perfil_md
+from organizar_por_areas import (ARCHIVO_INDICE_GENERAL, PREFIJO_PERFILES_AREA, agrupar_por_areas, generar_indice_area,
+                                 generar_indice_general)
+from paginacion import TAMANO_PAGINA
+from paralelo import TRABAJADORES, crear_pool, mapear_por_lotes
+from pipeline import CARPETA_AREA_HTML, CARPETA_HTML, documentos_de_registros
+
+# Salidas en un solo archivo, para repartir o sincronizar la cohorte sin mover miles
+# de archivos pequeños:
+#   'zip', 'tar', 'tar.gz' -> perfiles_html/, perfiles_md/, índices, búsqueda e índices
+#                             por área con las mismas rutas que en disco (las áreas en
+#                             modo virtual: enlazan a perfiles_html/ en vez de repetirlos)
+#   'html'                 -> una sola página autocontenida con la lista de postulantes
+#                             y cada perfil en un <template> que solo se muestra al abrirlo
+# Los perfiles se renderizan por bloques y cada archivo se agrega al paquete en cuanto
+# está listo, así la memoria no crece con el tamaño de la cohorte. Las entradas llevan
+# una fecha fija: con los mismos datos el paquete sale idéntico byte a byte y las
+# herramientas de sincronización no lo vuelven a subir.
+
+FORMATOS_PAQUETE = ['zip', 'tar', 'tar.gz', 'html']
+ARCHIVO_PAQUETE = 'perfiles_pam'  # Nombre por defecto, sin la extensión del formato
+BLOQUE_PERFILES = 512  # Perfiles renderizados a la vez antes de agregarlos al paquete
+FECHA_ENTRADAS = (2025, 1, 1, 0, 0, 0)
+MARCA_TIEMPO_ENTRADAS = 1735689600  # FECHA_ENTRADAS en segundos (UTC), para tar y gzip
+
+def ordenar_perfiles(almacen, esquema):
+    """Nombre, indicador y posición de cada postulante, en el orden de los índices: {id: perfil}"""
+    postulantes = {id_postulante: (nombre_persona, row) for id_postulante, nombre_persona, row in almacen.postulantes()}
+    orden = sorted(postulantes, key=lambda id_postulante: (postulantes[id_postulante][0], id_postulante))
+    return {id_postulante: {'nombre': postulantes[id_postulante][0],
+                            'indicador': obtener_indicador(postulantes[id_postulante][1], esquema),
+                            'posicion': posicion}
+            for posicion, id_postulante in enumerate(orden)}
+
+def _renderizar(pendiente):
+    """Renderiza el Markdown (si se pide) y el HTML del contenido de un perfil; usable en otro proceso"""
+    nombre_persona, row, esquema, indicador, con_md = pendiente
+    contenido_md = generar_perfil_md(row, nombre_persona, esquema, indicador) if con_md else None
+    return contenido_md, generar_contenido_html(row, nombre_persona, esquema, indicador)
+
+def perfiles_renderizados(almacen, perfiles, esquema, con_md=False, trabajadores=TRABAJADORES, bloque=BLOQUE_PERFILES):
+    """Genera (id, markdown, contenido_html) de cada perfil en orden, renderizando de a ``bloque`` perfiles"""
+    ids = list(perfiles)
+    pool = crear_pool(trabajadores)
+    try:
+        for inicio in range(0, len(ids), bloque):
+            pendientes = []
+            for id_postulante in ids[inicio:inicio + bloque]:
+                nombre_persona, row = almacen.obtener(id_postulante)
+                pendientes.append((nombre_persona, row, esquema, perfiles[id_postulante]['indicador'], con_md))
+            for id_postulante, (contenido_md, contenido_html) in zip(ids[inicio:inicio + bloque],
+                                                                   mapear_por_lotes(_renderizar, pendientes, pool)):
+                yield id_postulante, contenido_md, contenido_html
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+def archivos_del_sitio(almacen, esquema, con_md=True, tamano_pagina=TAMANO_PAGINA, trabajadores=TRABAJADORES):
+    """Genera (ruta, contenido) de cada archivo de las salidas, con las mismas rutas relativas que en disco"""
+    perfiles = ordenar_perfiles(almacen, esquema)
+    archivos_html = [f"{id_postulante}.html" for id_postulante in perfiles]
+
+    yield f"{CARPETA_HTML}/{HOJA_ESTILOS}", CSS_COMPARTIDO
+    for id_postulante, contenido_md, contenido_html in perfiles_renderizados(almacen, perfiles, esquema, con_md, trabajadores):
+        perfil = perfiles[id_postulante]
+        botones_nav = generar_botones_nav(archivos_html, perfil['posicion'])
+        yield f"{CARPETA_HTML}/{id_postulante}.html", generar_pagina_perfil(perfil['nombre'], contenido_html, botones_nav,
+                                                                           perfil['indicador'])
+        if con_md:
+            yield f"{CARPETA_PERFILES}/{id_postulante}.md", contenido_md
+
+    indice = [(id_postulante, perfil['nombre']) for id_postulante, perfil in perfiles.items()]
+    for archivo, contenido in generar_indice_html(indice, tamano_pagina).items():
+        yield f"{CARPETA_HTML}/{archivo}", contenido
+    for archivo, contenido in archivos_indice_busqueda(documentos_de_registros(almacen, perfiles, esquema)).items():
+        yield f"{CARPETA_HTML}/{CARPETA_BUSQUEDA}/{archivo}", contenido
+
+    areas_candidatos = agrupar_por_areas(almacen)
+    yield f"{CARPETA_AREA_HTML}/{HOJA_ESTILOS}", CSS_COMPARTIDO
+    yield f"{CARPETA_AREA_HTML}/{ARCHIVO_INDICE_GENERAL}", generar_indice_general(areas_candidatos)
+    for area, candidatos in areas_candidatos.items():
+        yield f"{CARPETA_AREA_HTML}/{area}/{HOJA_ESTILOS}", CSS_COMPARTIDO
+        for archivo, contenido in generar_indice_area(area, candidatos, PREFIJO_PERFILES_AREA, tamano_pagina).items():
+            yield f"{CARPETA_AREA_HTML}/{area}/{archivo}", contenido
+
+def escribir_zip(f, archivos):
+    """Agrega cada (ruta, contenido) a un zip comprimido escrito en ``f``; devuelve cuántos archivos agregó"""
+    total = 0
+    with zipfile.ZipFile(f, 'w', zipfile.ZIP_DEFLATED) as paquete:
+        for ruta, contenido in archivos:
+            entrada = zipfile.ZipInfo(ruta, date_time=FECHA_ENTRADAS)
+            entrada.external_attr = 0o644 << 16
+            paquete.writestr(entrada, contenido.encode('utf-8'), compress_type=zipfile.ZIP_DEFLATED)
+            progreso(f"📦 {ruta}")
+            total += 1
+    return total
+
+def escribir_tar(f, archivos, comprimir=False):
+    """Agrega cada (ruta, contenido) a un tar (gzip si ``comprimir``) escrito en ``f``; devuelve cuántos archivos agregó"""
+    # El gzip se abre aparte para fijar su fecha; tarfile pondría la hora actual
+    salida = gzip.GzipFile(filename='', fileobj=f, mode='wb', mtime=MARCA_TIEMPO_ENTRADAS) if comprimir else f
+    total = 0
+    try:
+        with tarfile.open(fileobj=salida, mode='w|', format=tarfile.PAX_FORMAT) as paquete:
+            for ruta, contenido in archivos:
+                datos = contenido.encode('utf-8')
+                entrada = tarfile.TarInfo(ruta)
+                entrada.size = len(datos)
+                entrada.mtime = MARCA_TIEMPO_ENTRADAS
+                entrada.mode = 0o644
+                paquete.addfile(entrada, io.BytesIO(datos))
+                progreso(f"📦 {ruta}")
+                total += 1
+    finally:
+        if comprimir:
+            salida.close()
+    return total
+
+_SCRIPT_PAQUETE = """
+(function () {
+    var indice = document.getElementById('indice');
+    var perfil = document.getElementById('perfil');
+    var filtro = document.getElementById('filtro');
+    var area = document.getElementById('area');
+    var postulantes = document.querySelectorAll('#lista p');
+
+    function normalizar(texto) {
+        return texto.normalize('NFKD').replace(/[\\u0300-\\u036f]/g, '').toLowerCase();
+    }
+
+    function filtrar() {
+        var buscado = normalizar(filtro.value.trim());
+        var visibles = 0;
+        for (var i = 0; i < postulantes.length; i++) {
+            var p = postulantes[i];
+            var mostrar = p.dataset.texto.indexOf(buscado) !== -1 && (!area.value || p.dataset.area === area.value);
+            p.hidden = !mostrar;
+            if (mostrar) visibles++;
+        }
+        document.getElementById('visibles').textContent = visibles;
+    }
+
+    // Solo el perfil abierto pasa del <template> a la página
+    function mostrar() {
+        var plantilla = document.getElementById('p-' + decodeURIComponent(location.hash.slice(1)));
+        perfil.textContent = '';
+        if (plantilla) {
+            perfil.appendChild(plantilla.content.cloneNode(true));
+            window.scrollTo(0, 0);
+        }
+        perfil.hidden = !plantilla;
+        indice.hidden = !!plantilla;
+    }
+
+    filtro.addEventListener('input', filtrar);
+    area.addEventListener('change', filtrar);
+    window.addEventListener('hashchange', mostrar);
+    mostrar();
+})();
+"""
+
+def _botones_paquete(ids, posicion):
+    """Botones de navegación de un perfil dentro de la página única (enlaces a #id)"""
+    botones = '<div class="nav-buttons"><a href="#" class="nav-button">🏠 Inicio</a>'
+    if posicion > 0:
+        botones += f'<a href="#{ids[posicion - 1]}" class="nav-button">⬅️ Anterior</a>'
+    if posicion < len(ids) - 1:
+        botones += f'<a href="#{ids[posicion + 1]}" class="nav-button">➡️ Siguiente</a>'
+    return botones + '</div>'
+
+def partes_pagina_unica(almacen, esquema, trabajadores=TRABAJADORES):
+    """Genera, por partes, el HTML de una página autocontenida con la lista y todos los perfiles"""
+    perfiles = ordenar_perfiles(almacen, esquema)
+    ids = list(perfiles)
+    areas_candidatos = agrupar_por_areas(almacen)
+    area_de = {candidato['nombre_archivo']: area for area, candidatos in areas_candidatos.items() for candidato in candidatos}
+
+    opciones = ''.join(f'<option value="{escape(area)}">{escape(area, quote=False)} ({len(candidatos)})</option>'
+                       for area, candidatos in sorted(areas_candidatos.items()))
+    yield f"""<!DOCTYPE html>
+<html lang="es">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Perfiles ACECOM PAM 2025</title>
+    <style>{CSS_COMPARTIDO}</style>
+</head>
+<body class="pagina-perfil">
+    <div class="container" id="indice">
+        <h1>🎓 Perfiles de Postulantes ACECOM</h1>
+        <p><strong>Total de postulantes:</strong> {len(perfiles)} (mostrando <span id="visibles">{len(perfiles)}</span>)</p>
+        <p><input id="filtro" type="search" placeholder="🔎 Filtrar por nombre, código o área" style="width:100%; padding:8px;">
+        <select id="area" style="margin-top:8px; padding:6px;"><option value="">Todas las áreas</option>{opciones}</select></p>
+        <hr>
+        <div id="lista">
+"""
+    for id_postulante, perfil in perfiles.items():
+        area = area_de.get(id_postulante, '')
+        texto = normalizar_texto(f"{perfil['nombre']} {id_postulante} {area}")
+        yield (f'<p data-texto="{escape(texto)}" data-area="{escape(area)}">{perfil["indicador"]} 👤 '
+               f'<a href="#{id_postulante}" class="nav-button" style="display:inline; padding:5px 10px; margin:2px;">'
+               f'{escape(perfil["nombre"], quote=False)}</a></p>\n')
+    yield """        </div>
+    </div>
+    <div class="container" id="perfil" hidden></div>
+"""
+    for id_postulante, _, contenido_html in perfiles_renderizados(almacen, perfiles, esquema, False, trabajadores):
+        botones_nav = _botones_paquete(ids, perfiles[id_postulante]['posicion'])
+        yield f'<template id="p-{id_postulante}">{botones_nav}\n{contenido_html}\n{botones_nav}</template>\n'
+    yield f"<script>{_SCRIPT_PAQUETE}</script>\n</body>\n</html>\n"
+
+def escribir_pagina_unica(f, partes):
+    """Escribe las partes de la página única en ``f``; devuelve cuántos perfiles incluye"""
+    total = 0
+    for parte in partes:
+        f.write(parte.encode('utf-8'))
+        if parte.startswith('<template'):
+            total += 1
+    return total
+
+def empaquetar(archivo_csv=ARCHIVO_CSV, formato='zip', ruta_salida=None, con_md=True, tamano_pagina=TAMANO_PAGINA,
+               trabajadores=TRABAJADORES, usar_cache=True):
+    """Genera todas las salidas en un solo archivo (ver FORMATOS_PAQUETE)
+
+    Por defecto el paquete se llama perfiles_pam.<formato>. Se escribe con un
+    nombre temporal y se renombra al terminar, así quien lo sincroniza nunca ve
+    un paquete a medias. El formato 'html' no incluye los perfiles Markdown.
+    Devuelve la ruta del paquete, o None si no se pudo leer el CSV o escribirlo.
+    """
+    if formato not in FORMATOS_PAQUETE:
+        raise ValueError(f"Formato de paquete desconocido: {formato} (opciones: {', '.join(FORMATOS_PAQUETE)})")
+    ruta_salida = ruta_salida or f"{ARCHIVO_PAQUETE}.{formato}"
+
+    with etapa('lectura'):
+        df_limpio = cargar_postulantes(archivo_csv, usar_cache)
+        if df_limpio is None:
+            return None
+
+    with etapa('registros'):
+        almacen = almacenar_postulantes([df_limpio])
+        esquema = compilar_esquema(df_limpio.columns)
+
+    with etapa('paquete'):
+        print(f"📦 Generando {ruta_salida} (formato: {formato})")
+        temporal = f"{ruta_salida}.tmp"
+        try:
+            with open(temporal, 'wb') as f:
+                if formato == 'html':
+                    total = escribir_pagina_unica(f, partes_pagina_unica(almacen, esquema, trabajadores))
+                elif formato == 'zip':
+                    total = escribir_zip(f, archivos_del_sitio(almacen, esquema, con_md, tamano_pagina, trabajadores))
+                else:
+                    total = escribir_tar(f, archivos_del_sitio(almacen, esquema, con_md, tamano_pagina, trabajadores),
+                                         comprimir=formato == 'tar.gz')
+            os.replace(temporal, ruta_salida)
+        except OSError as e:
+            if os.path.exists(temporal):
+                os.remove(temporal)
+            registrar_error(f"{ruta_salida}: {e}")
+            print(f"❌ Error al escribir {ruta_salida}: {e}")
+            return None
+        registrar_escritura(ruta_salida)
+
+    tamano_mb = os.path.getsize(ruta_salida) / (1024 * 1024)
+    if formato == 'html':
+        print(f"🎉 Página única con {total} perfiles → ./{ruta_salida} ({tamano_mb:.2f} MB)")
+    else:
+        print(f"🎉 Paquete con {total} archivos → ./{ruta_salida} ({tamano_mb:.2f} MB)")
+    return ruta_salida
+
+if __name__ == "__main__":
+    empaquetar(formato=sys.argv[1] if len(sys.argv) > 1 else 'zip')
+    guardar_informe()
@@ -0,0 +1,33 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+# Número de procesos para renderizar (1 = modo secuencial, sin pool)
+TRABAJADORES = int(os.environ.get('PAM_TRABAJADORES', '1'))
+# Elementos que recibe cada proceso por tarea, para no pagar el envío uno a uno
+TAMANO_LOTE = 32
+
+def crear_pool(trabajadores=TRABAJADORES):
+    """Crea un pool de procesos, o devuelve None si se trabaja en modo secuencial"""
+    if trabajadores is None or trabajadores <= 1:
+        return None
+    return ProcessPoolExecutor(max_workers=trabajadores)
+
+def _procesar_lote(funcion, lote):
+    return [funcion(elemento) for elemento in lote]
+
+def mapear_por_lotes(funcion, elementos, pool=None, tamano_lote=TAMANO_LOTE):
+    """Aplica ``funcion`` a cada elemento y devuelve los resultados en el mismo orden
+
+    Con un pool reparte los elementos en lotes de ``tamano_lote``; ``funcion`` debe
+    estar definida a nivel de módulo para poder enviarse a otros procesos. El
+    resultado es idéntico al del modo secuencial.
+    """
+    elementos = list(elementos)
+    if pool is None:
+        return [funcion(elemento) for elemento in elementos]
+
+    lotes = [elementos[i:i + tamano_lote] for i in range(0, len(elementos), tamano_lote)]
+    resultados = []
+    for resultado_lote in pool.map(_procesar_lote, [funcion] * len(lotes), lotes):
+        resultados.extend(resultado_lote)
+    return resultados
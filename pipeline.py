@@ -0,0 +1,246 @@
+import os
+
+from organizador import (ARCHIVO_CSV, CARPETA_PERFILES, VERSION_PLANTILLA, cargar_postulantes,
+                         almacenar_postulantes, generar_perfil_md)
+from convertir_html import (VERSION_PLANTILLA as VERSION_PLANTILLA_HTML, generar_botones_nav, generar_contenido_html,
+                            generar_pagina_perfil, generar_indice_html, hash_pagina)
+from esquema import compilar_esquema
+from estilos import HOJA_ESTILOS, escribir_hoja_estilos
+from exportar_excel import ARCHIVO_EXCEL, escribir_excel
+from indice_busqueda import (VERSION_BUSQUEDA, crear_documento, escribir_indice_busqueda, indice_busqueda_existe,
+                             secciones_de_registro)
+from manifiesto import calcular_hash, cargar_manifiesto, eliminar_desaparecidos, guardar_manifiesto, hash_fila
+from escritor import escribir_archivo, esperar_escrituras
+from instrumentacion import etapa, guardar_informe, progreso
+from paginacion import PAGINA_RESUMEN, TAMANO_PAGINA, escribir_paginas
+from paralelo import TRABAJADORES, crear_pool, mapear_por_lotes
+from rutas_postulantes import cargar_rutas, guardar_rutas, registrar_salida
+from organizar_por_areas import MODO_DISTRIBUCION, agrupar_por_areas, distribuir_por_areas
+from añadir_indicadores import CIRCULO_VERDE, obtener_indicador
+
+CARPETA_HTML = 'perfiles_html'
+CARPETA_AREA_HTML = 'perfiles_por_area_html'
+CARPETA_AREA_MD = 'perfiles_por_area_md'
+
+def _renderizar_perfil(pendiente):
+    """Renderiza el HTML (y opcionalmente el Markdown) de un perfil con su indicador; usable en otro proceso
+    
+    El HTML se construye directamente desde el registro limpio: el Markdown es una
+    salida hermana, no un paso intermedio.
+    """
+    nombre_archivo, nombre_persona, row, esquema, botones_nav, indicador, con_md, con_html = pendiente
+    contenido_md = pagina = None
+    if con_md:
+        contenido_md = generar_perfil_md(row, nombre_persona, esquema, indicador)
+    if con_html:
+        contenido_html = generar_contenido_html(row, nombre_persona, esquema, indicador)
+        pagina = generar_pagina_perfil(nombre_persona, contenido_html, botones_nav, indicador)
+    return contenido_md, pagina
+
+def construir_perfiles(almacen, hashes_md=None, hashes_html=None, trabajadores=TRABAJADORES, con_md=True):
+    """Genera en memoria el HTML (y el Markdown si ``con_md``) con indicador de cada postulante
+    
+    ``almacen`` es un AlmacenPostulantes con el último envío de cada postulante; el
+    resultado se indexa por su ID, que es también el nombre de sus archivos. Los
+    perfiles cuyo hash coincide con ``hashes_md``/``hashes_html`` (los manifiestos
+    de la ejecución anterior) no se vuelven a renderizar: sus claves 'md' y 'html'
+    quedan en None. Con ``trabajadores`` > 1 el renderizado se reparte en un pool
+    de procesos sin cambiar el resultado.
+    """
+    hashes_md = hashes_md or {}
+    hashes_html = hashes_html or {}
+    
+    postulantes = {}
+    esquema = None
+    for id_postulante, nombre_persona, row in almacen.postulantes():
+        if esquema is None:
+            esquema = compilar_esquema(row.keys())
+        postulantes[id_postulante] = (nombre_persona, row)
+    
+    # El HTML se genera en orden alfabético por nombre para que la navegación siga al índice
+    archivos = sorted(postulantes, key=lambda id_postulante: (postulantes[id_postulante][0], id_postulante))
+    archivos_html = [f"{nombre_archivo}.html" for nombre_archivo in archivos]
+    
+    perfiles = {}
+    pendientes = []
+    for idx_actual, nombre_archivo in enumerate(archivos):
+        nombre_persona, row = postulantes[nombre_archivo]
+        indicador = obtener_indicador(row, esquema)
+        # Mismo hash que organizador.py: los manifiestos de perfiles_md/ sirven para ambos
+        hash_md = calcular_hash(hash_fila(row, VERSION_PLANTILLA), indicador)
+        perfil = {
+            'nombre': nombre_persona,
+            'indicador': indicador,
+            'hash_md': hash_md,
+            'hash_html': hash_pagina(hash_md, archivos_html, idx_actual),
+            'md': None,
+            'html': None
+        }
+        perfiles[nombre_archivo] = perfil
+        
+        renderizar_md = con_md and hashes_md.get(nombre_archivo) != perfil['hash_md']
+        renderizar_html = hashes_html.get(nombre_archivo) != perfil['hash_html']
+        if not renderizar_md and not renderizar_html:
+            continue
+        
+        botones_nav = generar_botones_nav(archivos_html, idx_actual)
+        pendientes.append((nombre_archivo, nombre_persona, row, esquema, botones_nav, indicador,
+                           renderizar_md, renderizar_html))
+    
+    pool = crear_pool(trabajadores)
+    try:
+        renderizados = mapear_por_lotes(_renderizar_perfil, pendientes, pool)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    
+    for pendiente, (contenido_md, pagina) in zip(pendientes, renderizados):
+        perfiles[pendiente[0]]['md'] = contenido_md
+        perfiles[pendiente[0]]['html'] = pagina
+    
+    return perfiles
+
+def documentos_de_registros(almacen, perfiles, esquema):
+    """Resume cada postulante para el índice de búsqueda, en el orden del índice HTML"""
+    return [crear_documento(nombre_archivo, perfil['nombre'], perfil['indicador'],
+                            secciones_de_registro(almacen.obtener(nombre_archivo)[1], esquema))
+            for nombre_archivo, perfil in perfiles.items()]
+
+def ejecutar_pipeline(archivo_csv=ARCHIVO_CSV, incremental=True, trabajadores=TRABAJADORES, con_md=True,
+                      modo_areas=MODO_DISTRIBUCION, usar_cache=True, tamano_pagina=TAMANO_PAGINA, con_excel=True,
+                      con_base=False, archivo_base=None):
+    """Lee el CSV una sola vez y genera todas las salidas en una única pasada
+    
+    En modo incremental solo se renderizan y escriben los postulantes cuyo hash
+    cambió respecto a los manifiestos de perfiles_md/ y perfiles_html/. Con
+    ``con_md=False`` no se generan perfiles_md/ ni perfiles_por_area_md/.
+    ``modo_areas`` elige cómo se arman las carpetas por área (ver organizar_por_areas.py)
+    y ``tamano_pagina`` cuántos postulantes lista cada página de los índices. Con
+    ``con_excel=False`` no se escribe resultados_ordenados.xlsx. Con ``con_base=True``
+    la tabla limpia se guarda además en la base SQLite ``archivo_base`` (por defecto
+    la de base_postulantes.py).
+    Devuelve los perfiles construidos, o None si no se pudo leer el CSV.
+    """
+
+    with etapa('lectura'):
+        df_limpio = cargar_postulantes(archivo_csv, usar_cache)
+        if df_limpio is None:
+            return None
+
+    perfiles = generar_salidas(df_limpio, incremental, trabajadores, con_md, modo_areas, tamano_pagina, con_excel)
+
+    # Base SQLite opcional con búsqueda de texto completo sobre las respuestas
+    if con_base:
+        from base_postulantes import ARCHIVO_BASE, cohorte_de, guardar_en_base
+        with etapa('base'):
+            guardar_en_base([(cohorte_de(archivo_csv), df_limpio)], archivo_base or ARCHIVO_BASE)
+
+    return perfiles
+
+def generar_salidas(df_limpio, incremental=True, trabajadores=TRABAJADORES, con_md=True, modo_areas=MODO_DISTRIBUCION,
+                    tamano_pagina=TAMANO_PAGINA, con_excel=True, almacen=None):
+    """Genera todas las salidas a partir de la tabla limpia de postulantes (ver ejecutar_pipeline)
+
+    ``almacen`` son los registros de ``df_limpio`` si quien llama ya los construyó.
+    """
+    if almacen is None:
+        with etapa('registros'):
+            # Un registro por postulante (el último envío), con su ID estable como nombre de archivo
+            almacen = almacenar_postulantes([df_limpio])
+
+    salidas = [(CARPETA_HTML, 'html', '.html')]
+    if con_md:
+        salidas.append((CARPETA_PERFILES, 'md', '.md'))
+
+    vacio = {'perfiles': {}}
+    manifiesto_md = cargar_manifiesto(CARPETA_PERFILES) if incremental and con_md else vacio
+    manifiesto_html = cargar_manifiesto(CARPETA_HTML) if incremental else vacio
+    manifiestos = {'md': manifiesto_md, 'html': manifiesto_html}
+
+    # Perfiles HTML y MD (con indicador de disponibilidad)
+    with etapa('render'):
+        perfiles = construir_perfiles(almacen, manifiesto_md['perfiles'], manifiesto_html['perfiles'], trabajadores, con_md)
+    renderizados = sum(1 for perfil in perfiles.values() if perfil['html'] is not None or perfil['md'] is not None)
+    print(f"📋 Perfiles construidos en memoria: {renderizados} (sin cambios: {len(perfiles) - renderizados})")
+
+    with etapa('escritura'):
+        for carpeta, _, _ in salidas:
+            os.makedirs(carpeta, exist_ok=True)
+        escribir_hoja_estilos(CARPETA_HTML)
+
+        for carpeta, formato, extension in salidas:
+            for nombre_archivo in sorted(perfiles):
+                contenido = perfiles[nombre_archivo][formato]
+                if contenido is not None:
+                    escribir_archivo(os.path.join(carpeta, f"{nombre_archivo}{extension}"), contenido)
+
+            for nombre_archivo in eliminar_desaparecidos(carpeta, manifiestos[formato], perfiles, extension):
+                progreso(f"🗑️ Eliminado: {nombre_archivo}{extension}")
+
+        indice = [(nombre_archivo, perfil['nombre']) for nombre_archivo, perfil in perfiles.items()]
+        hash_indice = calcular_hash(VERSION_PLANTILLA_HTML, VERSION_BUSQUEDA, HOJA_ESTILOS, tamano_pagina, indice)
+        ruta_index = os.path.join(CARPETA_HTML, PAGINA_RESUMEN)
+        if manifiesto_html.get('indice') != hash_indice or not os.path.exists(ruta_index):
+            escribir_paginas(CARPETA_HTML, generar_indice_html(indice, tamano_pagina))
+
+        # Índice de búsqueda desde los mismos registros, solo si cambió algún perfil
+        hash_busqueda = calcular_hash(VERSION_BUSQUEDA, {nombre_archivo: perfil['hash_md'] for nombre_archivo, perfil in perfiles.items()})
+        if manifiesto_html.get('busqueda') != hash_busqueda or not indice_busqueda_existe(CARPETA_HTML):
+            escribir_indice_busqueda(CARPETA_HTML, documentos_de_registros(almacen, perfiles, compilar_esquema(df_limpio.columns)))
+
+        # Lo que no se pudo escribir queda sin hash en los manifiestos, para reintentarlo la próxima vez
+        fallidas = set(esperar_escrituras())
+        hashes = {formato: {nombre_archivo: None if os.path.join(carpeta, f"{nombre_archivo}{extension}") in fallidas
+                            else perfil[f"hash_{formato}"] for nombre_archivo, perfil in perfiles.items()}
+                  for carpeta, formato, extension in salidas}
+        if fallidas:
+            hash_indice = hash_busqueda = None
+
+        if con_md:
+            guardar_manifiesto(CARPETA_PERFILES, {
+                'version_plantilla': VERSION_PLANTILLA,
+                'perfiles': hashes['md'],
+                'nombres': {nombre_archivo: perfil['nombre'] for nombre_archivo, perfil in perfiles.items()}
+            })
+        # Rutas de cada perfil para las etapas siguientes (áreas, indicadores)
+        rutas = cargar_rutas()
+        for carpeta, formato, extension in salidas:
+            registrar_salida(rutas, formato, {nombre_archivo: os.path.join(carpeta, f"{nombre_archivo}{extension}")
+                                              for nombre_archivo in perfiles})
+        guardar_rutas(rutas)
+        guardar_manifiesto(CARPETA_HTML, {
+            'version_plantilla': VERSION_PLANTILLA_HTML,
+            'indice': hash_indice,
+            'busqueda': hash_busqueda,
+            'perfiles': hashes['html']
+        })
+
+    # Organización por áreas a partir de los mismos registros
+    with etapa('areas'):
+        areas_candidatos = agrupar_por_areas(almacen)
+        total_area, _ = distribuir_por_areas(areas_candidatos, CARPETA_AREA_HTML, CARPETA_AREA_MD if con_md else None,
+                                             CARPETA_HTML, CARPETA_PERFILES, modo_areas, tamano_pagina)
+    if modo_areas == 'virtual':
+        total_area = sum(len(candidatos) for candidatos in areas_candidatos.values())
+
+    # Excel con una hoja por área, escrito en modo streaming desde los mismos registros
+    if con_excel:
+        with etapa('excel'):
+            escribir_excel(almacen.postulantes_en_orden(), ARCHIVO_EXCEL)
+
+    con_dudas = sum(1 for perfil in perfiles.values() if perfil['indicador'] != CIRCULO_VERDE)
+
+    print(f"\n🎉 ¡Pipeline completado!")
+    if con_md:
+        print(f"📝 Perfiles MD: {len(perfiles)} → ./{CARPETA_PERFILES}/")
+    print(f"🌐 Perfiles HTML: {len(perfiles)} → ./{CARPETA_HTML}/")
+    print(f"📁 Perfiles organizados por área: {total_area} → ./{CARPETA_AREA_HTML}/" + (f", ./{CARPETA_AREA_MD}/" if con_md else ""))
+    if con_excel:
+        print(f"📊 Excel por áreas → ./{ARCHIVO_EXCEL}")
+    print(f"🟡 Candidatos con dudas: {con_dudas} | 🟢 Sin problemas: {len(perfiles) - con_dudas}")
+
+    return perfiles
+
+if __name__ == "__main__":
+    ejecutar_pipeline()
+    guardar_informe()
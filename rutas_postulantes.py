@@ -0,0 +1,50 @@
+import json
+
+from escritor import reemplazar_archivo
+from instrumentacion import registrar_escritura
+
+# Manifiesto compartido de rutas: para cada postulante (por su ID estable) guarda
+# dónde quedó cada una de sus salidas. La generación de perfiles registra 'md' y
+# 'html'; la organización por áreas registra 'area_md' y 'area_html', junto con el
+# hash del perfil canónico que colocó ('hash_area_md', 'hash_area_html'). Las etapas
+# siguientes buscan aquí las rutas en lugar de reconstruir nombres de archivo,
+# recorrer carpetas con os.listdir o comprobar cada archivo con os.path.exists.
+
+ARCHIVO_RUTAS = 'rutas_postulantes.json'
+VERSION_RUTAS = '1'
+
+def cargar_rutas(archivo=ARCHIVO_RUTAS):
+    """Lee el manifiesto de rutas (sin postulantes si no existe, está dañado o es de otra versión)"""
+    try:
+        with open(archivo, 'r', encoding='utf-8') as f:
+            rutas = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {'version': VERSION_RUTAS, 'postulantes': {}}
+
+    if rutas.get('version') != VERSION_RUTAS:
+        return {'version': VERSION_RUTAS, 'postulantes': {}}
+    rutas.setdefault('postulantes', {})
+    return rutas
+
+def guardar_rutas(rutas, archivo=ARCHIVO_RUTAS):
+    """Escribe el manifiesto de rutas, reemplazando el anterior de una sola vez"""
+    rutas['postulantes'] = {id_postulante: salidas for id_postulante, salidas in sorted(rutas['postulantes'].items())
+                            if salidas}
+    reemplazar_archivo(archivo, json.dumps(rutas, ensure_ascii=False, indent=2, sort_keys=True))
+    registrar_escritura(archivo)
+
+def rutas_de(rutas, clave):
+    """Ruta de la salida ``clave`` de cada postulante que la tiene: {id: ruta}"""
+    return {id_postulante: salidas[clave] for id_postulante, salidas in rutas['postulantes'].items() if clave in salidas}
+
+def registrar_salida(rutas, clave, rutas_por_id):
+    """Reemplaza la salida ``clave`` de todos los postulantes por ``rutas_por_id`` ({id: ruta})
+
+    Los postulantes que no aparecen en ``rutas_por_id`` dejan de tener esa salida.
+    """
+    postulantes = rutas['postulantes']
+    for id_postulante, salidas in postulantes.items():
+        if id_postulante not in rutas_por_id:
+            salidas.pop(clave, None)
+    for id_postulante, ruta in rutas_por_id.items():
+        postulantes.setdefault(id_postulante, {})[clave] = ruta
@@ -0,0 +1,265 @@
+import mimetypes
+import os
+import sys
+import threading
+from collections import OrderedDict
+
+from añadir_indicadores import obtener_indicador
+from cache_postulantes import huella_archivo
+from convertir_html import (VERSION_PLANTILLA as VERSION_PLANTILLA_HTML, generar_botones_nav, generar_contenido_html,
+                            generar_indice_html, generar_pagina_perfil, hash_pagina)
+from esquema import compilar_esquema
+from estilos import CSS_COMPARTIDO, HOJA_ESTILOS
+from exportar_excel import ARCHIVO_EXCEL
+from indice_busqueda import CARPETA_BUSQUEDA, VERSION_BUSQUEDA, archivos_indice_busqueda
+from manifiesto import calcular_hash, hash_fila
+from organizador import ARCHIVO_CSV, VERSION_PLANTILLA, almacenar_postulantes, cargar_postulantes
+from organizar_por_areas import (ARCHIVO_INDICE_GENERAL, PREFIJO_PERFILES_AREA, agrupar_por_areas, generar_indice_area,
+                                 generar_indice_general)
+from paginacion import PAGINA_RESUMEN, TAMANO_PAGINA, existe_pagina
+from pipeline import CARPETA_AREA_HTML, CARPETA_HTML, documentos_de_registros
+
+# Servidor local de revisión: mantiene en memoria la tabla limpia de postulantes y
+# renderiza los perfiles, los índices y las páginas por área cuando se piden, con
+# las mismas rutas que los archivos estáticos (así los enlaces relativos funcionan
+# igual). Cada página tiene un ETag que se calcula sin renderizarla, a partir de
+# los mismos hashes que los manifiestos: el navegador recibe un 304 si ya la
+# tiene, y las páginas renderizadas se guardan en un caché LRU. Si el CSV cambia,
+# la tabla se vuelve a cargar y solo se descartan las páginas cuyo ETag cambió.
+# Flask es opcional: solo se importa al arrancar el servidor.
+
+PUERTO = int(os.environ.get('PAM_PUERTO', '8000'))
+CAPACIDAD_CACHE = int(os.environ.get('PAM_CACHE_PAGINAS', '500'))
+
+class RevisionPostulantes:
+    """Postulantes en memoria y caché LRU de las páginas renderizadas, indexadas por ruta
+
+    ``etag_de`` dice qué versión de una página corresponde a los datos actuales
+    sin renderizarla; ``pagina`` la devuelve desde el caché o la renderiza. Ambos
+    recargan el CSV si cambió su tamaño o su fecha de modificación.
+    """
+
+    def __init__(self, archivo_csv=ARCHIVO_CSV, tamano_pagina=TAMANO_PAGINA, capacidad=CAPACIDAD_CACHE, usar_cache=True):
+        self.archivo_csv = archivo_csv
+        self.tamano_pagina = tamano_pagina
+        self.capacidad = capacidad
+        self.usar_cache = usar_cache
+        self.huella = None
+        self.almacen = None
+        self.aciertos = 0
+        self.fallos = 0
+        self._paginas = OrderedDict()  # ruta → (etag, contenido), del uso más antiguo al más reciente
+        self._archivos_busqueda = None  # Archivos del índice de búsqueda de los datos cargados
+        self._cerrojo = threading.RLock()
+
+    def actualizar(self):
+        """Carga el CSV si cambió desde la última carga; devuelve False si nunca se pudo cargar
+
+        Si el CSV desaparece o no se puede leer se siguen sirviendo los datos anteriores.
+        """
+        with self._cerrojo:
+            try:
+                huella = huella_archivo(self.archivo_csv)
+            except FileNotFoundError:
+                huella = None
+            if huella is not None and huella != self.huella:
+                df_limpio = cargar_postulantes(self.archivo_csv, self.usar_cache)
+                if df_limpio is not None:
+                    self._recargar(df_limpio)
+                    self.huella = huella
+            elif self.almacen is None:
+                cargar_postulantes(self.archivo_csv, self.usar_cache)  # Informa el error
+            return self.almacen is not None
+
+    def _recargar(self, df_limpio):
+        """Recalcula los registros, el orden y los ETag de todas las páginas y descarta las que cambiaron"""
+        almacen = almacenar_postulantes([df_limpio])
+        esquema = compilar_esquema(df_limpio.columns)
+        postulantes = {id_postulante: (nombre_persona, row) for id_postulante, nombre_persona, row in almacen.postulantes()}
+
+        # Mismo orden, hashes y vecinos de navegación que los perfiles estáticos (ver pipeline.py)
+        orden = sorted(postulantes, key=lambda id_postulante: (postulantes[id_postulante][0], id_postulante))
+        archivos_html = [f"{id_postulante}.html" for id_postulante in orden]
+        perfiles = {}
+        for idx_actual, id_postulante in enumerate(orden):
+            nombre_persona, row = postulantes[id_postulante]
+            indicador = obtener_indicador(row, esquema)
+            hash_md = calcular_hash(hash_fila(row, VERSION_PLANTILLA), indicador)
+            perfiles[id_postulante] = {
+                'nombre': nombre_persona,
+                'indicador': indicador,
+                'hash_md': hash_md,
+                'hash_html': hash_pagina(hash_md, archivos_html, idx_actual),
+                'posicion': idx_actual
+            }
+
+        indice = [(id_postulante, perfil['nombre']) for id_postulante, perfil in perfiles.items()]
+        areas_candidatos = agrupar_por_areas(almacen)
+
+        self.almacen = almacen
+        self.esquema = esquema
+        self.archivos_html = archivos_html
+        self.perfiles = perfiles
+        self.indice = indice
+        self.areas_candidatos = areas_candidatos
+        self._archivos_busqueda = None
+        self.etag_indice = calcular_hash(VERSION_PLANTILLA_HTML, VERSION_BUSQUEDA, HOJA_ESTILOS, self.tamano_pagina, indice)
+        self.etag_busqueda = calcular_hash(VERSION_BUSQUEDA, {id_postulante: perfil['hash_md'] for id_postulante, perfil in perfiles.items()})
+        self.etag_general = calcular_hash(HOJA_ESTILOS, {area: len(candidatos) for area, candidatos in areas_candidatos.items()})
+        self.etags_area = {area: calcular_hash(HOJA_ESTILOS, self.tamano_pagina, area, candidatos)
+                           for area, candidatos in areas_candidatos.items()}
+
+        # Invalidar solo las páginas cuya versión ya no corresponde a los datos
+        descartadas = [ruta for ruta, (etag, _) in self._paginas.items() if self._etag(ruta) != etag]
+        for ruta in descartadas:
+            del self._paginas[ruta]
+        print(f"🔄 Postulantes en memoria: {len(perfiles)} (páginas descartadas del caché: {len(descartadas)})")
+
+    def _archivos_de_busqueda(self):
+        """Nombres de los archivos del índice de búsqueda vigente; se calculan al pedir el primero tras cada carga"""
+        if self._archivos_busqueda is None:
+            documentos = documentos_de_registros(self.almacen, self.perfiles, self.esquema)
+            self._archivos_busqueda = set(archivos_indice_busqueda(documentos))
+        return self._archivos_busqueda
+
+    def _etag(self, ruta):
+        """ETag de una ruta según los datos cargados (None si la ruta no existe)"""
+        partes = ruta.split('/')
+        if partes[-1] == HOJA_ESTILOS:
+            return HOJA_ESTILOS
+        if partes[0] == CARPETA_HTML and len(partes) == 2:
+            archivo = partes[1]
+            if archivo.endswith('.html') and archivo[:-len('.html')] in self.perfiles:
+                return self.perfiles[archivo[:-len('.html')]]['hash_html']
+            # Una página fuera del índice (p. ej. pagina-999.html) no tiene versión: 404 aunque llegue If-None-Match
+            return self.etag_indice if existe_pagina(archivo, self.indice, self.tamano_pagina) else None
+        if partes[0] == CARPETA_HTML and len(partes) == 3 and partes[1] == CARPETA_BUSQUEDA:
+            # Un fragmento que no existe no tiene versión: 404 aunque el navegador mande If-None-Match
+            return self.etag_busqueda if partes[2] in self._archivos_de_busqueda() else None
+        if partes[0] == CARPETA_AREA_HTML and len(partes) == 2 and partes[1] == ARCHIVO_INDICE_GENERAL:
+            return self.etag_general
+        if partes[0] == CARPETA_AREA_HTML and len(partes) == 3 and partes[1] in self.areas_candidatos:
+            area = partes[1]
+            return self.etags_area[area] if existe_pagina(partes[2], self.areas_candidatos[area], self.tamano_pagina) else None
+        return None
+
+    def _renderizar(self, ruta):
+        """Renderiza la página de ``ruta`` y las de su mismo grupo (páginas de un índice, archivos de la búsqueda) como {ruta: contenido}"""
+        partes = ruta.split('/')
+        carpeta = '/'.join(partes[:-1])
+        if partes[-1] == HOJA_ESTILOS:
+            return {ruta: CSS_COMPARTIDO}
+        if partes[0] == CARPETA_HTML and len(partes) == 2 and partes[1][:-len('.html')] in self.perfiles:
+            id_postulante = partes[1][:-len('.html')]
+            perfil = self.perfiles[id_postulante]
+            nombre_persona, row = self.almacen.obtener(id_postulante)
+            contenido_html = generar_contenido_html(row, nombre_persona, self.esquema, perfil['indicador'])
+            botones_nav = generar_botones_nav(self.archivos_html, perfil['posicion'])
+            return {ruta: generar_pagina_perfil(nombre_persona, contenido_html, botones_nav, perfil['indicador'])}
+        if partes[0] == CARPETA_HTML and len(partes) == 2:
+            paginas = generar_indice_html(self.indice, self.tamano_pagina)
+        elif partes[0] == CARPETA_HTML:
+            paginas = archivos_indice_busqueda(documentos_de_registros(self.almacen, self.perfiles, self.esquema))
+        elif len(partes) == 2:
+            paginas = {ARCHIVO_INDICE_GENERAL: generar_indice_general(self.areas_candidatos)}
+        else:
+            area = partes[1]
+            paginas = generar_indice_area(area, self.areas_candidatos[area], PREFIJO_PERFILES_AREA, self.tamano_pagina)
+        return {f"{carpeta}/{archivo}": contenido for archivo, contenido in paginas.items()}
+
+    def etag_de(self, ruta):
+        """ETag vigente de una ruta, sin renderizarla (None si no existe)"""
+        with self._cerrojo:
+            if not self.actualizar():
+                return None
+            return self._etag(ruta)
+
+    def pagina(self, ruta):
+        """Devuelve (etag, contenido) de una ruta desde el caché o renderizándola, o None si no existe"""
+        with self._cerrojo:
+            if not self.actualizar():
+                return None
+            etag = self._etag(ruta)
+            if etag is None:
+                return None
+
+            guardada = self._paginas.get(ruta)
+            if guardada is not None and guardada[0] == etag:
+                self.aciertos += 1
+                self._paginas.move_to_end(ruta)
+                return guardada
+
+            self.fallos += 1
+            paginas = self._renderizar(ruta)
+            if ruta not in paginas:
+                return None  # Página de un índice que no existe (p. ej. pagina-999.html)
+            for ruta_pagina, contenido in paginas.items():
+                self._paginas[ruta_pagina] = (etag, contenido)
+                self._paginas.move_to_end(ruta_pagina)
+            self._paginas.move_to_end(ruta)
+            while len(self._paginas) > self.capacidad:
+                self._paginas.popitem(last=False)
+            return etag, paginas[ruta]
+
+def crear_app(revision):
+    """Aplicación Flask que sirve las páginas de ``revision`` con ETag / If-None-Match"""
+    # Importación diferida: Flask solo hace falta para el modo servidor
+    from flask import Flask, Response, abort, redirect, request, send_file
+
+    app = Flask(__name__)
+
+    @app.route('/')
+    def inicio():
+        return redirect(f"/{CARPETA_HTML}/{PAGINA_RESUMEN}")
+
+    @app.route(f"/{ARCHIVO_EXCEL}")
+    def excel():
+        # El Excel no se genera al vuelo: se sirve el último que escribió el pipeline
+        if not os.path.exists(ARCHIVO_EXCEL):
+            abort(404)
+        return send_file(os.path.abspath(ARCHIVO_EXCEL), conditional=True)
+
+    @app.route('/<path:ruta>')
+    def pagina(ruta):
+        if ruta.endswith('/'):
+            ruta += PAGINA_RESUMEN
+        etag = revision.etag_de(ruta)
+        if etag is None:
+            abort(404)
+
+        # El navegador ya tiene esta versión: se responde sin renderizar nada
+        if request.if_none_match.contains(etag):
+            respuesta = Response(status=304)
+        else:
+            resultado = revision.pagina(ruta)
+            if resultado is None:
+                abort(404)
+            etag, contenido = resultado
+            tipo = mimetypes.guess_type(ruta)[0] or 'text/html'
+            respuesta = Response(contenido, mimetype=tipo)
+        respuesta.set_etag(etag)
+        respuesta.headers['Cache-Control'] = 'no-cache'
+        return respuesta
+
+    return app
+
+def servir(archivo_csv=ARCHIVO_CSV, host='127.0.0.1', puerto=PUERTO, tamano_pagina=TAMANO_PAGINA,
+           capacidad=CAPACIDAD_CACHE, usar_cache=True):
+    """Arranca el servidor de revisión hasta Ctrl+C; devuelve None si no se pudo arrancar"""
+    revision = RevisionPostulantes(archivo_csv, tamano_pagina, capacidad, usar_cache)
+    if not revision.actualizar():
+        return None
+
+    try:
+        app = crear_app(revision)
+    except ImportError:
+        print("❌ Error: el modo servidor necesita Flask (pip install flask).")
+        return None
+
+    print(f"🌐 Revisión en http://{host}:{puerto}/ (Ctrl+C para salir)")
+    app.run(host=host, port=puerto, threaded=True)
+    print(f"📊 Caché de páginas: {revision.aciertos} aciertos, {revision.fallos} renderizadas")
+    return True
+
+if __name__ == "__main__":
+    servir(sys.argv[1] if len(sys.argv) > 1 else ARCHIVO_CSV)
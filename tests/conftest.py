@@ -0,0 +1,32 @@
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+# Los módulos del proyecto están en la raíz del repositorio, sin paquete
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+ARCHIVO_CSV_EJEMPLO = os.path.join(RAIZ, 'PAM 2025_2.csv')
+
+@pytest.fixture
+def carpeta_trabajo(tmp_path, monkeypatch):
+    """Ejecuta la prueba dentro de una carpeta temporal, para no tocar las salidas del repositorio"""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+@pytest.fixture
+def df_limpio(carpeta_trabajo):
+    """Tabla limpia de postulantes del CSV de ejemplo, leída sin caché"""
+    from organizador import cargar_postulantes
+    return cargar_postulantes(ARCHIVO_CSV_EJEMPLO, usar_cache=False)
+
+@pytest.fixture
+def csv_con_reenvio(carpeta_trabajo):
+    """El CSV de ejemplo con su último envío repetido al final (un reenvío); devuelve (ruta, filas)"""
+    df = pd.read_csv(ARCHIVO_CSV_EJEMPLO, sep=';', dtype=str)
+    df = pd.concat([df, df.tail(1)])
+    ruta = str(carpeta_trabajo / 'reenvio.csv')
+    df.to_csv(ruta, sep=';', index=False)
+    return ruta, len(df)
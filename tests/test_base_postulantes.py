@@ -0,0 +1,27 @@
+import sqlite3
+
+from base_postulantes import buscar, guardar_en_base
+
+def test_cargar_dos_veces_no_duplica(df_limpio, carpeta_trabajo):
+    archivo_base = str(carpeta_trabajo / 'postulantes #1.sqlite3')
+
+    primero = guardar_en_base([('PAM 2025_2', df_limpio)], archivo_base)
+    segundo = guardar_en_base([('PAM 2025_2', df_limpio)], archivo_base)
+
+    assert primero == segundo == {'PAM 2025_2': 24}
+    conexion = sqlite3.connect(archivo_base)
+    try:
+        assert conexion.execute('SELECT COUNT(*) FROM postulantes').fetchone()[0] == 24
+        assert conexion.execute('SELECT COUNT(*) FROM busqueda').fetchone()[0] == 24
+    finally:
+        conexion.close()
+
+def test_busqueda_de_texto_encuentra_al_postulante(df_limpio, carpeta_trabajo):
+    archivo_base = str(carpeta_trabajo / 'postulantes #1.sqlite3')
+    guardar_en_base([('PAM 2025_2', df_limpio)], archivo_base)
+
+    resultados = buscar('python', archivo_base)
+
+    assert '20242233A' in [resultado['id_postulante'] for resultado in resultados]
+    assert all('python' in resultado['fragmento'].lower() for resultado in resultados)
+    assert buscar('python', archivo_base, area='Inteligencia artificial')[0]['nombre'] == 'Lesly'
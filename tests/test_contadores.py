@@ -0,0 +1,42 @@
+import os
+
+import pytest
+
+from cache_postulantes import CARPETA_CACHE, NOMBRE_METADATOS
+
+from exportar_excel import exportar_excel
+from instrumentacion import informe, reiniciar_informe
+from organizador import cargar_postulantes, main as generar_perfiles_md
+
+CONTADORES_FILAS = ['filas_leidas', 'filas_filtradas', 'reenvios']
+
+COMANDOS = [
+    lambda archivo_csv, usar_cache: generar_perfiles_md(archivo_csv, trabajadores=1, usar_cache=usar_cache),
+    lambda archivo_csv, usar_cache: exportar_excel(archivo_csv, usar_cache=usar_cache),
+]
+
+@pytest.mark.parametrize('comando', COMANDOS, ids=['perfiles_md', 'excel'])
+def test_cada_fila_del_csv_se_cuenta_una_vez(comando, csv_con_reenvio):
+    archivo_csv, filas_csv = csv_con_reenvio
+    reiniciar_informe()
+    postulantes = comando(archivo_csv, usar_cache=False)
+
+    totales = informe()['totales']
+    assert totales['filas_leidas'] == filas_csv
+    assert totales['reenvios'] == 1
+    assert totales['filas_leidas'] - totales['filas_filtradas'] - totales['reenvios'] == postulantes
+
+@pytest.mark.parametrize('comando', COMANDOS + [lambda archivo_csv, usar_cache: cargar_postulantes(archivo_csv, usar_cache)],
+                         ids=['perfiles_md', 'excel', 'lectura'])
+def test_el_cache_no_cambia_los_conteos(comando, csv_con_reenvio):
+    archivo_csv, filas_csv = csv_con_reenvio
+    conteos = []
+    for _ in range(2):
+        reiniciar_informe()
+        comando(archivo_csv, usar_cache=True)
+        totales = informe()['totales']
+        conteos.append({contador: totales[contador] for contador in CONTADORES_FILAS})
+
+    assert os.path.exists(os.path.join(CARPETA_CACHE, NOMBRE_METADATOS))
+    assert conteos[0] == conteos[1]
+    assert conteos[0]['filas_leidas'] == filas_csv
@@ -0,0 +1,30 @@
+from esquema import compilar_esquema
+from exportar_excel import escribir_excel, exportar_excel
+from organizador import almacenar_postulantes, cargar_postulantes
+
+def test_respuesta_con_igual_se_guarda_como_texto(df_limpio, carpeta_trabajo):
+    from openpyxl import load_workbook
+
+    columna = compilar_esquema(df_limpio.columns).renderizables[-1][0]
+    df_limpio.loc[df_limpio.index[0], columna] = '=1+1'
+    ruta = str(carpeta_trabajo / 'resultados.xlsx')
+
+    escribir_excel(almacenar_postulantes([df_limpio]).postulantes_en_orden(), ruta)
+
+    celdas = [celda for hoja in load_workbook(ruta).worksheets for fila in hoja.iter_rows() for celda in fila]
+    inyectadas = [celda for celda in celdas if celda.value == '=1+1']
+    assert inyectadas and all(celda.data_type == 's' for celda in inyectadas)
+    assert not any(celda.data_type == 'f' for celda in celdas)
+
+def _valores(ruta):
+    from openpyxl import load_workbook
+    return [list(fila) for hoja in load_workbook(ruta).worksheets for fila in hoja.iter_rows(values_only=True)]
+
+def test_excel_desde_los_registros_igual_al_leido_por_bloques(csv_con_reenvio, carpeta_trabajo):
+    archivo_csv, _ = csv_con_reenvio
+    almacen = almacenar_postulantes([cargar_postulantes(archivo_csv, usar_cache=False)])
+
+    escribir_excel(almacen.postulantes_en_orden(), str(carpeta_trabajo / 'registros.xlsx'))
+    exportar_excel(archivo_csv, str(carpeta_trabajo / 'bloques.xlsx'), usar_cache=False)
+
+    assert _valores(carpeta_trabajo / 'registros.xlsx') == _valores(carpeta_trabajo / 'bloques.xlsx')
@@ -0,0 +1,12 @@
+from lotes import COLUMNA_RONDA, combinar_rondas, resumen_rondas
+from organizador import almacenar_postulantes
+
+def test_resumen_cuenta_a_quien_quedo_con_el_perfil_de_otra_ronda(df_limpio):
+    # La segunda ronda repite el último envío de la primera: como va después, gana
+    df_limpio = combinar_rondas([('ronda 1', df_limpio), ('ronda 2', df_limpio.tail(1))])
+    almacen = almacenar_postulantes([df_limpio])
+
+    resumen = resumen_rondas(almacen, df_limpio)
+
+    assert resumen == {'ronda 1': (len(almacen) - 1, 1), 'ronda 2': (1, 0)}
+    assert sum(1 for _, _, fila in almacen.postulantes() if fila[COLUMNA_RONDA] == 'ronda 2') == 1
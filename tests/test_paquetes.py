@@ -0,0 +1,16 @@
+import pytest
+
+from conftest import ARCHIVO_CSV_EJEMPLO
+from paquetes import empaquetar
+
+@pytest.mark.parametrize('formato', ['zip', 'tar', 'tar.gz'])
+def test_paquete_identico_en_dos_construcciones(formato, carpeta_trabajo):
+    contenidos = []
+    for intento in ('primero', 'segundo'):
+        ruta = empaquetar(ARCHIVO_CSV_EJEMPLO, formato, str(carpeta_trabajo / f"{intento}.{formato}"),
+                          trabajadores=1, usar_cache=False)
+        assert ruta is not None
+        with open(ruta, 'rb') as f:
+            contenidos.append(f.read())
+
+    assert contenidos[0] == contenidos[1]
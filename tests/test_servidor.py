@@ -0,0 +1,54 @@
+import pytest
+
+from conftest import ARCHIVO_CSV_EJEMPLO
+from indice_busqueda import CARPETA_BUSQUEDA
+from paginacion import PAGINA_RESUMEN, nombre_pagina
+from pipeline import CARPETA_AREA_HTML, CARPETA_HTML
+from servidor import RevisionPostulantes, crear_app
+
+DOCUMENTOS = f"{CARPETA_HTML}/{CARPETA_BUSQUEDA}/documentos.js"
+FRAGMENTO_INEXISTENTE = f"{CARPETA_HTML}/{CARPETA_BUSQUEDA}/fragmento-zz-no-existe.js"
+AREA = 'Desarrollo Web'
+
+@pytest.fixture
+def revision(carpeta_trabajo):
+    return RevisionPostulantes(ARCHIVO_CSV_EJEMPLO, usar_cache=False)
+
+def test_fragmento_de_busqueda_inexistente_no_tiene_etag(revision):
+    assert revision.etag_de(DOCUMENTOS) is not None
+    assert revision.etag_de(FRAGMENTO_INEXISTENTE) is None
+    assert revision.pagina(FRAGMENTO_INEXISTENTE) is None
+
+def test_fragmento_inexistente_responde_404_aunque_se_mande_el_etag(revision):
+    pytest.importorskip('flask')
+    cliente = crear_app(revision).test_client()
+    etag = revision.etag_de(DOCUMENTOS)
+
+    assert cliente.get(f"/{DOCUMENTOS}", headers={'If-None-Match': f'"{etag}"'}).status_code == 304
+    assert cliente.get(f"/{FRAGMENTO_INEXISTENTE}", headers={'If-None-Match': f'"{etag}"'}).status_code == 404
+
+@pytest.fixture
+def revision_paginada(carpeta_trabajo):
+    # 24 postulantes en páginas de 5: el índice general tiene 5 páginas y el área más de una
+    return RevisionPostulantes(ARCHIVO_CSV_EJEMPLO, tamano_pagina=5, usar_cache=False)
+
+def test_pagina_fuera_del_indice_no_tiene_etag(revision_paginada):
+    assert revision_paginada.etag_de(f"{CARPETA_HTML}/{nombre_pagina(5)}") is not None
+    assert revision_paginada.etag_de(f"{CARPETA_HTML}/{nombre_pagina(6)}") is None
+    assert revision_paginada.etag_de(f"{CARPETA_HTML}/pagina-5.html") is None
+    assert revision_paginada.etag_de(f"{CARPETA_AREA_HTML}/{AREA}/{nombre_pagina(2)}") is not None
+    assert revision_paginada.etag_de(f"{CARPETA_AREA_HTML}/{AREA}/{nombre_pagina(7)}") is None
+    assert revision_paginada.etag_de(f"{CARPETA_AREA_HTML}/Área inexistente/{PAGINA_RESUMEN}") is None
+
+def test_indice_de_una_pagina_no_tiene_paginas(revision):
+    assert revision.etag_de(f"{CARPETA_HTML}/{PAGINA_RESUMEN}") is not None
+    assert revision.etag_de(f"{CARPETA_HTML}/{nombre_pagina(1)}") is None
+
+@pytest.mark.parametrize('carpeta', [CARPETA_HTML, f"{CARPETA_AREA_HTML}/{AREA}"])
+def test_pagina_fuera_del_indice_responde_404_aunque_se_mande_el_etag(revision_paginada, carpeta):
+    pytest.importorskip('flask')
+    cliente = crear_app(revision_paginada).test_client()
+    etag = revision_paginada.etag_de(f"{carpeta}/{nombre_pagina(1)}")
+
+    assert cliente.get(f"/{carpeta}/{nombre_pagina(2)}", headers={'If-None-Match': f'"{etag}"'}).status_code == 304
+    assert cliente.get(f"/{carpeta}/{nombre_pagina(999)}", headers={'If-None-Match': f'"{etag}"'}).status_code == 404
@@ -0,0 +1,101 @@
+import glob
+import os
+import sys
+import time
+
+from cache_postulantes import huella_archivo
+from instrumentacion import guardar_informe, reiniciar_informe
+from organizador import ARCHIVO_CSV
+from organizar_por_areas import MODO_DISTRIBUCION
+from paginacion import TAMANO_PAGINA
+from paralelo import TRABAJADORES
+
+# Modo vigilancia: revisa cada pocos segundos el CSV (o la exportación más reciente de
+# una carpeta) y, cuando cambia, vuelve a ejecutar el pipeline en este mismo proceso.
+# Los manifiestos hacen que solo se rendericen y escriban los postulantes cuyos datos
+# cambiaron; al no volver a arrancar Python ni importar pandas, una nueva respuesta
+# se ve en su página en menos de un segundo.
+
+INTERVALO_SONDEO = float(os.environ.get('PAM_INTERVALO_SONDEO', '2'))
+
+def exportacion_actual(ruta):
+    """CSV a procesar: ``ruta`` si es un archivo o el .csv modificado más recientemente si es una carpeta"""
+    if not os.path.isdir(ruta):
+        return ruta
+    exportaciones = glob.glob(os.path.join(ruta, '*.csv'))
+    if not exportaciones:
+        return None
+    return max(exportaciones, key=os.path.getmtime)
+
+def estado_exportacion(ruta):
+    """(archivo, tamaño, fecha de modificación) de la exportación actual, o None si no hay ninguna"""
+    archivo_csv = exportacion_actual(ruta)
+    if archivo_csv is None:
+        return None
+    try:
+        return (archivo_csv,) + huella_archivo(archivo_csv)
+    except FileNotFoundError:
+        return None
+
+def resumir_cambios(anteriores, perfiles):
+    """Cuenta los postulantes nuevos, actualizados y eliminados entre dos ejecuciones del pipeline"""
+    nuevos = [id_postulante for id_postulante in perfiles if id_postulante not in anteriores]
+    actualizados = [id_postulante for id_postulante, perfil in perfiles.items()
+                    if id_postulante in anteriores and perfil['hash_md'] != anteriores[id_postulante]]
+    eliminados = [id_postulante for id_postulante in anteriores if id_postulante not in perfiles]
+    return nuevos, actualizados, eliminados
+
+def vigilar(ruta=ARCHIVO_CSV, intervalo=INTERVALO_SONDEO, trabajadores=TRABAJADORES, con_md=True, con_excel=False,
+            modo_areas=MODO_DISTRIBUCION, tamano_pagina=TAMANO_PAGINA, max_reconstrucciones=None):
+    """Reconstruye las salidas cada vez que cambia la exportación, hasta Ctrl+C
+
+    ``ruta`` es el CSV o una carpeta de exportaciones (se usa la más reciente).
+    Un cambio se procesa cuando el archivo deja de crecer entre dos revisiones,
+    para no leer una descarga a medias. El Excel es lento de regenerar y por eso
+    solo se escribe con ``con_excel=True``. Cada reconstrucción guarda su propio
+    informe de ejecución. Devuelve cuántas reconstrucciones se hicieron.
+    """
+    from pipeline import ejecutar_pipeline
+
+    print(f"👀 Vigilando '{ruta}' (cada {intervalo:g} s, Ctrl+C para salir)")
+    procesado = None
+    candidato = None
+    hashes_anteriores = {}
+    reconstrucciones = 0
+
+    try:
+        while max_reconstrucciones is None or reconstrucciones < max_reconstrucciones:
+            estado = estado_exportacion(ruta)
+            if estado is None or estado == procesado:
+                candidato = None
+            elif estado != candidato and procesado is not None:
+                # Esperar a que el archivo quede igual en dos revisiones seguidas
+                candidato = estado
+            else:
+                inicio = time.perf_counter()
+                reiniciar_informe()
+                perfiles = ejecutar_pipeline(estado[0], incremental=True, trabajadores=trabajadores, con_md=con_md,
+                                             modo_areas=modo_areas, tamano_pagina=tamano_pagina, con_excel=con_excel)
+                guardar_informe()
+                procesado = estado
+                candidato = None
+                reconstrucciones += 1
+
+                if perfiles is not None:
+                    nuevos, actualizados, eliminados = resumir_cambios(hashes_anteriores, perfiles)
+                    hashes_anteriores = {id_postulante: perfil['hash_md'] for id_postulante, perfil in perfiles.items()}
+                    if reconstrucciones > 1:
+                        print(f"🔄 Nuevos: {len(nuevos)} | Actualizados: {len(actualizados)} | Eliminados: {len(eliminados)}")
+                        for id_postulante in nuevos + actualizados:
+                            print(f"   • {perfiles[id_postulante]['nombre']} ({id_postulante})")
+                print(f"⏱️ Salidas al día en {time.perf_counter() - inicio:.2f} s; esperando cambios...")
+                continue
+
+            time.sleep(intervalo)
+    except KeyboardInterrupt:
+        print("\n👋 Vigilancia detenida")
+
+    return reconstrucciones
+
+if __name__ == "__main__":
+    vigilar(sys.argv[1] if len(sys.argv) > 1 else ARCHIVO_CSV)